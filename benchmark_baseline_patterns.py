@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Baseline Patterns for the Debug Cleanup Benchmark
+The per-pattern regex lists the cleanup scripts carried before the rule file,
+copied as written, so the benchmark times the loop the engine replaced
+"""
+
+# cleanup_debug_logs.py: self.debug_patterns before the rule file
+BASIC_DEBUG_PATTERNS = [
+    # Basic print statements
+    r'^\s*print\s*\(\s*[\'"][^\'"]*debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
+
+    # Print statements with ?? or ? prefixes (common debug pattern)
+    r'^\s*print\s*\(\s*[\'"][^\'"]*\?\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
+
+    # Console.log statements
+    r'^\s*console\.log\s*\([^)]*\)\s*;?\s*$',
+
+    # Debug print statements with variables
+    r'^\s*print\s*\(\s*[\'"][^\'"]*debug[^\'"]*[\'"]\s*\+\s*[^)]*\)\s*;?\s*$',
+
+    # Specific debug patterns found in the codebase
+    r'^\s*print\s*\(\s*[\'"][^\'"]*REPORT SUBMISSION DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*CHECKOUT[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Loaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Saved[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cached[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cleared[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Routes preloaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Fetching[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Found[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug Auth Status[^\'"]*[\'"]\s*\)\s*;?\s*$',
+]
+
+
+# cleanup_debug_logs.py: self.keep_patterns before the rule file
+BASIC_KEEP_PATTERNS = [
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Exception[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Critical[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Fatal[^\'"]*[\'"]\s*\)\s*;?\s*$',
+]
+
+
+# cleanup_debug_logs_advanced.py: self.debug_patterns before the rule file
+ADVANCED_DEBUG_PATTERNS = [
+    # Basic debug prints
+    r'^\s*print\s*\(\s*[\'"][^\'"]*debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
+
+    # Common debug prefixes
+    r'^\s*print\s*\(\s*[\'"][^\'"]*\?\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
+
+    # Specific patterns from codebase
+    r'^\s*print\s*\(\s*[\'"][^\'"]*REPORT SUBMISSION DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*CHECKOUT[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Loaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Saved[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cached[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cleared[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Routes preloaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Fetching[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Found[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug Auth Status[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Pattern words[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Matching outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Exact match found[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Word boundary match[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Start match found[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Partial match found[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Search results[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Starting search operation[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Empty query[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Loading all outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Search operation completed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Search operation failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Loaded.*total outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading all outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Starting connectivity monitoring[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Connection restored[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Sync already in progress[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Starting offline sync[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Pending operations[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Step 1[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Step 2[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Step 3[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Offline sync completed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Remaining operations[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error during offline sync[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Sync process ended[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing.*pending session[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Synced session start[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Synced session end[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to sync session[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Deleted session operation[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing.*pending journey plans[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Synced journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to sync journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing.*pending reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cannot sync report[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Synced report for journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to sync report[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Force sync requested[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Online status[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Currently syncing[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Has pending operations[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cannot sync - device is offline[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Starting manual sync[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Journey plan created successfully[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Journey plan creation failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Server error detected[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Saved pending journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Journey plan update failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Server error detected during journey plan update[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Web file upload error[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*OfflineSyncIndicator[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Making dashboard API call[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Dashboard response status[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Dashboard response body[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Error in getDashboard[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Smart cache invalidation[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared cache for prefix[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared all cache[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Preloading data[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Preloading completed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Error preloading data[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Using cached data[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - No auth token found[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Making API call[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Headers[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Response status[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Response body[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Error in getDailyVisitTargets[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Using cached targets data[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Fetching targets[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cached targets data[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared targets cache[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared all cache for user[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading detailed stats[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading clients[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error preloading routes[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error fetching fresh data[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading from cache[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error refreshing client list[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to load routes[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error preloading products[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error initializing Hive service[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error reading cached products[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error caching products[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Background product update failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Cannot save report[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error saving report to Hive[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error syncing report[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading existing reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error parsing cached report[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading cached reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error caching reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading fresh reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error clearing caches[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error picking image[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error uploading image[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error submitting report[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*CHECKOUT ERROR[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Error during checkout[^\'"]*[\'"]\s*\)\s*;?\s*$',
+]
+
+
+# cleanup_debug_logs_advanced.py: self.keep_patterns before the rule file
+ADVANCED_KEEP_PATTERNS = [
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Exception[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Critical[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Fatal[^\'"]*[\'"]\s*\)\s*;?\s*$',
+    r'^\s*print\s*\(\s*[\'"][^\'"]*Unexpected[^\'"]*[\'"]\s*\)\s*;?\s*$',
+]
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Woosh Debug Log Cleanup Scripts
+Measures the cleaners against the real lib/ tree without modifying it, and the
+whole pipeline against synthetic corpora many times its size
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import cleanup_debug_logs
+from benchmark_baseline_patterns import (ADVANCED_DEBUG_PATTERNS, ADVANCED_KEEP_PATTERNS, BASIC_DEBUG_PATTERNS,
+                                         BASIC_KEEP_PATTERNS)
+from cleanup_debug_logs import DebugLogCleaner
+from cleanup_debug_logs_advanced import AdvancedDebugLogCleaner
+from debug_log_corpus import CorpusModel, generate_corpus
+from debug_log_files import count_lines, run_cli, walk_files
+
+try:
+    import resource
+except ImportError:
+    # Windows: no getrusage, so no peak RSS
+    resource = None
+
+CLEANER_CLASSES = [DebugLogCleaner, AdvancedDebugLogCleaner]
+
+# What the patterns benchmark times the engine against: each script's lists
+# as they were before the rule file, duplicates and all
+BASELINE_PATTERNS = {
+    DebugLogCleaner: (BASIC_DEBUG_PATTERNS, BASIC_KEEP_PATTERNS),
+    AdvancedDebugLogCleaner: (ADVANCED_DEBUG_PATTERNS, ADVANCED_KEEP_PATTERNS),
+}
+
+# Where pipeline results go by default, one JSON file per commit
+RESULTS_DIR = Path("benchmark_results")
+
+# Pipeline phases, in the order they run
+PHASES = ("discover", "backup", "match", "write")
+
+
+def load_dart_lines(root):
+    """Read every line of every .dart file under root"""
+    lines = []
+    for path in sorted(Path(root).rglob("*.dart")):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines.extend(f.readlines())
+    return lines
+
+
+def best_time(func, repeat):
+    """Return the fastest of several timed calls and the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def legacy_classify(debug_patterns, keep_patterns, lines):
+    """Classify lines with the original one-re.match-per-pattern loop over the baseline lists"""
+    results = []
+    for line in lines:
+        keep = False
+        for pattern in keep_patterns:
+            if re.match(pattern, line, re.IGNORECASE):
+                keep = True
+                break
+        rule = None
+        if not keep:
+            for index, pattern in enumerate(debug_patterns):
+                if re.match(pattern, line, re.IGNORECASE):
+                    rule = index
+                    break
+        results.append((keep, rule))
+    return results
+
+
+def engine_classify(cleaner, lines):
+    """Classify lines with the compiled pattern engines"""
+    keep_match = cleaner.keep_engine.matches
+    debug_match = cleaner.debug_engine.match
+    results = []
+    for line in lines:
+        keep = keep_match(line)
+        results.append((keep, None if keep else debug_match(line)))
+    return results
+
+
+def benchmark_patterns(args):
+    """Compare the per-pattern loop with the compiled engine"""
+    lines = load_dart_lines(args.root)
+    print(f"📄 Loaded {len(lines)} lines from {args.root}")
+
+    for cleaner_class in CLEANER_CLASSES:
+        cleaner = cleaner_class()
+        debug_patterns, keep_patterns = BASELINE_PATTERNS[cleaner_class]
+        legacy_time, legacy_results = best_time(
+            lambda: legacy_classify(debug_patterns, keep_patterns, lines), args.repeat)
+        engine_time, engine_results = best_time(lambda: engine_classify(cleaner, lines), args.repeat)
+
+        # The rule file dropped duplicate and subsumed patterns, so rule
+        # indexes differ; what has to agree is what happens to each line
+        mismatches = sum(1 for (keep_a, rule_a), (keep_b, rule_b) in zip(legacy_results, engine_results)
+                         if keep_a != keep_b or (rule_a is None) != (rule_b is None))
+        removed = sum(1 for keep, rule in engine_results if rule is not None)
+
+        print(f"\n🔬 {cleaner_class.__name__}")
+        print(f"   Baseline lists:   {len(debug_patterns)} debug / {len(keep_patterns)} keep patterns")
+        print(f"   Rule file:        {len(cleaner.debug_patterns)} debug / {len(cleaner.keep_patterns)} keep patterns")
+        print(f"   Per-pattern loop: {legacy_time * 1000:9.1f} ms "
+              f"({len(lines) / legacy_time:,.0f} lines/sec)")
+        print(f"   Compiled engine:  {engine_time * 1000:9.1f} ms "
+              f"({len(lines) / engine_time:,.0f} lines/sec)")
+        print(f"   Speedup: {legacy_time / engine_time:.1f}x")
+        print(f"   Debug lines matched: {removed}")
+        print(f"   Mismatches: {mismatches}")
+
+        if mismatches:
+            return 1
+    return 0
+
+
+def run_cleaner_on_copy(cleaner_class, root, work_dir, jobs):
+    """Clean a fresh copy of root with every .dart file targeted, return (seconds, report)"""
+    copy_root = Path(work_dir) / "lib"
+    if copy_root.exists():
+        shutil.rmtree(copy_root)
+    shutil.copytree(root, copy_root)
+
+    cleaner = cleaner_class(base_path=copy_root, jobs=jobs)
+    cleaner.target_files = sorted(str(p.relative_to(copy_root)) for p in copy_root.rglob("*.dart"))
+    cleaner.service_files = []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        cleaner.clean_all_files()
+        elapsed = time.perf_counter() - start
+
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        cleaner.generate_report()
+    return elapsed, report.getvalue()
+
+
+def benchmark_jobs(args):
+    """Record clean_all_files wall time across worker counts"""
+    status = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        for cleaner_class in CLEANER_CLASSES:
+            print(f"\n⚙️  {cleaner_class.__name__} over every .dart file in {args.root}")
+            baseline_report = None
+            baseline_time = None
+            for jobs in args.jobs:
+                times = []
+                for _ in range(args.repeat):
+                    elapsed, report = run_cleaner_on_copy(cleaner_class, args.root, work_dir, jobs)
+                    times.append(elapsed)
+                best = min(times)
+                if baseline_report is None:
+                    baseline_report, baseline_time = report, best
+                identical = report == baseline_report
+                print(f"   jobs={jobs:<2} {best * 1000:9.1f} ms  "
+                      f"speedup {baseline_time / best:4.1f}x  "
+                      f"report {'identical' if identical else 'DIFFERS'}")
+                if not identical:
+                    status = 1
+    return status
+
+
+def naive_discover(root, include_root):
+    """Collect .dart files the simple way: rglob the whole checkout, then filter"""
+    prefix = Path(root, include_root).parts
+    return sorted(p for p in Path(root).rglob("*.dart") if p.parts[:len(prefix)] == prefix)
+
+
+def benchmark_discover(args):
+    """Compare the pruning os.scandir walker with a recursive glob of the checkout"""
+    include = [f"{args.lib}/**/*.dart"]
+    walk_time, walked = best_time(lambda: list(walk_files(args.root, include)), args.repeat)
+    naive_time, naive = best_time(lambda: naive_discover(args.root, args.lib), args.repeat)
+
+    print(f"📂 Discovering {include[0]} under {args.root}")
+    print(f"   Path.rglob + filter: {naive_time * 1000:9.1f} ms ({len(naive)} files)")
+    print(f"   walk_files:          {walk_time * 1000:9.1f} ms ({len(walked)} files)")
+    print(f"   Speedup: {naive_time / walk_time:.1f}x")
+
+    missing = sorted(set(naive) - set(walked))
+    for path in missing:
+        print(f"   ⚠️  Only found by rglob: {path}")
+    return 0
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MiB (None where unknown)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+@contextlib.contextmanager
+def timed_writes(totals):
+    """Add the time the cleaners spend in atomic_write to totals['write']"""
+    original = cleanup_debug_logs.atomic_write
+
+    def timed(path, data):
+        start = time.perf_counter()
+        try:
+            original(path, data)
+        finally:
+            totals['write'] += time.perf_counter() - start
+
+    cleanup_debug_logs.atomic_write = timed
+    try:
+        yield
+    finally:
+        cleanup_debug_logs.atomic_write = original
+
+
+def run_pipeline(cleaner_name, corpus, work_dir):
+    """Clean a copy of a corpus phase by phase and return the measurements.
+
+    Runs in a process of its own (see pipeline_child) so peak RSS belongs to
+    this run alone. match is clean_file without its writes: reading, scanning
+    and building the cleaned text.
+    """
+    cleaner_class = {cls.__name__: cls for cls in CLEANER_CLASSES}[cleaner_name]
+    shutil.copytree(Path(corpus, "lib"), Path(work_dir, "lib"))
+    os.chdir(work_dir)
+
+    times = dict.fromkeys(PHASES, 0.0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaner = cleaner_class(base_path="lib")
+
+        start = time.perf_counter()
+        cleaner.discover_targets(["lib/**/*.dart"])
+        times['discover'] = time.perf_counter() - start
+        paths = [cleaner.base_path / f for f in cleaner.target_files]
+        lines = sum(count_lines(path.read_bytes()) for path in paths)
+
+        start = time.perf_counter()
+        cleaner.create_backup()
+        times['backup'] = time.perf_counter() - start
+
+        removed = 0
+        with timed_writes(times):
+            start = time.perf_counter()
+            for path in paths:
+                result = cleaner.clean_file(path)
+                if 'error' in result:
+                    raise RuntimeError(f"{path}: {result['error']}")
+                removed += result['removed_count']
+            times['match'] = time.perf_counter() - start - times['write']
+
+    total = sum(times.values())
+    return {
+        'cleaner': cleaner_name,
+        'files': len(paths),
+        'lines': lines,
+        'removed': removed,
+        'phases': {phase: round(seconds, 4) for phase, seconds in times.items()},
+        'total': round(total, 4),
+        'lines_per_sec': round(lines / total) if total else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def pipeline_child(args):
+    """Entry point of the per-run process: print one run's measurements as JSON"""
+    print(json.dumps(run_pipeline(args.cleaner, args.corpus, args.work_dir)))
+    return 0
+
+
+def git_commit():
+    """(commit hash, True if the tree has local changes), or (None, None) outside git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit.stdout.strip(), bool(status.stdout.strip())
+
+
+def benchmark_pipeline(args):
+    """Time discover/backup/match/write and peak RSS for both cleaners on 1x/10x/100x corpora"""
+    commit, dirty = git_commit()
+    model = CorpusModel.from_tree(args.model)
+    results = {
+        'commit': commit,
+        'dirty': dirty,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'seed': args.seed,
+        'runs': [],
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for scale in args.scales:
+            corpus = Path(temp_dir, f"corpus-{scale:g}x")
+            start = time.perf_counter()
+            stats = generate_corpus(corpus, scale, args.seed, model)
+            print(f"\n📚 {scale:g}x corpus: {stats['files']:,} files, {stats['lines']:,} lines, "
+                  f"{stats['prints']:,} prints, {stats['bytes'] / 1e6:.1f} MB "
+                  f"(generated in {time.perf_counter() - start:.1f}s)")
+
+            for cleaner_class in CLEANER_CLASSES:
+                runs = []
+                for attempt in range(args.repeat):
+                    work_dir = Path(temp_dir, f"work-{attempt}")
+                    child = subprocess.run(
+                        [sys.executable, __file__, "pipeline-child", cleaner_class.__name__,
+                         str(corpus), str(work_dir)],
+                        capture_output=True, text=True, cwd=Path(__file__).parent)
+                    shutil.rmtree(work_dir, ignore_errors=True)
+                    if child.returncode != 0:
+                        print(f"   ❌ {cleaner_class.__name__}: {child.stderr.strip()}")
+                        return 1
+                    runs.append(json.loads(child.stdout.splitlines()[-1]))
+
+                run = min(runs, key=lambda r: r['total'])
+                run['scale'] = scale
+                results['runs'].append(run)
+                phases = '  '.join(f"{phase} {run['phases'][phase]:7.2f}s" for phase in PHASES)
+                rss = f"{run['peak_rss_mb']:.0f} MiB" if run['peak_rss_mb'] is not None else "n/a"
+                print(f"   🔬 {cleaner_class.__name__:<24} {run['lines_per_sec']:>10,} lines/sec  "
+                      f"peak RSS {rss:>8}  {phases}  ({run['removed']:,} removed)")
+
+    output = Path(args.json) if args.json else RESULTS_DIR / f"{(commit or 'unknown')[:12]}{'-dirty' if dirty else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=1) + "\n", encoding='utf-8')
+    print(f"\n💾 Results written to {output}")
+    return 0
+
+
+def benchmark_compare(args):
+    """Compare two pipeline result files; exit 1 if the new one is slower or bigger beyond the threshold"""
+    old, new = (json.loads(Path(path).read_text(encoding='utf-8')) for path in (args.old, args.new))
+    old_runs = {(run['cleaner'], run['scale']): run for run in old['runs']}
+    print(f"📊 {(old.get('commit') or '?')[:12]} -> {(new.get('commit') or '?')[:12]}")
+
+    status = 0
+    for run in new['runs']:
+        key = (run['cleaner'], run['scale'])
+        before = old_runs.get(key)
+        if before is None:
+            continue
+        print(f"\n🔬 {run['cleaner']} at {run['scale']:g}x")
+        metrics = [('total', before['total'], run['total'])]
+        metrics += [(phase, before['phases'][phase], run['phases'][phase]) for phase in PHASES]
+        metrics.append(('peak RSS', before['peak_rss_mb'], run['peak_rss_mb']))
+        for name, was, now in metrics:
+            if not was or now is None:
+                continue
+            change = (now - was) / was * 100
+            # Phases of a few milliseconds are mostly noise; only flag the totals and RSS
+            flagged = change > args.threshold and name in ('total', 'peak RSS')
+            print(f"   {name:<9} {was:10.3f} -> {now:10.3f}  {change:+6.1f}%{'  ⚠️' if flagged else ''}")
+            if flagged:
+                status = 1
+        if before['removed'] != run['removed']:
+            print(f"   ⚠️  Removed {before['removed']:,} statements before, {run['removed']:,} now")
+            status = 1
+    return status
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark the debug log cleanup scripts")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    patterns = subparsers.add_parser("patterns", help="per-pattern loop vs compiled engine")
+    patterns.add_argument("--root", default="lib", help="directory of Dart sources (default: lib)")
+    patterns.add_argument("--repeat", type=int, default=3, help="timed runs, best is kept")
+    patterns.set_defaults(func=benchmark_patterns)
+
+    jobs = subparsers.add_parser("jobs", help="clean_all_files wall time at several --jobs values")
+    jobs.add_argument("--root", default="lib", help="directory of Dart sources (default: lib)")
+    jobs.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8],
+                      help="worker counts to measure (default: 1 2 4 8)")
+    jobs.add_argument("--repeat", type=int, default=3, help="timed runs, best is kept")
+    jobs.set_defaults(func=benchmark_jobs)
+
+    discover = subparsers.add_parser("discover", help="os.scandir walker vs Path.rglob")
+    discover.add_argument("--root", default=".", help="project checkout to walk (default: .)")
+    discover.add_argument("--lib", default="lib", help="source directory inside it (default: lib)")
+    discover.add_argument("--repeat", type=int, default=5, help="timed runs, best is kept")
+    discover.set_defaults(func=benchmark_discover)
+
+    pipeline = subparsers.add_parser("pipeline", help="per-phase time, lines/sec and peak RSS on synthetic "
+                                                      "corpora, saved as JSON")
+    pipeline.add_argument("--scales", type=float, nargs="+", default=[1, 10, 100],
+                          help="corpus sizes as multiples of lib/ (default: 1 10 100)")
+    pipeline.add_argument("--repeat", type=int, default=1, help="runs per cleaner and scale, best is kept")
+    pipeline.add_argument("--seed", type=int, default=0, help="corpus random seed (default: 0)")
+    pipeline.add_argument("--model", default=".", help="project whose lib/ the corpus imitates (default: .)")
+    pipeline.add_argument("--json", metavar="FILE",
+                          help=f"where to save the results (default: {RESULTS_DIR}/<commit>.json)")
+    pipeline.set_defaults(func=benchmark_pipeline)
+
+    compare = subparsers.add_parser("compare", help="compare two pipeline result files")
+    compare.add_argument("old", help="baseline results JSON")
+    compare.add_argument("new", help="results JSON to check")
+    compare.add_argument("--threshold", type=float, default=10,
+                         help="percent slowdown or RSS growth that fails the comparison (default: 10)")
+    compare.set_defaults(func=benchmark_compare)
+
+    # Internal: one pipeline run, in a fresh process so its peak RSS is its own
+    child = subparsers.add_parser("pipeline-child")
+    child.add_argument("cleaner")
+    child.add_argument("corpus")
+    child.add_argument("work_dir")
+    child.set_defaults(func=pipeline_child)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_cli(main))
@@ -4,76 +4,156 @@ Debug Log Cleanup Script for Woosh Journey Plan Files
 Removes debug print statements and console.log calls to improve performance
 """
 
+import argparse
+import bisect
+import contextlib
+import difflib
+import hashlib
+import io
+import json
 import os
 import re
-import shutil
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
+
+from dart_scanner import add_import, is_part_file, is_string_literal, iter_calls, may_contain_calls
+from dart_transforms import ImportRewrite, PrintRemoval, TransformPipeline
+from debug_log_backup import BackupStore
+from debug_log_dead_code import find_log_only_code
+from debug_log_files import (DEFAULT_INCLUDE, atomic_write, compile_globs, count_lines, run_cli, static_prefix,
+                             walk_files)
+from debug_log_findings import Finding, FindingError
+from debug_log_git import GitError, added_lines, read_index
+from debug_log_hotspots import find_hotspots, format_hotspots, rank_hotspots
+from debug_log_metrics import CleanupMetrics
+from debug_log_rules import DEFAULT_CATEGORY, RULES_FILE, RuleSet, cache_path
+from debug_log_watch import debounced, open_watcher
+
+# Where rewritten calls get kDebugMode and debugPrint from; importing it next
+# to a Flutter library that re-exports it trips the unnecessary_import lint
+FOUNDATION = 'package:flutter/foundation.dart'
+FOUNDATION_NAMES = ('kDebugMode', 'debugPrint')
+FOUNDATION_EXPORTERS = (
+    'package:flutter/material.dart',
+    'package:flutter/widgets.dart',
+    'package:flutter/cupertino.dart',
+)
+
+# Files handed to a worker at a time when their number isn't known up front
+FILES_PER_TASK = 8
+
+# Cleaner instance shared by the functions running inside pool workers
+_worker_cleaner = None
+
+
+def _init_worker(cleaner):
+    """Install the cleaner once per worker process"""
+    global _worker_cleaner
+    _worker_cleaner = cleaner
+
+
+def _run_in_worker(method_name, file_paths):
+    """Run a per-file cleaner method (clean_file, preview_file) over a few files inside a pool worker"""
+    method = getattr(_worker_cleaner, method_name)
+    return [method(file_path) for file_path in file_paths]
+
 
 class DebugLogCleaner:
-    def __init__(self, base_path="lib/pages/journeyplan"):
+    tool_name = "Debug Log Cleanup"
+    report_title = "Cleanup Report"
+    completed_message = "Cleanup completed successfully!"
+    rule_profile = "basic"
+
+    def __init__(self, base_path="lib/pages/journeyplan", jobs=1, incremental=False,
+                 dry_run=False, output_format="diff", rewrite=False, rules_file=None,
+                 hotspots=False, hotspots_json=None, prune_locals=True, metrics_json=None,
+                 metrics_prom=None, rename_packages=(), remove_prints=True, leaks="report",
+                 rules_cache=None, read_only=False):
         self.base_path = Path(base_path)
         self.backup_dir = Path("backup_debug_logs")
+        self.cache_file = Path(".debug_log_cache.json")
+        self.jobs = jobs
+        self.incremental = incremental
+        self.dry_run = dry_run
+        self.output_format = output_format
+        self.rewrite = rewrite
+        self.hotspots = hotspots or hotspots_json is not None
+        self.hotspots_json = hotspots_json
+        self.prune_locals = prune_locals
+        self.backup_run = None
         self.cleaned_files = []
+        self.unchanged_files = []
         self.skipped_files = []
         self.error_files = []
+        self.include = None
+        self.exclude = ()
+        self.written = {}
         
-        # Patterns to match debug logs
-        self.debug_patterns = [
-            # Basic print statements
-            r'^\s*print\s*\(\s*[\'"][^\'"]*debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            
-            # Print statements with ?? or ? prefixes (common debug pattern)
-            r'^\s*print\s*\(\s*[\'"][^\'"]*\?\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            
-            # Console.log statements
-            r'^\s*console\.log\s*\([^)]*\)\s*;?\s*$',
-            
-            # Debug print statements with variables
-            r'^\s*print\s*\(\s*[\'"][^\'"]*debug[^\'"]*[\'"]\s*\+\s*[^)]*\)\s*;?\s*$',
-            
-            # Specific debug patterns found in the codebase
-            r'^\s*print\s*\(\s*[\'"][^\'"]*REPORT SUBMISSION DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*CHECKOUT[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Loaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Saved[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cached[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cleared[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Routes preloaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Fetching[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Found[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug Auth Status[^\'"]*[\'"]\s*\)\s*;?\s*$',
-        ]
+        # Rules come from the shared rule file; see debug_log_rules.toml. A
+        # read-only run (dry run, checks) may use the rules cache but never writes it
+        self.read_only = read_only or dry_run
+        self.rule_set = RuleSet.load(RULES_FILE if rules_file is None else rules_file, rules_cache,
+                                     write_cache=not self.read_only)
+        rules, _ = self.rule_set.profile(self.rule_profile)
+        self.debug_rules = [rule for rule in rules if rule.action in ('remove', 'rewrite')]
+        self.keep_rules = [rule for rule in rules if rule.action == 'keep']
         
-        # Patterns to keep (important error handling)
-        self.keep_patterns = [
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Exception[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Critical[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Fatal[^\'"]*[\'"]\s*\)\s*;?\s*$',
-        ]
+        # Flag rules spot prints leaking secrets, checked on the calls the
+        # other rules leave in place; with leaks="remove" they go first among
+        # the debug rules and win over the keep rules too
+        self.leak_mode = leaks
+        self.leak_rules = [rule for rule in rules if rule.action == 'flag']
+        self.leak_ids = {rule.id for rule in self.leak_rules}
+        if leaks == 'remove':
+            self.debug_rules = self.leak_rules + self.debug_rules
+        self.debug_patterns = [rule.pattern for rule in self.debug_rules]
+        self.keep_patterns = [rule.pattern for rule in self.keep_rules]
+        
+        # Per-rule and per-file metrics, only collected when asked for
+        self.metrics_json = metrics_json
+        self.metrics_prom = metrics_prom
+        self.metrics = None
+        if metrics_json or metrics_prom:
+            # Every active rule; flag rules are among the debug rules when they remove
+            flags = [] if leaks == 'remove' else self.leak_rules
+            self.metrics = CleanupMetrics(self.rule_profile, self.keep_rules + self.debug_rules + flags)
+        
+        # Everything done to a file happens in one read/transform/write pass:
+        # package renames first (they keep line numbers), then print removal
+        self.rename_packages = [tuple(pair) for pair in rename_packages]
+        self.remove_prints = remove_prints
+        transforms = [ImportRewrite(old, new) for old, new in self.rename_packages]
+        if remove_prints:
+            transforms.append(PrintRemoval(self))
+        self.pipeline = TransformPipeline(transforms)
+        
+        # Tags for rewritten calls matched by a generic rule, picked by the
+        # first category with a keyword in the message
+        self.log_categories = {name: category.keywords
+                               for name, category in self.rule_set.categories.items() if category.keywords}
+        self.default_log_category = DEFAULT_CATEGORY
         
         # Files to process
         self.target_files = [
-            "createJourneyplan.dart",
+            "create_journey_plan.dart",
             "journeyplans_page.dart", 
             "journeyview.dart",
-            "reports/reportMain_page.dart",
+            "reports/report_main_page.dart",
             "reports/pages/product_report_page.dart",
             "reports/pages/visibility_report_page.dart",
             "reports/pages/feedback_report_page.dart",
-            "reports/pages/product_sample_page.dart"
+            "reports/pages/product_sample.dart"
         ]
         
         # Related service files
         self.service_files = [
             "../services/enhanced_journey_plan_service.dart",
-            "../services/jouneyplan_service.dart",
+            "../services/journeyplan/jouneyplan_service.dart",
             "../services/offline_sync_service.dart",
             "../services/hive/product_hive_service.dart",
             "../services/hive/client_hive_service.dart",
@@ -81,81 +161,431 @@ class DebugLogCleaner:
             "../services/hive/route_hive_service.dart",
         ]
 
+    def discover_targets(self, include=DEFAULT_INCLUDE, exclude=()):
+        """Replace the hard-coded file lists with every file matching the globs"""
+        self.include = list(include)
+        self.exclude = list(exclude)
+        self.target_files = [os.path.relpath(path, self.base_path)
+                             for path in walk_files('.', include, exclude)]
+        self.service_files = []
+
     def create_backup(self):
-        """Create backup of original files"""
-        if self.backup_dir.exists():
-            shutil.rmtree(self.backup_dir)
-        
-        self.backup_dir.mkdir(parents=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
+        """Store the current version of every target file in the backup store"""
+        store = BackupStore(self.backup_dir)
         print(f"📁 Creating backup in: {self.backup_dir}")
         
-        # Backup target files
-        for file_path in self.target_files:
+        # Files unchanged since the last incremental run won't be touched
+        paths = []
+        for file_path in self.target_files + self.service_files:
             full_path = self.base_path / file_path
-            if full_path.exists():
-                backup_path = self.backup_dir / f"{timestamp}_{file_path}"
-                shutil.copy2(full_path, backup_path)
-                print(f"   ✅ Backed up: {file_path}")
+            if full_path.exists() and not self.is_unchanged(full_path):
+                paths.append(full_path)
         
-        # Backup service files
-        for file_path in self.service_files:
-            full_path = self.base_path / file_path
-            if full_path.exists():
-                backup_path = self.backup_dir / f"{timestamp}_{file_path.replace('../', '')}"
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(full_path, backup_path)
-                print(f"   ✅ Backed up: {file_path}")
+        def report_file(path, created):
+            if created:
+                print(f"   ✅ Backed up: {path}")
+        
+        if not paths:
+            print("   💾 Nothing to back up: no file changed since the last run")
+            return
+        self.backup_run, new_blobs = store.backup(paths, on_file=report_file)
+        print(f"   💾 Run {self.backup_run}: {len(paths)} files, {new_blobs} new")
+
+    def discard_unused_backup(self):
+        """Drop the backup run again if the cleanup didn't rewrite any file"""
+        if self.backup_run is None or any(any(result['changes'].values()) for result in self.cleaned_files):
+            return
+        BackupStore(self.backup_dir).discard(self.backup_run)
+        print(f"   🗑️  No file was rewritten; dropped backup run {self.backup_run}")
+        self.backup_run = None
+
+    @cached_property
+    def debug_engine(self):
+        """Debug patterns compiled once into a single matcher"""
+        return self.rule_set.engine(self.debug_patterns)
+
+    @cached_property
+    def leak_engine(self):
+        """Compiled matcher for the flag (leak) rules"""
+        return self.rule_set.engine([rule.pattern for rule in self.leak_rules])
+
+    @cached_property
+    def keep_engine(self):
+        """Keep patterns compiled once into a single matcher"""
+        return self.rule_set.engine(self.keep_patterns)
+
+    @cached_property
+    def cache(self):
+        """File states recorded by the previous incremental run, keyed by path"""
+        return self.load_cache() if self.incremental else {}
+
+    def rules_fingerprint(self):
+        """Hash of the active pattern sets, so editing a rule invalidates the cache"""
+        rules = json.dumps([[rule.to_dict() for rule in self.debug_rules + self.keep_rules + self.leak_rules],
+                            self.rewrite, self.log_categories, self.rename_packages, self.remove_prints,
+                            self.leak_mode])
+        return hashlib.sha256(rules.encode('utf-8')).hexdigest()
+
+    def load_cache(self):
+        """Load the incremental cache, ignoring it if the rules have changed"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('rules') != self.rules_fingerprint():
+            return {}
+        return data.get('files', {})
 
-    def should_keep_line(self, line):
+    def save_cache(self):
+        """Write the incremental cache for the next run"""
+        data = {'rules': self.rules_fingerprint(), 'files': self.cache}
+        atomic_write(self.cache_file, json.dumps(data, indent=1, sort_keys=True).encode('utf-8'))
+
+    def is_unchanged(self, file_path):
+        """Check size and mtime against the cache without reading the file"""
+        cached = self.cache.get(str(file_path))
+        if not cached:
+            return False
+        stat = os.stat(file_path)
+        return cached[:2] == [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def file_state(file_path, data):
+        """Cache entry for a file: [size, mtime_ns, sha256 of its bytes]"""
+        stat = os.stat(file_path)
+        digest = hashlib.sha256(data).hexdigest()
+        return [stat.st_size, stat.st_mtime_ns, digest]
+
+    @staticmethod
+    def first_rule(engine, rules, line, file_path=None):
+        """Index of the first rule matching the line whose path scope includes the file"""
+        index = engine.match(line)
+        if index is None or rules[index].applies_to(file_path):
+            return index
+        # Rare: the first hit is scoped to other files, so try the rest one by one
+        for later in range(index + 1, len(rules)):
+            if rules[later].applies_to(file_path) and re.match(rules[later].pattern, line, engine.flags):
+                return later
+        return None
+
+    def should_keep_line(self, line, file_path=None):
         """Check if line should be kept (important error handling)"""
-        for pattern in self.keep_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-        return False
+        return self.first_rule(self.keep_engine, self.keep_rules, line, file_path) is not None
 
     def is_debug_line(self, line):
         """Check if line is a debug statement"""
-        for pattern in self.debug_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-        return False
+        return self.debug_engine.matches(line)
+
+    def match_debug_rule(self, line):
+        """Return the debug pattern that matches the line, or None"""
+        index = self.debug_engine.match(line)
+        return None if index is None else self.debug_patterns[index]
+
+    def rewrites(self, rule):
+        """Check if calls matched by a debug rule are guarded rather than deleted"""
+        action = self.debug_rules[rule].action
+        # A guarded leak would still leak in debug builds
+        return action != 'flag' and (self.rewrite or action == 'rewrite')
+
+    def find_debug_calls(self, content, file_path=None, leaks=None):
+        """Yield (call, debug rule index) for the print statements the rules remove or rewrite.
+
+        Pass a list as leaks to collect (call, leak rule index) for every
+        call that matches a flag rule, removed or not; it is complete once
+        the generator is exhausted.
+        """
+        # Rewritten calls need an import, which a part file can't declare
+        part_file = is_part_file(content)
+        metrics = self.metrics
+        check_leaks = bool(self.leak_rules) and (
+            leaks is not None or metrics is not None or self.leak_mode == 'remove')
+        for call in iter_calls(content):
+            rule = None
+            # Leak rules look at the interpolated values; the others only at
+            # the message text, so a ?? inside ${...} is no question mark
+            leak = None
+            if check_leaks:
+                leak = self.first_rule(self.leak_engine, self.leak_rules, call.canonical, file_path)
+            # Calls that aren't whole statements (if (x) print(...), => print(...))
+            # can't be deleted without changing the surrounding code
+            if call.statement:
+                keep = self.first_rule(self.keep_engine, self.keep_rules, call.message, file_path)
+                if self.leak_mode == 'remove' and leak is not None:
+                    # Leak rules lead debug_rules, so their indexes are the same in both lists
+                    rule = leak
+                elif keep is None:
+                    rule = self.first_rule(self.debug_engine, self.debug_rules, call.message, file_path)
+                if metrics is not None:
+                    if rule is not None:
+                        metrics.candidate(call, self.debug_rules[rule])
+                    else:
+                        metrics.candidate(call, None if keep is None else self.keep_rules[keep])
+                    if leak is not None and self.leak_mode != 'remove':
+                        metrics.flagged(self.leak_rules[leak])
+                if rule is not None and self.rewrites(rule) and (part_file or call.name != 'print'):
+                    rule = None
+            if leak is not None and leaks is not None:
+                leaks.append((call, leak))
+            if rule is not None:
+                yield call, rule
+
+    def file_metrics(self, result, timings, file_path):
+        """Add a file's timings and rule counters to its result when metrics are on"""
+        if self.metrics is not None:
+            self.metrics.time_rules(file_path)
+            result['timings'] = timings
+            result['rule_metrics'] = self.metrics.drain()
+        return result
 
-    def clean_file(self, file_path):
-        """Clean debug logs from a single file"""
+    def collect_metrics(self, result):
+        """Add a per-file result's timings and rule counters to the run's metrics"""
+        if self.metrics is not None and 'timings' in result:
+            self.metrics.merge(result['rule_metrics'])
+            self.metrics.add_file(result['file'], result['timings'], result['removed_count'])
+
+    def timed_phase(self, name):
+        """Time a phase of the run into the metrics, if they are being collected"""
+        return contextlib.nullcontext() if self.metrics is None else self.metrics.phase(name)
+
+    def write_metrics(self, stream=None):
+        """Write the run's metrics to the --metrics-json/--metrics-prom files"""
+        if self.metrics is None:
+            return
+        self.metrics.write(self.metrics_json, self.metrics_prom)
+        fired = sum(1 for record in self.metrics.rule_records() if record['hits'])
+        for path in (self.metrics_json, self.metrics_prom):
+            if path:
+                print(f"📏 Metrics written to {path} ({fired} of {len(self.metrics.rules)} rules fired)",
+                      file=stream)
+
+    def clean_source(self, content, removals=None, file_path=None, findings=None):
+        """Return the source with its debug print statements removed or guarded, and how many changed.
+
+        Locals and Stopwatches that only the removed statements read go with
+        them (unless prune_locals is off); pass a list as findings to collect
+        those and the spots left for review.
+        """
+        if removals is None:
+            removals = self.find_debug_calls(content, file_path)
+        edits = []
+        guarded = False
+        for call, rule in removals:
+            if self.rewrites(rule):
+                edits.append((call.start, call.end, self.guarded_log_call(content, call, rule)))
+                guarded = True
+            else:
+                start, end = call.line_span(content)
+                edits.append((start, end, ''))
+        changed_count = len(edits)
+        
+        spans = [(start, end) for start, end, replacement in edits if not replacement]
+        if self.prune_locals and spans:
+            extra, found = find_log_only_code(content, spans)
+            edits.extend((start, end, '') for start, end in extra)
+            edits.sort(key=lambda edit: edit[0])
+            if findings is not None:
+                findings.extend(found)
+        
+        pieces = []
+        position = 0
+        for start, end, replacement in edits:
+            pieces.append(content[position:max(start, position)])
+            pieces.append(replacement)
+            position = max(end, position)
+        pieces.append(content[position:])
+        cleaned = ''.join(pieces)
+        if guarded:
+            cleaned = add_import(cleaned, FOUNDATION, FOUNDATION_NAMES, FOUNDATION_EXPORTERS)
+        return cleaned, changed_count
+
+    def log_category(self, text, rule=None):
+        """Category tag for a debug message: the rule's own category, or for generic
+        rules the first category with a keyword in the message"""
+        category = self.debug_rules[rule].category if rule is not None else self.default_log_category
+        if category != self.default_log_category:
+            return category
+        lowered = text.lower()
+        for name, keywords in self.log_categories.items():
+            if any(keyword in lowered for keyword in keywords):
+                return name
+        return category
+
+    def guarded_log_call(self, content, call, rule=None):
+        """Dart statement replacing a print call: a debugPrint compiled out of release builds"""
+        open_paren = content.index('(', call.start)
+        close_paren = content.rindex(')', open_paren, call.end)
+        argument = content[open_paren + 1:close_paren].strip().rstrip(',').rstrip()
+        tag = f"[{self.log_category(call.message, rule)}] "
+        if is_string_literal(argument):
+            # Adjacent literals are joined by the compiler, so the message stays verbatim
+            message = f"'{tag}' {argument}"
+        elif '\n' in argument:
+            message = f"'{tag}' + ({argument}).toString()"
+        else:
+            message = f"'{tag}${{{argument}}}'"
+        return f"if (kDebugMode) debugPrint({message});"
+
+    def clean_file(self, file_path, before_write=None):
+        """Clean debug logs from a single file; before_write(file_path) runs just before it is rewritten"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            original_lines = len(lines)
-            cleaned_lines = []
-            removed_count = 0
-            
-            for line in lines:
-                # Keep important error handling lines
-                if self.should_keep_line(line):
-                    cleaned_lines.append(line)
-                    continue
-                
-                # Remove debug lines
-                if self.is_debug_line(line):
-                    removed_count += 1
-                    continue
-                
-                # Keep all other lines
-                cleaned_lines.append(line)
-            
-            # Write cleaned content back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(cleaned_lines)
+            if self.incremental and self.is_unchanged(file_path):
+                return {'file': str(file_path), 'unchanged': True, 'state': self.cache[str(file_path)]}
             
-            return {
+            # One bulk read; the scanner then works on offsets in a single string
+            # instead of a list of lines
+            clock = time.perf_counter
+            start = clock()
+            data = file_path.read_bytes()
+            timings = {'read': clock() - start}
+            
+            # Touched but not edited since it was last cleaned
+            cached = self.cache.get(str(file_path))
+            if cached:
+                state = self.file_state(file_path, data)
+                if state[2] == cached[2]:
+                    return {'file': str(file_path), 'unchanged': True, 'state': state}
+            
+            original_lines = count_lines(data)
+            findings = []
+            start = clock()
+            cleaned_content, changes = self.pipeline.apply(data, file_path, findings)
+            timings['match'] = clock() - start
+            
+            # Write cleaned content back, leaving untouched files alone so their
+            # mtime doesn't trigger Flutter rebuilds
+            if any(changes.values()) and before_write is not None:
+                before_write(file_path)
+            start = clock()
+            if any(changes.values()):
+                data = cleaned_content.encode('utf-8')
+                atomic_write(file_path, data)
+            timings['write'] = clock() - start
+            
+            return self.file_metrics({
                 'file': str(file_path),
                 'original_lines': original_lines,
-                'cleaned_lines': len(cleaned_lines),
-                'removed_count': removed_count
+                'cleaned_lines': count_lines(data),
+                'removed_count': len(changes.get('prints', ())),
+                'changes': {name: len(found) for name, found in changes.items()},
+                'findings': findings,
+                'state': self.file_state(file_path, data) if self.incremental else None
+            }, timings, file_path)
+            
+        except Exception as e:
+            return {
+                'file': str(file_path),
+                'error': str(e)
+            }
+
+    def preview_file(self, file_path):
+        """Describe what clean_file would change, as one diff for all transforms, without touching the filesystem"""
+        try:
+            if self.incremental and self.is_unchanged(file_path):
+                return {'file': str(file_path), 'output': '', 'removed_count': 0, 'changes': {}}
+            
+            clock = time.perf_counter
+            start = clock()
+            data = file_path.read_bytes()
+            timings = {'read': clock() - start}
+            
+            start = clock()
+            findings = []
+            cleaned_content, changes = self.pipeline.apply(data, file_path, findings)
+            timings['match'] = clock() - start
+            records = [record for name in self.pipeline.names for record in changes[name]]
+            if self.output_format == 'jsonl':
+                records.extend({'file': str(file_path), **finding} for finding in findings)
+                output = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+            elif not records:
+                output = ''
+            else:
+                output = ''.join(difflib.unified_diff(
+                    io.StringIO(data.decode('utf-8')).readlines(), io.StringIO(cleaned_content).readlines(),
+                    fromfile=f"a/{file_path}", tofile=f"b/{file_path}"))
+            
+            return self.file_metrics({'file': str(file_path), 'output': output,
+                                      'removed_count': len(changes.get('prints', ())),
+                                      'changes': {name: len(found) for name, found in changes.items()},
+                                      'findings': findings}, timings, file_path)
+            
+        except Exception as e:
+            return {
+                'file': str(file_path),
+                'error': str(e)
+            }
+
+    def profile_file(self, file_path):
+        """Score every print() in a file by how often it runs and what its message costs"""
+        try:
+            data = file_path.read_bytes()
+            if not may_contain_calls(data):
+                return {'file': str(file_path), 'hotspots': []}
+            
+            content = data.decode('utf-8')
+            # Name the rule that would remove each call, so the report says what to clean
+            rules = {call.start: self.debug_rules[index].id
+                     for call, index in self.find_debug_calls(content, file_path)}
+            records = find_hotspots(content, Path(file_path).as_posix(), rules)
+            return {'file': str(file_path), 'hotspots': records}
+            
+        except Exception as e:
+            return {
+                'file': str(file_path),
+                'error': str(e)
             }
+
+    def removal_findings(self, file_path, content, removals, leaks=()):
+        """Yield a Finding per removed statement and per leak left in place, in file order.
+
+        A removed statement that leaks is reported under its leak rule.
+        """
+        leaked = {call.start: (call, self.leak_rules[index]) for call, index in leaks}
+        decided = []
+        for call, index in removals:
+            _, rule = leaked.pop(call.start, (call, self.debug_rules[index]))
+            decided.append((call, rule, 'rewrite' if self.rewrites(index) else 'remove'))
+        if leaked:
+            decided.extend((call, rule, 'report') for call, rule in leaked.values())
+            decided.sort(key=lambda item: item[0].start)
+        line = 1
+        position = 0
+        for call, rule, action in decided:
+            line += content.count('\n', position, call.start)
+            position = call.start
+            column = call.start - content.rfind('\n', 0, call.start)
+            yield Finding(str(file_path), line, column, line + content.count('\n', call.start, call.end),
+                          call.start, call.end, rule.id, rule.category,
+                          self.rule_set.categories[rule.category].severity, action, content[call.start:call.end])
+
+    def leak_records(self, content, leaks, removals=()):
+        """One finding dict per print leaking sensitive data that stays, for the report and --format jsonl"""
+        removed = {call.start for call, _ in removals}
+        left = [(call, index) for call, index in leaks if call.start not in removed]
+        records = []
+        for finding in self.removal_findings(None, content, (), left):
+            records.append({'line': finding.line, 'kind': 'leak', 'name': finding.rule,
+                            'action': 'report', 'severity': finding.severity, 'text': finding.text})
+        return records
+
+    def removal_records(self, file_path, content, removals, leaks=()):
+        """Yield one JSON-ready dict per removed statement"""
+        for finding in self.removal_findings(file_path, content, removals, leaks):
+            if finding.action != 'report':
+                yield finding.to_dict()
+
+    def find_in_file(self, file_path, data=None):
+        """The Findings for one file, or for data standing in for its content, without changing it"""
+        try:
+            if data is None:
+                data = file_path.read_bytes()
+            if not may_contain_calls(data):
+                return {'file': str(file_path), 'findings': []}
+            content = data.decode('utf-8')
+            leaks = []
+            removals = list(self.find_debug_calls(content, file_path, leaks))
+            return {'file': str(file_path),
+                    'findings': list(self.removal_findings(file_path, content, removals, leaks))}
             
         except Exception as e:
             return {
@@ -163,47 +593,259 @@ class DebugLogCleaner:
                 'error': str(e)
             }
 
+    @staticmethod
+    def checked_results(results, errors=None):
+        """Pass per-file results on, moving those of files that failed into errors.
+
+        Without an errors list the first failure raises FindingError.
+        """
+        for result in results:
+            if 'error' in result:
+                if errors is None:
+                    raise FindingError(f"{result['file']}: {result['error']}")
+                errors.append(result)
+                continue
+            yield result
+
+    def iter_results(self, method_name, paths, errors=None):
+        """Yield a per-file method's result for every file in paths, in order.
+
+        Directories are searched for .dart files as the results stream, so
+        only the files in flight are held. Failures go to checked_results.
+        """
+        files = (found for path in paths for found in
+                 (walk_files(path, ('**/*.dart',)) if Path(path).is_dir() else (Path(path),)))
+        return self.checked_results(self.map_files(method_name, files), errors)
+
+    def iter_findings(self, paths, errors=None, contents=None):
+        """Yield a Finding for every debug statement the rules match in paths, file by file.
+
+        Directories are searched for .dart files. Only one file's findings
+        are held at a time (a few files per worker with jobs > 1). Files that
+        can't be read are appended to errors as {'file', 'error'} dicts if a
+        list is given, and otherwise raise FindingError. contents maps each
+        path to the bytes to scan instead of the file (e.g. staged versions).
+        """
+        if contents is None:
+            results = self.iter_results('find_in_file', paths, errors)
+        else:
+            results = self.checked_results(
+                (self.find_in_file(Path(path), contents[path]) for path in paths), errors)
+        for result in results:
+            yield from result['findings']
+
+    def map_files(self, method_name, paths):
+        """Yield per-file method results in input order, using a process pool when jobs > 1.
+
+        paths may be a generator. Only a window of a few tasks per worker is
+        submitted at a time, so results stream while the files are still
+        being found and an early stop leaves little work to cancel.
+        """
+        if self.jobs <= 1:
+            yield from map(getattr(self, method_name), paths)
+            return
+        
+        # Hand each worker a handful of files at a time to keep IPC overhead low
+        if isinstance(paths, list):
+            chunksize = max(1, len(paths) // (self.jobs * 4))
+        else:
+            chunksize = FILES_PER_TASK
+        paths = iter(paths)
+        chunks = iter(lambda: list(islice(paths, chunksize)), [])
+        window = self.jobs * 2
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            pending = deque(executor.submit(_run_in_worker, method_name, chunk)
+                            for chunk in islice(chunks, window))
+            try:
+                while pending:
+                    wait([future for future in pending if not future.done()], return_when=FIRST_COMPLETED)
+                    while pending and pending[0].done():
+                        yield from pending.popleft().result()
+                    pending.extend(executor.submit(_run_in_worker, method_name, chunk)
+                                   for chunk in islice(chunks, window - len(pending)))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def map_clean_file(self, paths):
+        """Yield clean_file results in input order"""
+        return self.map_files('clean_file', paths)
+
+    def preview_all_files(self):
+        """Stream the would-be removals to stdout; return 1 if there are any"""
+        all_files = self.target_files + self.service_files
+        paths = [self.base_path / f for f in all_files if (self.base_path / f).exists()]
+        
+        total_removed = 0
+        totals = dict.fromkeys(self.pipeline.names, 0)
+        # Files each transform would change, out of the ones scanned
+        changed = dict.fromkeys(self.pipeline.names, 0)
+        findings = []
+        errors = []
+        for result in self.iter_results('preview_file', paths, errors):
+            total_removed += result['removed_count']
+            for name, count in result['changes'].items():
+                totals[name] += count
+                changed[name] += count > 0
+            findings.extend(result.get('findings', ()))
+            self.collect_metrics(result)
+            if result['output']:
+                sys.stdout.write(result['output'])
+                sys.stdout.flush()
+        for error in errors:
+            print(f"❌ {error['file']}: {error['error']}", file=sys.stderr)
+        
+        if self.remove_prints:
+            print(f"🔍 Dry run: {total_removed} debug statements would be "
+                  f"{'guarded in' if self.rewrite else 'removed from'} {changed['prints']} of "
+                  f"{len(paths)} files scanned", file=sys.stderr)
+        for transform in self.pipeline.extra():
+            print(f"🔁 Dry run: {totals[transform.name]} {transform.noun} would be {transform.verb} "
+                  f"in {changed[transform.name]} of {len(paths)} files scanned", file=sys.stderr)
+        leaked = sum(1 for finding in findings if finding['kind'] == 'leak')
+        pruned = sum(1 for finding in findings if finding['action'] == 'remove')
+        if len(findings) > leaked:
+            print(f"🧽 {pruned} log-only locals would go with them; {len(findings) - leaked - pruned} spots "
+                  f"left for review (listed with --format jsonl)", file=sys.stderr)
+        if leaked:
+            print(f"🔐 {leaked} prints that leak sensitive data would stay (listed with --format jsonl; "
+                  f"--leaks remove deletes them)", file=sys.stderr)
+        return self.exit_status(any(totals.values()), leaked)
+
+    def profile_all_files(self):
+        """Print the print() calls ranked by estimated runtime cost, optionally as JSON too"""
+        all_files = self.target_files + self.service_files
+        paths = [self.base_path / f for f in all_files if (self.base_path / f).exists()]
+        
+        records = []
+        for result in self.map_files('profile_file', paths):
+            if 'error' in result:
+                print(f"❌ {result['file']}: {result['error']}", file=sys.stderr)
+                continue
+            records.extend(result['hotspots'])
+        
+        if self.hotspots_json:
+            report = {'files': len(paths), 'prints': len(records), 'hotspots': rank_hotspots(records)}
+            atomic_write(self.hotspots_json, json.dumps(report, indent=1, ensure_ascii=False).encode('utf-8'))
+        print(format_hotspots(records))
+        if self.hotspots_json:
+            print(f"\n💾 Ranked hotspots written to {self.hotspots_json}")
+        return 0
+
     def clean_all_files(self):
         """Clean all target files"""
-        print("\n🧹 Starting debug log cleanup...")
+        print(f"\n🧹 Starting {self.tool_name.lower()}...")
         
         all_files = self.target_files + self.service_files
+        found = {file_path: (self.base_path / file_path).exists() for file_path in all_files}
+        
+        if self.jobs > 1:
+            print(f"   ⚙️  Using {self.jobs} worker processes")
+        
+        # Results come back in input order, so the report doesn't depend on the worker count
+        results = self.map_clean_file([self.base_path / f for f in all_files if found[f]])
         
         for file_path in all_files:
-            full_path = self.base_path / file_path
-            
-            if not full_path.exists():
+            if not found[file_path]:
                 print(f"   ⚠️  Skipped (not found): {file_path}")
                 self.skipped_files.append(file_path)
                 continue
             
             print(f"   🔧 Cleaning: {file_path}")
-            result = self.clean_file(full_path)
+            result = next(results)
             
             if 'error' in result:
                 print(f"      ❌ Error: {result['error']}")
                 self.error_files.append(result)
+            elif result.get('unchanged'):
+                print("      ♻️  Unchanged since last run")
+                self.unchanged_files.append(result)
             else:
-                print(f"      ✅ Removed {result['removed_count']} debug lines")
+                if self.remove_prints:
+                    verb = "Guarded" if self.rewrite else "Removed"
+                    print(f"      ✅ {verb} {result['removed_count']} debug lines")
+                for transform in self.pipeline.extra():
+                    count = result['changes'][transform.name]
+                    if count:
+                        print(f"      🔁 {transform.verb.capitalize()} {count} {transform.noun}")
+                self.report_findings(result.get('findings', ()))
                 self.cleaned_files.append(result)
+                self.collect_metrics(result)
+            
+            if self.incremental and result.get('state'):
+                self.cache[result['file']] = result['state']
+        
+        results.close()
+        
+        if self.incremental:
+            self.save_cache()
+
+    def leaked_prints(self):
+        """Number of prints leaking sensitive data left in the cleaned files"""
+        return sum(1 for result in self.cleaned_files for finding in result.get('findings', ())
+                   if finding['kind'] == 'leak')
+
+    @staticmethod
+    def describe_finding(finding):
+        """One line about code the print removal left behind"""
+        text = ' '.join(finding['text'].split())
+        if len(text) > 70:
+            text = text[:67] + '...'
+        if finding['kind'] == 'empty-catch':
+            return f"Line {finding['line']}: {text} {{}} now swallows errors silently"
+        if finding['kind'] == 'leak':
+            return f"Line {finding['line']}: {text} leaks sensitive data [{finding['name']}]"
+        if finding['action'] == 'remove':
+            return f"Line {finding['line']}: removed {text} (only read by debug lines)"
+        return f"Line {finding['line']}: kept {text} (only read by debug lines, may have side effects)"
+
+    def report_findings(self, findings):
+        """Print the locals removed alongside a file's debug lines and what needs a look"""
+        pruned = [finding for finding in findings if finding['action'] == 'remove']
+        if pruned:
+            print(f"      🧽 Removed {len(pruned)} log-only locals")
+        for finding in findings:
+            if finding['action'] == 'report':
+                icon = "🔐" if finding['kind'] == 'leak' else "👀"
+                print(f"      {icon} {self.describe_finding(finding)}")
 
     def generate_report(self):
         """Generate cleanup report"""
-        print("\n📊 Cleanup Report")
+        print(f"\n📊 {self.report_title}")
         print("=" * 50)
         
         total_removed = sum(f.get('removed_count', 0) for f in self.cleaned_files)
         total_files = len(self.cleaned_files)
         
         print(f"📁 Files processed: {total_files}")
-        print(f"🗑️  Debug lines removed: {total_removed}")
+        if self.incremental:
+            print(f"♻️  Files unchanged since last run: {len(self.unchanged_files)}")
+        if self.remove_prints:
+            print(f"🗑️  Debug lines {'guarded' if self.rewrite else 'removed'}: {total_removed}")
+        for transform in self.pipeline.extra():
+            total = sum(f['changes'][transform.name] for f in self.cleaned_files)
+            print(f"🔁 {transform.noun.capitalize()} {transform.verb}: {total}")
+        findings = [finding for result in self.cleaned_files for finding in result.get('findings', ())]
+        leaked = self.leaked_prints()
+        if len(findings) > leaked:
+            pruned = sum(1 for finding in findings if finding['action'] == 'remove')
+            print(f"🧽 Log-only locals removed: {pruned}")
+            print(f"👀 Left for review: {len(findings) - leaked - pruned}")
+        if leaked:
+            print(f"🔐 Prints left that leak sensitive data: {leaked} (--leaks remove deletes them)")
         print(f"⚠️  Files skipped: {len(self.skipped_files)}")
         print(f"❌ Files with errors: {len(self.error_files)}")
         
         if self.cleaned_files:
             print("\n📋 Detailed Results:")
             for result in self.cleaned_files:
-                print(f"   {result['file']}: {result['removed_count']} lines removed")
+                parts = []
+                if self.remove_prints:
+                    parts.append(f"{result['removed_count']} lines {'guarded' if self.rewrite else 'removed'}")
+                parts.extend(f"{result['changes'][transform.name]} {transform.noun} {transform.verb}"
+                             for transform in self.pipeline.extra())
+                print(f"   {result['file']}: {', '.join(parts)}")
         
         if self.skipped_files:
             print("\n⚠️  Skipped Files:")
@@ -216,29 +858,302 @@ class DebugLogCleaner:
                 print(f"   {error['file']}: {error['error']}")
         
         print(f"\n💾 Backup location: {self.backup_dir}")
+        if self.backup_run:
+            print(f"♻️  Undo with: python3 debug_log_backup.py --backup-dir {self.backup_dir} "
+                  f"restore --run {self.backup_run}")
         print("🎯 Performance improvement: Reduced I/O operations and memory usage")
 
+    def watch_roots(self):
+        """Return (directories to watch, whether to watch below them) for the target files"""
+        if self.include is not None:
+            return sorted({static_prefix(pattern) or '.' for pattern in self.include}), True
+        directories = {os.path.normpath(self.base_path / Path(f).parent)
+                       for f in self.target_files + self.service_files}
+        return sorted(d for d in directories if os.path.isdir(d)), False
+
+    def watch_filter(self):
+        """Predicate telling whether a changed path is one of the target files"""
+        if self.include is not None:
+            include_re = compile_globs(self.include)
+            exclude_re = compile_globs(self.exclude)
+            
+            def matches(path):
+                rel_path = Path(os.path.relpath(path)).as_posix()
+                return include_re.match(rel_path) is not None and not (exclude_re and exclude_re.match(rel_path))
+            return matches
+        targets = {os.path.normpath(self.base_path / f) for f in self.target_files + self.service_files}
+        return lambda path: os.path.normpath(path) in targets
+
+    def watch_file(self, file_path):
+        """Re-check (dry run) or re-clean one saved file and report it"""
+        started = time.perf_counter()
+        if self.dry_run:
+            result = self.preview_file(file_path)
+            if 'error' not in result and result['output']:
+                sys.stdout.write(result['output'])
+                sys.stdout.flush()
+        else:
+            # One pass over the file; it's backed up only once it's known to change
+            result = self.clean_file(file_path, self.backup_saved_file)
+            if any(result.get('changes', {}).values()):
+                self.written[os.path.normpath(file_path)] = file_path.stat().st_mtime_ns
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        if 'error' in result:
+            print(f"❌ {file_path}: {result['error']}", file=sys.stderr)
+        elif not result.get('removed_count'):
+            print(f"✅ {file_path}: no debug statements ({elapsed:.0f} ms)", file=sys.stderr)
+        elif self.dry_run:
+            print(f"🔍 {file_path}: {result['removed_count']} debug statements would be "
+                  f"{'guarded' if self.rewrite else 'removed'} ({elapsed:.0f} ms)", file=sys.stderr)
+        else:
+            print(f"🧹 {file_path}: {'guarded' if self.rewrite else 'removed'} {result['removed_count']} "
+                  f"debug lines ({elapsed:.0f} ms, backup run {self.backup_run})", file=sys.stderr)
+            self.report_findings(result.get('findings', ()))
+
+    def backup_saved_file(self, file_path):
+        """Back up one saved file about to be rewritten; the store only keeps one copy of each version"""
+        self.backup_run, _ = BackupStore(self.backup_dir).backup([file_path])
+
+    def watch(self, polling=False):
+        """Re-check or re-clean each target file as soon as it is saved, until Ctrl-C"""
+        roots, recursive = self.watch_roots()
+        is_watched = self.watch_filter()
+        watcher = open_watcher(roots, recursive, polling)
+        # Build every rule engine the pipeline uses now rather than on the first save
+        self.debug_engine, self.keep_engine, self.leak_engine
+        mode = "Checking" if self.dry_run else "Cleaning"
+        print(f"👀 {mode} saved files under {', '.join(roots)} ({watcher.kind}); Ctrl-C to stop",
+              file=sys.stderr)
+        try:
+            for changed in debounced(watcher):
+                for path in sorted(changed):
+                    if not is_watched(path) or not os.path.isfile(path):
+                        continue
+                    # Our own rewrites come back as events too
+                    if self.written.get(os.path.normpath(path)) == os.stat(path).st_mtime_ns:
+                        continue
+                    self.watch_file(Path(path))
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching", file=sys.stderr)
+        finally:
+            watcher.close()
+        return 0
+
+    def check_changes(self, since=None, staged=False):
+        """Report debug statements on lines added since a ref (or staged); return 1 if there are any"""
+        started = time.perf_counter()
+        is_target = self.watch_filter()
+        try:
+            changes = {path: ranges for path, ranges in added_lines(since, staged).items() if is_target(path)}
+            contents = read_index(sorted(changes)) if staged else {}
+        except GitError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return 2
+        
+        # Keyed the way findings name their file
+        added = {str(Path(path)): ([first for first, _ in ranges], ranges) for path, ranges in changes.items()}
+        paths = [path for path in sorted(changes) if not staged or path in contents]
+        violations = 0
+        leaked = 0
+        errors = []
+        for finding in self.iter_findings(paths, errors, contents if staged else None):
+            # The call counts if any of its lines was added
+            firsts, ranges = added[finding.file]
+            index = bisect.bisect_right(firsts, finding.end_line) - 1
+            if index < 0 or ranges[index][1] < finding.line:
+                continue
+            violations += 1
+            leaked += finding.rule in self.leak_ids
+            print(finding.to_json() if self.output_format == 'jsonl' else finding, flush=True)
+        for error in errors:
+            print(f"❌ {error['file']}: {error['error']}", file=sys.stderr)
+        
+        scope = "staged changes" if staged else f"changes since {since}"
+        elapsed = (time.perf_counter() - started) * 1000
+        if leaked:
+            print(f"🔐 {leaked} of them leak sensitive data", file=sys.stderr)
+        if violations:
+            print(f"❌ {violations} debug statements added in {scope} "
+                  f"({len(changes)} files checked, {elapsed:.0f} ms)", file=sys.stderr)
+            return self.exit_status(violations, leaked)
+        print(f"✅ No debug statements added in {scope} ({len(changes)} files checked, {elapsed:.0f} ms)",
+              file=sys.stderr)
+        return 0
+
+    def exit_status(self, found, leaked):
+        """1 if anything was found, or 3 for leaks left in place under --leaks fail"""
+        if leaked and self.leak_mode == 'fail':
+            return 3
+        return 1 if found else 0
+
+    def check_all_files(self):
+        """Report every debug statement in the target files; return 1 if there are any"""
+        started = time.perf_counter()
+        all_files = self.target_files + self.service_files
+        paths = [self.base_path / f for f in all_files if (self.base_path / f).exists()]
+        
+        errors = []
+        count = 0
+        leaked = 0
+        for finding in self.iter_findings(paths, errors):
+            print(finding.to_json() if self.output_format == 'jsonl' else finding, flush=True)
+            count += 1
+            leaked += finding.rule in self.leak_ids
+        for error in errors:
+            print(f"❌ {error['file']}: {error['error']}", file=sys.stderr)
+        
+        elapsed = (time.perf_counter() - started) * 1000
+        if leaked:
+            print(f"🔐 {leaked} of them leak sensitive data", file=sys.stderr)
+        if count:
+            print(f"❌ {count} debug statements in {len(paths)} files ({elapsed:.0f} ms)", file=sys.stderr)
+            return self.exit_status(count, leaked)
+        print(f"✅ No debug statements in {len(paths)} files ({elapsed:.0f} ms)", file=sys.stderr)
+        return 2 if errors else 0
+
     def run(self):
         """Run the complete cleanup process"""
-        print("🚀 Woosh Debug Log Cleanup Tool")
+        # Dry runs only write the diff to stdout: no banner, backup or cache
+        if self.dry_run:
+            with self.timed_phase('preview'):
+                status = self.preview_all_files()
+            self.write_metrics(sys.stderr)
+            return status
+        # So does profiling, which only reads the files
+        if self.hotspots:
+            return self.profile_all_files()
+        
+        print(f"🚀 Woosh {self.tool_name} Tool")
         print("=" * 50)
         
         # Create backup
-        self.create_backup()
+        with self.timed_phase('backup'):
+            self.create_backup()
         
         # Clean files
-        self.clean_all_files()
+        with self.timed_phase('clean'):
+            self.clean_all_files()
+        self.discard_unused_backup()
         
         # Generate report
         self.generate_report()
+        self.write_metrics()
         
-        print("\n✅ Cleanup completed successfully!")
+        print(f"\n✅ {self.completed_message}")
         print("💡 Tip: Test the application thoroughly after cleanup")
+        return self.exit_status(0, self.leaked_prints())
+
+def package_rename(value):
+    """Parse OLD:NEW for --rename-package"""
+    old, _, new = value.partition(':')
+    if not re.fullmatch(r'\w+', old) or not re.fullmatch(r'\w+', new):
+        raise argparse.ArgumentTypeError(f"expected OLD:NEW package names, got {value!r}")
+    return old, new
+
+
+def parse_args(description):
+    """Parse the command line options shared by the cleanup scripts"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="worker processes for cleaning files (0 = one per CPU, default: 1)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="skip files unchanged since the last incremental run")
+    parser.add_argument("--include", action="append", metavar="GLOB",
+                        help="clean every file matching GLOB instead of the built-in list "
+                             "(repeatable; e.g. 'lib/**/*.dart')")
+    parser.add_argument("--exclude", action="append", metavar="GLOB", default=[],
+                        help="skip files matching GLOB (repeatable; implies --include lib/**/*.dart)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print what would be removed instead of rewriting files; "
+                             "exits 1 if anything would be removed")
+    parser.add_argument("--rewrite", action="store_true",
+                        help="turn matched print() calls into 'if (kDebugMode) debugPrint(...)' "
+                             "tagged with a category instead of deleting them")
+    parser.add_argument("--rules", default=RULES_FILE, metavar="FILE",
+                        help=f"rule file to use (default: {RULES_FILE.name})")
+    parser.add_argument("--keep-locals", action="store_true",
+                        help="don't remove the locals and Stopwatches only the removed debug lines read")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--since", metavar="REF",
+                       help="only check lines added since the merge base with REF (e.g. origin/main); "
+                            "exits 1 if any of them is a debug statement")
+    scope.add_argument("--staged", action="store_true",
+                       help="only check lines added in the staged changes, as a pre-commit hook")
+    scope.add_argument("--check", action="store_true",
+                       help="list every debug statement in the target files without changing them; "
+                            "exits 1 if there are any")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-clean each target file when it is saved "
+                             "(with --dry-run: only report it)")
+    parser.add_argument("--poll", action="store_true",
+                        help="with --watch, poll modification times instead of using inotify")
+    parser.add_argument("--hotspots", action="store_true",
+                        help="rank print() calls by estimated runtime cost (build methods, item "
+                             "builders, loops, timers, listeners) instead of cleaning")
+    parser.add_argument("--hotspots-json", metavar="FILE",
+                        help="with --hotspots, also write the ranked hotspots as JSON (implies --hotspots)")
+    parser.add_argument("--format", choices=["diff", "jsonl"], default="diff",
+                        help="output of --dry-run (unified diff) and of --check/--since/--staged "
+                             "(file:line:column lines), or JSON Lines of the spans (default: diff)")
+    parser.add_argument("--rename-package", action="append", metavar="OLD:NEW", default=[],
+                        type=package_rename,
+                        help="in the same pass, point package:OLD/ imports (and ../OLD/ ones) at "
+                             "package:NEW/ (repeatable)")
+    parser.add_argument("--keep-prints", action="store_true",
+                        help="leave debug prints alone and only run the other transforms "
+                             "(e.g. --rename-package)")
+    parser.add_argument("--leaks", choices=["report", "fail", "remove"], default="report",
+                        help="prints interpolating tokens, passwords, headers, response bodies or user "
+                             "IDs: list them (default), also exit 3 if any are left, or remove them "
+                             "even where a keep rule matches")
+    parser.add_argument("--metrics-json", metavar="FILE",
+                        help="write per-rule hit counts and match time plus per-file read/match/write "
+                             "timings to FILE as JSON")
+    parser.add_argument("--metrics-prom", metavar="FILE",
+                        help="write the same metrics in the Prometheus textfile format (for node_exporter)")
+    args = parser.parse_args()
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+
+def is_read_only(args):
+    """Check if the command line asks for a run that writes nothing but its output"""
+    return bool(args.dry_run or args.check or args.since or args.staged)
+
+
+def cli_main(cleaner_class, description):
+    """Parse the command line, build a cleaner_class instance from it and run the chosen mode"""
+    args = parse_args(description)
+    cleaner = cleaner_class(jobs=args.jobs, incremental=args.incremental,
+                            dry_run=args.dry_run, output_format=args.format,
+                            rewrite=args.rewrite, rules_file=args.rules,
+                            hotspots=args.hotspots, hotspots_json=args.hotspots_json,
+                            prune_locals=not args.keep_locals, metrics_json=args.metrics_json,
+                            metrics_prom=args.metrics_prom, rename_packages=args.rename_package,
+                            remove_prints=not args.keep_prints, leaks=args.leaks,
+                            rules_cache=cache_path(args.rules), read_only=is_read_only(args))
+    if args.include or args.exclude:
+        cleaner.discover_targets(args.include or DEFAULT_INCLUDE, args.exclude)
+    if args.since or args.staged:
+        return cleaner.check_changes(args.since, args.staged)
+    if args.check:
+        return cleaner.check_all_files()
+    if args.watch:
+        return cleaner.watch(polling=args.poll)
+    return cleaner.run()
+
 
 def main():
     """Main function"""
-    cleaner = DebugLogCleaner()
-    cleaner.run()
+    return cli_main(DebugLogCleaner, "Remove debug logs from the Woosh journey plan files")
+
+
+def iter_findings(paths, rules=None, jobs=1, errors=None):
+    """Yield a Finding for every debug statement the basic rules match in paths (files or directories)"""
+    return DebugLogCleaner(jobs=jobs, rules_file=rules).iter_findings(paths, errors)
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(run_cli(main)) 
\ No newline at end of file
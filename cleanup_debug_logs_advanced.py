@@ -4,326 +4,67 @@ Advanced Debug Log Cleanup Script for Woosh Journey Plan Files
 Handles specific debug patterns found in the codebase
 """
 
-import os
-import re
-import shutil
+import sys
 from pathlib import Path
-from datetime import datetime
 
-class AdvancedDebugLogCleaner:
-    def __init__(self, base_path="lib"):
-        self.base_path = Path(base_path)
+from cleanup_debug_logs import DebugLogCleaner, cli_main
+from debug_log_files import run_cli
+
+class AdvancedDebugLogCleaner(DebugLogCleaner):
+    tool_name = "Advanced Debug Log Cleanup"
+    report_title = "Advanced Cleanup Report"
+    completed_message = "Advanced cleanup completed successfully!"
+    rule_profile = "advanced"
+
+    def __init__(self, base_path="lib", jobs=1, incremental=False,
+                 dry_run=False, output_format="diff", rewrite=False, rules_file=None,
+                 hotspots=False, hotspots_json=None, prune_locals=True, metrics_json=None,
+                 metrics_prom=None, rename_packages=(), remove_prints=True, leaks="report",
+                 rules_cache=None, read_only=False):
+        super().__init__(base_path, jobs, incremental, dry_run, output_format, rewrite, rules_file,
+                         hotspots, hotspots_json, prune_locals, metrics_json, metrics_prom,
+                         rename_packages, remove_prints, leaks, rules_cache, read_only)
         self.backup_dir = Path("backup_debug_logs_advanced")
-        self.cleaned_files = []
-        self.skipped_files = []
-        self.error_files = []
-        
-        # Comprehensive debug patterns
-        self.debug_patterns = [
-            # Basic debug prints
-            r'^\s*print\s*\(\s*[\'"][^\'"]*debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            
-            # Common debug prefixes
-            r'^\s*print\s*\(\s*[\'"][^\'"]*\?\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*\?[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            
-            # Specific patterns from codebase
-            r'^\s*print\s*\(\s*[\'"][^\'"]*REPORT SUBMISSION DEBUG[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*CHECKOUT[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Loaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Saved[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cached[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cleared[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Routes preloaded[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Fetching[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Found[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug Auth Status[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Pattern words[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Matching outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Exact match found[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Word boundary match[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Start match found[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Partial match found[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Search results[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Starting search operation[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Empty query[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Loading all outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Search operation completed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Search operation failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Loaded.*total outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading all outlets[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Starting connectivity monitoring[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Connection restored[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Sync already in progress[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Starting offline sync[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Pending operations[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Step 1[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Step 2[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Step 3[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Offline sync completed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Remaining operations[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error during offline sync[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Sync process ended[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing.*pending session[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Synced session start[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Synced session end[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to sync session[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Deleted session operation[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing.*pending journey plans[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Synced journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to sync journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Syncing.*pending reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cannot sync report[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Synced report for journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to sync report[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Force sync requested[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Online status[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Currently syncing[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Has pending operations[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cannot sync - device is offline[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Starting manual sync[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Journey plan created successfully[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Journey plan creation failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Server error detected[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Saved pending journey plan[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Journey plan update failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Server error detected during journey plan update[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Web file upload error[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*OfflineSyncIndicator[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Making dashboard API call[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Dashboard response status[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Dashboard response body[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Error in getDashboard[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Smart cache invalidation[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared cache for prefix[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared all cache[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Preloading data[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Preloading completed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Error preloading data[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Using cached data[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - No auth token found[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Making API call[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Headers[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Response status[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Response body[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Error in getDailyVisitTargets[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Using cached targets data[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Fetching targets[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cached targets data[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared targets cache[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Debug - Cleared all cache for user[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading detailed stats[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading clients[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error preloading routes[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error fetching fresh data[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading from cache[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error refreshing client list[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Failed to load routes[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error preloading products[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error initializing Hive service[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error reading cached products[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error caching products[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Background product update failed[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Cannot save report[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error saving report to Hive[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error syncing report[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading existing reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error parsing cached report[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading cached reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error caching reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error loading fresh reports[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error clearing caches[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error picking image[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error uploading image[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error submitting report[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*CHECKOUT ERROR[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Error during checkout[^\'"]*[\'"]\s*\)\s*;?\s*$',
-        ]
-        
-        # Patterns to keep (important error handling)
-        self.keep_patterns = [
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Exception[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Critical[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Fatal[^\'"]*[\'"]\s*\)\s*;?\s*$',
-            r'^\s*print\s*\(\s*[\'"][^\'"]*Unexpected[^\'"]*[\'"]\s*\)\s*;?\s*$',
-        ]
+        self.cache_file = Path(".debug_log_cache_advanced.json")
         
         # Files to process
         self.target_files = [
-            "pages/journeyplan/createJourneyplan.dart",
+            "pages/journeyplan/create_journey_plan.dart",
             "pages/journeyplan/journeyplans_page.dart", 
             "pages/journeyplan/journeyview.dart",
-            "pages/journeyplan/reports/reportMain_page.dart",
+            "pages/journeyplan/reports/report_main_page.dart",
             "pages/journeyplan/reports/pages/product_report_page.dart",
             "pages/journeyplan/reports/pages/visibility_report_page.dart",
             "pages/journeyplan/reports/pages/feedback_report_page.dart",
-            "pages/journeyplan/reports/pages/product_sample_page.dart",
+            "pages/journeyplan/reports/pages/product_sample.dart",
             "services/enhanced_journey_plan_service.dart",
-            "services/jouneyplan_service.dart",
+            "services/journeyplan/jouneyplan_service.dart",
             "services/offline_sync_service.dart",
             "services/hive/product_hive_service.dart",
             "services/hive/client_hive_service.dart",
             "services/hive/order_hive_service.dart",
             "services/hive/route_hive_service.dart",
-            "services/outlet_search.dart",
-            "services/outlet_service.dart",
             "services/target_service.dart",
             "services/image_upload_web.dart",
             "widgets/offline_sync_indicator.dart",
             "pages/profile/user_stats_page.dart",
         ]
-
-    def create_backup(self):
-        """Create backup of original files"""
-        if self.backup_dir.exists():
-            shutil.rmtree(self.backup_dir)
-        
-        self.backup_dir.mkdir(parents=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        print(f"📁 Creating backup in: {self.backup_dir}")
-        
-        for file_path in self.target_files:
-            full_path = self.base_path / file_path
-            if full_path.exists():
-                backup_path = self.backup_dir / f"{timestamp}_{file_path.replace('/', '_')}"
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(full_path, backup_path)
-                print(f"   ✅ Backed up: {file_path}")
-
-    def should_keep_line(self, line):
-        """Check if line should be kept (important error handling)"""
-        for pattern in self.keep_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-        return False
-
-    def is_debug_line(self, line):
-        """Check if line is a debug statement"""
-        for pattern in self.debug_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-        return False
-
-    def clean_file(self, file_path):
-        """Clean debug logs from a single file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            original_lines = len(lines)
-            cleaned_lines = []
-            removed_count = 0
-            
-            for line in lines:
-                # Keep important error handling lines
-                if self.should_keep_line(line):
-                    cleaned_lines.append(line)
-                    continue
-                
-                # Remove debug lines
-                if self.is_debug_line(line):
-                    removed_count += 1
-                    continue
-                
-                # Keep all other lines
-                cleaned_lines.append(line)
-            
-            # Write cleaned content back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(cleaned_lines)
-            
-            return {
-                'file': str(file_path),
-                'original_lines': original_lines,
-                'cleaned_lines': len(cleaned_lines),
-                'removed_count': removed_count
-            }
-            
-        except Exception as e:
-            return {
-                'file': str(file_path),
-                'error': str(e)
-            }
-
-    def clean_all_files(self):
-        """Clean all target files"""
-        print("\n🧹 Starting advanced debug log cleanup...")
-        
-        for file_path in self.target_files:
-            full_path = self.base_path / file_path
-            
-            if not full_path.exists():
-                print(f"   ⚠️  Skipped (not found): {file_path}")
-                self.skipped_files.append(file_path)
-                continue
-            
-            print(f"   🔧 Cleaning: {file_path}")
-            result = self.clean_file(full_path)
-            
-            if 'error' in result:
-                print(f"      ❌ Error: {result['error']}")
-                self.error_files.append(result)
-            else:
-                print(f"      ✅ Removed {result['removed_count']} debug lines")
-                self.cleaned_files.append(result)
+        self.service_files = []
 
     def generate_report(self):
         """Generate cleanup report"""
-        print("\n📊 Advanced Cleanup Report")
-        print("=" * 50)
-        
-        total_removed = sum(f.get('removed_count', 0) for f in self.cleaned_files)
-        total_files = len(self.cleaned_files)
-        
-        print(f"📁 Files processed: {total_files}")
-        print(f"🗑️  Debug lines removed: {total_removed}")
-        print(f"⚠️  Files skipped: {len(self.skipped_files)}")
-        print(f"❌ Files with errors: {len(self.error_files)}")
-        
-        if self.cleaned_files:
-            print("\n📋 Detailed Results:")
-            for result in self.cleaned_files:
-                print(f"   {result['file']}: {result['removed_count']} lines removed")
-        
-        if self.skipped_files:
-            print("\n⚠️  Skipped Files:")
-            for file in self.skipped_files:
-                print(f"   {file}")
-        
-        if self.error_files:
-            print("\n❌ Errors:")
-            for error in self.error_files:
-                print(f"   {error['file']}: {error['error']}")
-        
-        print(f"\n💾 Backup location: {self.backup_dir}")
-        print("🎯 Performance improvement: Reduced I/O operations and memory usage")
+        super().generate_report()
         print("📈 Estimated performance gain: 15-25% reduction in debug overhead")
 
-    def run(self):
-        """Run the complete cleanup process"""
-        print("🚀 Woosh Advanced Debug Log Cleanup Tool")
-        print("=" * 50)
-        
-        # Create backup
-        self.create_backup()
-        
-        # Clean files
-        self.clean_all_files()
-        
-        # Generate report
-        self.generate_report()
-        
-        print("\n✅ Advanced cleanup completed successfully!")
-        print("💡 Tip: Test the application thoroughly after cleanup")
-
 def main():
     """Main function"""
-    cleaner = AdvancedDebugLogCleaner()
-    cleaner.run()
+    return cli_main(AdvancedDebugLogCleaner, "Remove debug logs from the Woosh journey plan and service files")
+
+
+def iter_findings(paths, rules=None, jobs=1, errors=None):
+    """Yield a Finding for every debug statement the advanced rules match in paths (files or directories)"""
+    return AdvancedDebugLogCleaner(jobs=jobs, rules_file=rules).iter_findings(paths, errors)
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(run_cli(main)) 
\ No newline at end of file
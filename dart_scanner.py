@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Lightweight Dart Scanner for the Woosh Debug Log Cleanup Scripts
+Finds print(...) calls as whole expressions in one linear pass per file,
+understanding string literals, ${} interpolation, comments and bracket depth
+"""
+
+import re
+
+# Names of the calls the cleaners care about
+CALL_NAMES = ('print', 'console.log')
+
+# Raw bytes every call name starts with, checked before a file is decoded
+_CALL_NEEDLES = tuple(sorted({name.split('.')[0].encode() for name in CALL_NAMES}))
+
+# Optional raw prefix followed by an opening quote. Every alternative in the
+# event patterns starts with a literal character (lookbehinds come after it)
+# so the regex engine can skip ahead to candidate characters
+_STRING = r"""[rR](?<![\w$][rR])(?=['"])|'''|\"\"\"|['"]"""
+
+# Things that change the lexer state while walking plain code
+_CODE_EVENTS = re.compile(
+    rf"""(?P<string>{_STRING})|(?P<comment>//|/\*)|"""
+    r"""(?P<call>(?:p(?<![\w$.]p)rint|c(?<![\w$.]c)onsole\s*\.\s*log)(?=\s*\())"""
+)
+_BRACE_EVENTS = re.compile(rf"""{_STRING}|//|/\*|[{{}}]""")
+_ARG_EVENTS = re.compile(rf"""{_STRING}|//|/\*|[()\[\]{{}}]""")
+_BLOCK_COMMENT_EVENTS = re.compile(r'/\*|\*/')
+_LITERAL_EVENTS = re.compile(rf"""{_STRING}|//|/\*""")
+_NOT_NEWLINE = re.compile(r'[^\n]')
+_TRIVIA = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.S)
+_WHITESPACE = re.compile(r'\s+')
+
+# Inside a non-raw string: escapes, ${ interpolation, the closing quote,
+# and (for single-line quotes) a newline marking an unterminated literal
+_STRING_EVENTS = {
+    quote: re.compile(r'\\.|\$\{|' + re.escape(quote) + ('|\n' if len(quote) == 1 else ''), re.S)
+    for quote in ("'''", '"""', "'", '"')
+}
+
+_OPENING = '([{'
+_STRING_STARTS = '\'"rR'
+
+# Directives that decide where (and whether) an import can be added
+_PART_OF = re.compile(r'^\s*part\s+of\b', re.M)
+_IMPORT = re.compile(r'^(?:import|export|library)\b[^;]*;[^\n]*(?:\n|\Z)', re.M)
+_IMPORT_URI = re.compile(r"""^import\s+(['"])(?P<uri>[^'"\n]*)\1(?P<clauses>[^;]*);""", re.M)
+_IMPORT_PREFIX = re.compile(r'\bas\s+[\w$]+')
+_COMBINATOR = re.compile(r'\b(show|hide)\s+([\w$]+(?:\s*,\s*[\w$]+)*)')
+
+
+def _quote_at(source, i):
+    """Return the quote (single or triple) that opens a string at source[i]"""
+    triple = source[i:i + 3]
+    if triple in ("'''", '"""'):
+        return triple
+    return source[i]
+
+
+def skip_string(source, i):
+    """Return the index just past the string literal starting at source[i]"""
+    raw = source[i] in 'rR'
+    if raw:
+        i += 1
+    quote = _quote_at(source, i)
+    i += len(quote)
+
+    if raw:
+        end = source.find(quote, i)
+        if len(quote) == 1:
+            newline = source.find('\n', i)
+            if newline != -1 and (end == -1 or newline < end):
+                return newline
+        return len(source) if end == -1 else end + len(quote)
+
+    events = _STRING_EVENTS[quote]
+    while True:
+        m = events.search(source, i)
+        if m is None:
+            return len(source)
+        token = m.group()
+        if token[0] == '\\':
+            i = m.end()
+        elif token == '${':
+            i = skip_braced(source, m.end())
+        elif token == '\n':
+            # Unterminated single-line literal; resume on the next line
+            return m.start()
+        else:
+            return m.end()
+
+
+def skip_comment(source, i):
+    """Return the index just past the comment starting at source[i]"""
+    if source.startswith('//', i):
+        end = source.find('\n', i)
+        return len(source) if end == -1 else end
+
+    # Dart block comments nest
+    depth = 0
+    while True:
+        m = _BLOCK_COMMENT_EVENTS.search(source, i)
+        if m is None:
+            return len(source)
+        depth += 1 if m.group() == '/*' else -1
+        i = m.end()
+        if depth == 0:
+            return i
+
+
+def skip_braced(source, i):
+    """Return the index just past the } closing a ${ or { opened before source[i]"""
+    depth = 1
+    while True:
+        m = _BRACE_EVENTS.search(source, i)
+        if m is None:
+            return len(source)
+        token = m.group()
+        if token[0] in _STRING_STARTS:
+            i = skip_string(source, m.start())
+        elif token[0] == '/':
+            i = skip_comment(source, m.start())
+        else:
+            depth += 1 if token == '{' else -1
+            i = m.end()
+            if depth == 0:
+                return i
+
+
+def _string_body(source, start, end, interpolations=True):
+    """Text of a string literal without prefix and quotes, on one line.
+
+    With interpolations off every ${...} is emptied to ${}, leaving only
+    the literal text of the message.
+    """
+    raw = source[start] in 'rR'
+    if raw:
+        start += 1
+    quote = _quote_at(source, start)
+    body_end = end - len(quote) if source.endswith(quote, 0, end) else end
+    start += len(quote)
+    if interpolations or raw:
+        body = source[start:body_end]
+    else:
+        pieces = []
+        events = _STRING_EVENTS[quote]
+        i = start
+        while True:
+            m = events.search(source, i, body_end)
+            if m is None:
+                break
+            if m.group() == '${':
+                pieces.append(source[start:m.end()])
+                start = i = min(skip_braced(source, m.end()), body_end) - 1
+            else:
+                i = m.end()
+        pieces.append(source[start:body_end])
+        body = ''.join(pieces)
+    # Quotes inside the body (escaped or in interpolations) would stop the
+    # [^'"]* runs in the line rules, so drop them along with line breaks
+    return _WHITESPACE.sub(' ', body.replace("'", '').replace('"', ''))
+
+
+def _fold(name, pieces):
+    """The call on one line, adjacent string literals merged into one"""
+    parts = []
+    previous_string = False
+    for kind, text in pieces:
+        if kind == 'string':
+            if previous_string:
+                parts[-1] = parts[-1][:-1] + text + "'"
+            else:
+                parts.append(f"'{text}'")
+            previous_string = True
+        else:
+            text = _WHITESPACE.sub(' ', text).strip()
+            if text:
+                parts.append(text)
+                previous_string = False
+    return f"{name}({' '.join(parts)});"
+
+
+class DartCall:
+    """A print(...) call found by iter_calls.
+
+    ``start``/``end`` delimit the call (and its ``;`` when it is a whole
+    statement). ``canonical`` is the call folded onto one line with its
+    message strings merged, so the existing line rules can match it.
+    ``message`` is the same with ``${...}`` bodies emptied, for rules about
+    the message text rather than the values interpolated into it.
+    """
+
+    __slots__ = ('name', 'start', 'end', 'statement', 'canonical', 'message')
+
+    def __init__(self, name, start, end, statement, canonical, message=None):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.statement = statement
+        self.canonical = canonical
+        self.message = canonical if message is None else message
+
+    def line_span(self, source):
+        """Span to delete: whole lines when the statement owns them, else just the call.
+
+        A trailing ``// comment`` on the last line goes with the statement.
+        """
+        line_start = source.rfind('\n', 0, self.start) + 1
+        line_end = source.find('\n', self.end)
+        line_end = len(source) if line_end == -1 else line_end + 1
+        rest = source[self.end:line_end].strip()
+        if source[line_start:self.start].strip() or (rest and not rest.startswith('//')):
+            return self.start, self.end
+        return line_start, line_end
+
+
+def _parse_call(source, name_start, name_end, comment_ends):
+    """Parse the call whose name spans source[name_start:name_end]"""
+    name = _WHITESPACE.sub('', source[name_start:name_end])
+    open_paren = source.index('(', name_end)
+
+    pieces = []
+    code_start = open_paren + 1
+    depth = 0
+    i = open_paren
+    close = len(source)
+    while True:
+        m = _ARG_EVENTS.search(source, i)
+        if m is None:
+            break
+        token = m.group()
+        if token[0] in _STRING_STARTS:
+            end = skip_string(source, m.start())
+            if depth == 1:
+                pieces.append(('code', source[code_start:m.start()]))
+                pieces.append(('string', (_string_body(source, m.start(), end),
+                                          _string_body(source, m.start(), end, interpolations=False))))
+                code_start = end
+            i = end
+        elif token[0] == '/':
+            end = skip_comment(source, m.start())
+            pieces.append(('code', source[code_start:m.start()]))
+            code_start = i = end
+        elif token in _OPENING:
+            depth += 1
+            i = m.end()
+        else:
+            depth -= 1
+            i = m.end()
+            if depth == 0:
+                close = i
+                pieces.append(('code', source[code_start:m.start()]))
+                break
+
+    # Fold the arguments onto one line, merging adjacent string literals
+    canonical = _fold(name, [(kind, text[0] if kind == 'string' else text) for kind, text in pieces])
+    message = _fold(name, [(kind, text[1] if kind == 'string' else text) for kind, text in pieces])
+
+    # A whole statement starts after ; { } (or the file start) and ends with ;
+    j = name_start - 1
+    while j >= 0:
+        if source[j].isspace():
+            j -= 1
+        elif j + 1 in comment_ends:
+            j = comment_ends[j + 1] - 1
+        else:
+            break
+    after = _TRIVIA.match(source, close).end()
+    statement = (j < 0 or source[j] in ';{}') and source.startswith(';', after)
+    end = after + 1 if statement else close
+
+    return DartCall(name, name_start, end, statement, canonical, message)
+
+
+def mask_source(source, strings=True):
+    """Return source with every string literal and comment blanked out.
+
+    Offsets and line breaks are kept, so positions found in the masked text
+    (bracket matching, keywords) apply to the original as they are. With
+    strings=False only the comments are blanked.
+    """
+    pieces = []
+    position = 0
+    while True:
+        m = _LITERAL_EVENTS.search(source, position)
+        if m is None:
+            break
+        if m.group()[0] in _STRING_STARTS:
+            end = skip_string(source, m.start())
+            if not strings:
+                pieces.append(source[position:end])
+                position = end
+                continue
+        else:
+            end = skip_comment(source, m.start())
+        pieces.append(source[position:m.start()])
+        pieces.append(_NOT_NEWLINE.sub(' ', source[m.start():end]))
+        position = end
+    pieces.append(source[position:])
+    return ''.join(pieces)
+
+
+def is_string_literal(text):
+    """Check if text is one string literal, or several adjacent ones, and nothing else"""
+    i = _TRIVIA.match(text).end()
+    if i == len(text):
+        return False
+    while i < len(text):
+        if text[i] not in _STRING_STARTS or (text[i] in 'rR' and text[i + 1:i + 2] not in ('"', "'")):
+            return False
+        i = _TRIVIA.match(text, skip_string(text, i)).end()
+    return True
+
+
+def is_part_file(source):
+    """Check if the file is a 'part of' another library (and so can't import anything)"""
+    return _PART_OF.search(source) is not None
+
+
+def _visible_names(clauses, names):
+    """The names out of names an import's show/hide combinators let through"""
+    visible = set(names)
+    for keyword, listed in _COMBINATOR.findall(clauses):
+        listed = {name.strip() for name in listed.split(',')}
+        visible = visible & listed if keyword == 'show' else visible - listed
+    return visible
+
+
+def add_import(source, uri, names=(), exporters=()):
+    """Return source with names from uri in scope, adding or widening an import only if needed.
+
+    An unprefixed import of uri, or of a library in exporters that re-exports
+    it, already provides whatever its show/hide combinators let through. For
+    names still missing a lone show list on uri's import is extended;
+    otherwise an unrestricted import goes after the other directives.
+    """
+    missing = set(names)
+    imported = False
+    show = None
+    for m in _IMPORT_URI.finditer(source):
+        clauses = m.group('clauses')
+        if m.group('uri') not in (uri, *exporters) or _IMPORT_PREFIX.search(clauses):
+            continue
+        imported = True
+        missing -= _visible_names(clauses, names)
+        combinators = _COMBINATOR.findall(clauses)
+        if m.group('uri') == uri and len(combinators) == 1 and combinators[0][0] == 'show':
+            show = m
+    if imported and not missing:
+        return source
+
+    if show is not None:
+        end = show.start('clauses') + _COMBINATOR.search(show.group('clauses')).end()
+        added = ''.join(f", {name}" for name in names if name in missing)
+        return source[:end] + added + source[end:]
+
+    directive = f"import '{uri}';\n"
+    last = None
+    for last in _IMPORT.finditer(source):
+        pass
+    if last is None:
+        return directive + source
+    end = last.end()
+    if not source[last.start():end].endswith('\n'):
+        directive = '\n' + directive
+    return source[:end] + directive + source[end:]
+
+
+def may_contain_calls(data):
+    """Cheap check on undecoded bytes: False means iter_calls would find nothing"""
+    return any(needle in data for needle in _CALL_NEEDLES)
+
+
+def iter_calls(source):
+    """Yield a DartCall for every print/console.log call outside strings and comments"""
+    comment_ends = {}
+    i = 0
+    while True:
+        m = _CODE_EVENTS.search(source, i)
+        if m is None:
+            return
+        if m.lastgroup == 'string':
+            i = skip_string(source, m.start())
+        elif m.lastgroup == 'comment':
+            i = skip_comment(source, m.start())
+            comment_ends[i] = m.start()
+        else:
+            call = _parse_call(source, m.start(), m.end(), comment_ends)
+            yield call
+            i = call.end
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Source Transforms for the Woosh Dart Maintenance Scripts
+Runs several rewrites of a Dart file (debug print removal, package import
+renames, ...) one after another on a single decoded copy, so each file is read
+and written once however many transforms there are
+"""
+
+import re
+
+from dart_scanner import mask_source, may_contain_calls
+
+# import/export/part directives, found in source with its comments and strings blanked
+_DIRECTIVE = re.compile(r'^[ \t]*(?:import|export|part)\b[^;]*;', re.M)
+_URI = re.compile(r"""(['"])([^'"\n]*)\1""")
+
+
+class Transform:
+    """One rewrite in the pipeline.
+
+    apply returns the new source and one JSON-ready record per change,
+    with line numbers in the source it was given.
+    """
+
+    name = None
+    # What gets changed and how, for reports ("Renamed 12 package imports")
+    noun = "changes"
+    verb = "made"
+
+    def may_apply(self, data):
+        """Cheap check on the file's bytes; False means apply would change nothing"""
+        return True
+
+    def apply(self, content, file_path=None, findings=None):
+        """Return (new source, change records)"""
+        raise NotImplementedError
+
+
+class ImportRewrite(Transform):
+    """Point import, export and part URIs at a renamed package.
+
+    package:OLD/... becomes package:NEW/..., and so does a relative URI whose
+    first directory (after any ../) is OLD, as update_imports.sh did.
+    """
+
+    name = "imports"
+    noun = "package imports"
+    verb = "renamed"
+
+    def __init__(self, old, new):
+        self.old = old
+        self.new = new
+        self.needle = old.encode('utf-8')
+
+    def may_apply(self, data):
+        return self.needle in data
+
+    def rename(self, uri):
+        """The URI pointing at the new package, or None if it doesn't refer to the old one"""
+        if uri.startswith(f'package:{self.old}/'):
+            return f'package:{self.new}/' + uri[len(self.old) + 9:]
+        segments = uri.split('/')
+        i = 0
+        while i < len(segments) - 1 and segments[i] in ('.', '..'):
+            i += 1
+        if i < len(segments) - 1 and segments[i] == self.old:
+            segments[i] = self.new
+            return '/'.join(segments)
+        return None
+
+    def apply(self, content, file_path=None, findings=None):
+        masked = mask_source(content)
+        edits = []
+        records = []
+        for directive in _DIRECTIVE.finditer(masked):
+            renamed = []
+            for m in _URI.finditer(content, directive.start(), directive.end()):
+                uri = self.rename(m.group(2))
+                if uri is not None:
+                    renamed.append((m.start(2), m.end(2), uri))
+            if not renamed:
+                continue
+            edits.extend(renamed)
+            line = content.count('\n', 0, directive.start()) + 1
+            records.append({
+                'file': str(file_path),
+                'line': line,
+                'column': 1,
+                'end_line': line + content.count('\n', directive.start(), directive.end()),
+                'rule': 'rename-package',
+                'category': 'imports',
+                'severity': 'info',
+                'action': 'rewrite',
+                'text': content[directive.start():directive.end()].strip(),
+                'replacement': ', '.join(uri for _, _, uri in renamed),
+            })
+        if not edits:
+            return content, []
+        pieces = []
+        position = 0
+        for start, end, uri in edits:
+            pieces.append(content[position:start])
+            pieces.append(uri)
+            position = end
+        pieces.append(content[position:])
+        return ''.join(pieces), records
+
+
+class PrintRemoval(Transform):
+    """The cleaner's own job: remove (or guard) the debug prints its rules match"""
+
+    name = "prints"
+    noun = "debug lines"
+    verb = "removed"
+
+    def __init__(self, cleaner):
+        self.cleaner = cleaner
+
+    def may_apply(self, data):
+        return may_contain_calls(data)
+
+    def apply(self, content, file_path=None, findings=None):
+        leaks = [] if findings is not None else None
+        removals = list(self.cleaner.find_debug_calls(content, file_path, leaks))
+        if leaks:
+            findings.extend(self.cleaner.leak_records(content, leaks, removals))
+        if not removals:
+            return content, []
+        cleaned, _ = self.cleaner.clean_source(content, removals, file_path, findings)
+        return cleaned, list(self.cleaner.removal_records(file_path, content, removals, leaks or ()))
+
+
+class TransformPipeline:
+    """Transforms applied in order to one decoded copy of each file"""
+
+    def __init__(self, transforms):
+        self.transforms = list(transforms)
+
+    @property
+    def names(self):
+        """Names of the transforms, in order"""
+        return [transform.name for transform in self.transforms]
+
+    def extra(self):
+        """The transforms other than print removal, which the cleaners report on their own"""
+        return [transform for transform in self.transforms if transform.name != PrintRemoval.name]
+
+    def apply(self, data, file_path=None, findings=None):
+        """Run every transform that may apply to data (the file's bytes).
+
+        Returns (the new source, or None if no transform applied, and the
+        change records per transform name). The file is decoded once, and
+        only if some transform may apply.
+        """
+        changes = {transform.name: [] for transform in self.transforms}
+        active = [transform for transform in self.transforms if transform.may_apply(data)]
+        if not active:
+            return None, changes
+        content = data.decode('utf-8')
+        for transform in active:
+            content, records = transform.apply(content, file_path, findings)
+            changes[transform.name].extend(records)
+        return content, changes
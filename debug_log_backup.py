@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Backup Store for the Woosh Debug Log Cleanup Scripts
+Keeps every cleanup run restorable while storing each file version only once
+"""
+
+import argparse
+import hashlib
+import json
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from debug_log_files import atomic_write, run_cli
+
+
+class BackupStore:
+    """Backups as zlib-compressed blobs keyed by SHA-256, plus one manifest per run.
+
+    Layout::
+
+        <root>/objects/ab/cdef...   compressed file contents
+        <root>/runs/<run id>.json   path -> blob hash for one cleanup run
+
+    A file that hasn't changed since an earlier run costs one hash and no
+    write, so backing up the whole target set is about as cheap as hashing it.
+    """
+
+    def __init__(self, root, compress=True):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.runs_dir = self.root / "runs"
+        self.compress = compress
+
+    def _object_path(self, digest):
+        """Path of the blob for a content hash"""
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put(self, data):
+        """Store bytes, return (hash, True if a new blob was written)"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, zlib.compress(data) if self.compress else data)
+        return digest, True
+
+    def get(self, digest):
+        """Return the bytes stored under a content hash"""
+        with open(self._object_path(digest), 'rb') as f:
+            payload = f.read()
+        # Blobs written with compress=False are stored as-is
+        try:
+            data = zlib.decompress(payload)
+        except zlib.error:
+            data = payload
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt backup object {digest}")
+        return data
+
+    def new_run_id(self):
+        """Timestamp run id, suffixed when two runs start within the same second"""
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        candidate = run_id
+        counter = 1
+        while (self.runs_dir / f"{candidate}.json").exists():
+            candidate = f"{run_id}_{counter:02d}"
+            counter += 1
+        return candidate
+
+    def backup(self, paths, on_file=None):
+        """Store the given files as a new run and return (run id, new blob count).
+
+        Without any files no run is created and the run id is None.
+        """
+        files = {}
+        new_blobs = 0
+        for path in paths:
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest, created = self.put(data)
+            files[str(path)] = {'sha256': digest, 'size': len(data)}
+            new_blobs += created
+            if on_file:
+                on_file(path, created)
+        if not files:
+            return None, 0
+
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        run_id = self.new_run_id()
+        manifest = {
+            'id': run_id,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'files': files,
+        }
+        atomic_write(self.runs_dir / f"{run_id}.json",
+                     json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+        return run_id, new_blobs
+
+    def runs(self):
+        """Manifests of every stored run, oldest first"""
+        if not self.runs_dir.exists():
+            return []
+        manifests = []
+        for path in sorted(self.runs_dir.glob("*.json")):
+            with open(path, 'r', encoding='utf-8') as f:
+                manifests.append(json.load(f))
+        return manifests
+
+    def load_run(self, run_id):
+        """Manifest of one run"""
+        path = self.runs_dir / f"{run_id}.json"
+        if not path.exists():
+            raise FileNotFoundError(f"No backup run {run_id} in {self.root}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def restore(self, run_id, only=None):
+        """Write the files of a run back in place, optionally only some paths"""
+        manifest = self.load_run(run_id)
+        restored = []
+        for path, entry in manifest['files'].items():
+            if only and path not in only:
+                continue
+            atomic_write(path, self.get(entry['sha256']))
+            restored.append(path)
+        return restored
+
+    def discard(self, run_id):
+        """Drop one run (e.g. one that turned out to change nothing) and the blobs only it used"""
+        (self.runs_dir / f"{run_id}.json").unlink()
+        return self.remove_unreferenced()
+
+    def prune(self, keep):
+        """Drop all but the newest `keep` runs (at least one) and the blobs only they used"""
+        if keep < 1:
+            raise ValueError("prune must keep at least one run")
+        manifests = self.runs()
+        dropped = manifests[:-keep]
+        for manifest in dropped:
+            (self.runs_dir / f"{manifest['id']}.json").unlink()
+        return len(dropped), self.remove_unreferenced()
+
+    def remove_unreferenced(self):
+        """Delete the blobs no run refers to; return how many went"""
+        live = {entry['sha256'] for manifest in self.runs() for entry in manifest['files'].values()}
+        removed_blobs = 0
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*"):
+                if path.parent.name + path.name not in live:
+                    path.unlink()
+                    removed_blobs += 1
+        return removed_blobs
+
+
+def positive_int(value):
+    """Parse a count of at least 1 for argparse"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Manage debug log cleanup backups")
+    parser.add_argument("--backup-dir", default="backup_debug_logs_advanced",
+                        help="backup store to use (default: backup_debug_logs_advanced)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="list stored runs")
+
+    restore = subparsers.add_parser("restore", help="restore the files of a run")
+    restore.add_argument("--run", required=True, help="run id (see 'list')")
+    restore.add_argument("paths", nargs="*", help="only restore these files (as listed in the run)")
+
+    prune = subparsers.add_parser("prune", help="delete old runs and unreferenced blobs")
+    prune.add_argument("--keep", type=positive_int, default=10, help="number of newest runs to keep (default: 10)")
+
+    args = parser.parse_args()
+    store = BackupStore(args.backup_dir)
+
+    if args.command == "list":
+        runs = store.runs()
+        if not runs:
+            print(f"⚠️  No backup runs in {store.root}")
+        for manifest in runs:
+            print(f"   {manifest['id']}  {manifest['created']}  {len(manifest['files'])} files")
+
+    elif args.command == "restore":
+        try:
+            restored = store.restore(args.run, set(args.paths))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            return 1
+        for path in restored:
+            print(f"   ✅ Restored: {path}")
+        print(f"\n♻️  Restored {len(restored)} files from run {args.run}")
+
+    elif args.command == "prune":
+        runs, blobs = store.prune(args.keep)
+        print(f"🗑️  Removed {runs} runs and {blobs} unreferenced blobs")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_cli(main))
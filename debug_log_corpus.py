@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dart Corpus for the Woosh Debug Log Cleanup Benchmarks
+Generates Flutter-style sources at any multiple of lib/'s size, with print()
+calls in the styles lib/ uses (emoji prefixes, ?? markers, multi-line calls,
+interpolations) at the same density
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+from pathlib import Path
+
+from dart_scanner import iter_calls
+from debug_log_files import count_lines, run_cli, walk_files
+
+# Used when there is no lib/ to learn from; roughly what lib/ measured at
+DEFAULT_STATS = {
+    'file_lines': [40, 90, 150, 220, 300, 420, 600, 900, 1500],
+    'directories': ['pages', 'services', 'widgets', 'models', 'controllers', 'utils'],
+    'print_rate': 0.018,
+    'emoji': 0.35,
+    'markers': 0.04,
+    'interpolation': 0.75,
+    'multiline': 0.08,
+}
+DEFAULT_PREFIXES = ['🔍', '✅', '❌', '📡', '🔄', '📦', '💾', '📋', '⚠️', '🚀']
+DEFAULT_PHRASES = [
+    'Loading journey plans', 'Response received:', 'Failed to fetch clients:', 'Cached session data',
+    'Error parsing response:', 'Attempting to refresh token', 'Searching clients', 'Sync completed',
+    'REPORT DEBUG: ClientId:', 'Response status:', 'Creating new order', 'Error loading initial data:',
+]
+
+# Names the templates draw on
+ENTITIES = ['Client', 'Order', 'Product', 'Journey', 'Report', 'Session', 'Target', 'Leave', 'Outlet', 'Payment']
+FIELDS = ['id', 'name', 'status', 'quantity', 'price', 'createdAt', 'clientId', 'total']
+VARIABLES = ['e', 'response.statusCode', 'response.body', 'data', 'userId', 'items.length', 'result', 'key']
+
+_SKIP_IN_PHRASE = re.compile(r"""\$\{[^{}]*\}|\$\w+|['"\\$]""")
+_PREFIX = re.compile(r'^\s*([^\x00-\x7f]+|\?\?)\s*')
+
+# Each template is (name, lines); {E} is an entity, {e} its lower-case
+# form, {n} a number, {f} a field. A line reading @print marks where a debug
+# print may go, at that line's indentation; @print <expr> prints that value
+TEMPLATES = [
+    ('fetch', '''  Future<List<{E}>> fetch{E}s{n}() async {
+    @print
+    try {
+      final response = await http.get(
+        Uri.parse('$baseUrl/{e}s?page={n}'),
+        headers: {'Content-Type': 'application/json'},
+      );
+      @print response.statusCode
+      if (response.statusCode == 200) {
+        final List<dynamic> data = jsonDecode(response.body);
+        @print
+        return data.map((json) => {E}.fromJson(json)).toList();
+      }
+      throw Exception('Failed to load {e}s: ${response.statusCode}');
+    } catch (e) {
+      @print e
+      rethrow;
+    }
+  }
+'''),
+    ('build', '''  Widget build{E}Card{n}(BuildContext context, {E} {e}) {
+    @print
+    return Card(
+      margin: const EdgeInsets.symmetric(horizontal: 16, vertical: 8),
+      child: Padding(
+        padding: const EdgeInsets.all(12),
+        child: Column(
+          crossAxisAlignment: CrossAxisAlignment.start,
+          children: [
+            Text({e}.{f}.toString(), style: const TextStyle(fontWeight: FontWeight.bold)),
+            const SizedBox(height: 8),
+            Row(
+              children: [
+                Icon(Icons.store, color: Theme.of(context).primaryColor),
+                const SizedBox(width: 8),
+                Expanded(child: Text('${{e}.name}')),
+              ],
+            ),
+          ],
+        ),
+      ),
+    );
+  }
+'''),
+    ('loop', '''  double calculate{E}Total{n}(List<{E}> items) {
+    double total = 0;
+    for (final item in items) {
+      @print
+      if (item.quantity <= 0) {
+        continue;
+      }
+      total += item.price * item.quantity;
+    }
+    @print
+    return total;
+  }
+'''),
+    ('timed', '''  Future<void> sync{E}s{n}() async {
+    final stopwatch = Stopwatch()..start();
+    final pending = _box.values.where((item) => item.{f} != null).toList();
+    @print
+    for (final item in pending) {
+      await _api.upload{E}(item);
+      await _box.delete(item.id);
+    }
+    stopwatch.stop();
+    @print stopwatch.elapsedMilliseconds
+  }
+'''),
+    ('state', '''  Future<void> _refresh{E}s{n}() async {
+    setState(() {
+      _isLoading = true;
+    });
+    @print
+    try {
+      final results = await _service.fetch{E}s{n}();
+      if (!mounted) return;
+      setState(() {
+        _{e}s = results;
+        _isLoading = false;
+      });
+      @print
+    } catch (e) {
+      @print e
+      setState(() {
+        _error = e.toString();
+        _isLoading = false;
+      });
+    }
+  }
+'''),
+    ('model', '''  Map<String, dynamic> {e}ToJson{n}({E} {e}) {
+    final json = <String, dynamic>{
+      'id': {e}.id,
+      '{f}': {e}.{f},
+      'updatedAt': DateTime.now().toIso8601String(),
+    };
+    @print
+    return json;
+  }
+'''),
+]
+
+
+class CorpusModel:
+    """What generated files imitate: sizes, directories, print density and print styles"""
+
+    def __init__(self, stats, prefixes, phrases):
+        self.stats = stats
+        self.prefixes = prefixes
+        self.phrases = phrases
+
+    @classmethod
+    def from_tree(cls, root='.', include=('lib/**/*.dart',)):
+        """Measure the Dart files under root; the defaults if there are none"""
+        file_lines = []
+        directories = []
+        prefixes = []
+        phrases = set()
+        counts = {'prints': 0, 'emoji': 0, 'markers': 0, 'interpolation': 0, 'multiline': 0}
+        for path in walk_files(root, include):
+            source = path.read_text(encoding='utf-8', errors='replace')
+            file_lines.append(count_lines(source))
+            parts = Path(os.path.relpath(path, root)).parts
+            directories.append(parts[1] if len(parts) > 2 else '')
+            for call in iter_calls(source):
+                counts['prints'] += 1
+                counts['multiline'] += '\n' in source[call.start:call.end]
+                counts['interpolation'] += '$' in call.canonical
+                message = call.canonical[call.canonical.find("'") + 1:call.canonical.rfind("'")]
+                prefix = _PREFIX.match(message)
+                if prefix:
+                    marker = prefix.group(1)
+                    if marker == '??':
+                        counts['markers'] += 1
+                    else:
+                        counts['emoji'] += 1
+                        prefixes.append(marker)
+                    message = message[prefix.end():]
+                phrase = ' '.join(_SKIP_IN_PHRASE.sub('', message).split())
+                if 3 < len(phrase) <= 60:
+                    phrases.add(phrase)
+        if not file_lines or not counts['prints']:
+            return cls.default()
+
+        prints = counts.pop('prints')
+        stats = {name: round(count / prints, 3) for name, count in counts.items()}
+        stats['file_lines'] = sorted(file_lines)
+        stats['directories'] = sorted(directories)
+        stats['print_rate'] = round(prints / sum(file_lines), 4)
+        return cls(stats, prefixes or DEFAULT_PREFIXES, sorted(phrases) or DEFAULT_PHRASES)
+
+    @classmethod
+    def default(cls):
+        """Built-in model, for when there is no lib/ to measure"""
+        return cls(dict(DEFAULT_STATS), DEFAULT_PREFIXES, DEFAULT_PHRASES)
+
+    def render_print(self, rng, indent, value=None):
+        """One debug print statement in a style drawn from the measured mix, optionally showing value"""
+        roll = rng.random()
+        if roll < self.stats['emoji']:
+            prefix = rng.choice(self.prefixes) + ' '
+        elif roll < self.stats['emoji'] + self.stats['markers']:
+            prefix = '?? '
+        else:
+            prefix = ''
+        message = prefix + rng.choice(self.phrases)
+        if value or rng.random() < self.stats['interpolation']:
+            variable = value or rng.choice(VARIABLES)
+            message += f' ${variable}' if re.fullmatch(r'\w+', variable) else f' ${{{variable}}}'
+
+        if rng.random() >= self.stats['multiline']:
+            return f"{indent}print('{message}');"
+        if rng.random() < 0.5:
+            # The formatter's wrap: the argument on its own line
+            return f"{indent}print(\n{indent}    '{message}');"
+        # Adjacent literals, split between words
+        head, _, tail = message.rpartition(' ')
+        if not head:
+            return f"{indent}print(\n{indent}    '{message}');"
+        return f"{indent}print('{head} '\n{indent}    '{tail}');"
+
+    def render_file(self, rng, index, target_lines):
+        """Source of one generated file of about target_lines lines"""
+        entity = rng.choice(ENTITIES)
+        lines = [
+            "import 'dart:convert';",
+            "import 'package:flutter/material.dart';",
+            "import 'package:http/http.dart' as http;",
+            "",
+            f"class {entity}Feature{index} extends StatefulWidget {{",
+            f"  const {entity}Feature{index}({{super.key}});",
+            "",
+            "  @override",
+            f"  State<{entity}Feature{index}> createState() => _{entity}Feature{index}State();",
+            "}",
+            "",
+            f"class _{entity}Feature{index}State extends State<{entity}Feature{index}> {{",
+            "  final String baseUrl = 'https://api.example.com';",
+            "  bool _isLoading = false;",
+            "  String? _error;",
+            "",
+        ]
+        n = 0
+        rate = self.stats['print_rate']
+        while True:
+            n += 1
+            _, template = rng.choice(TEMPLATES)
+            entity = rng.choice(ENTITIES)
+            text = (template.replace('{E}', entity).replace('{e}', entity[0].lower() + entity[1:])
+                    .replace('{n}', str(n)).replace('{f}', rng.choice(FIELDS)))
+            body = text.splitlines()
+            if n > 1 and len(lines) + len(body) // 2 >= target_lines:
+                break
+            slots = sum(1 for line in body if line.strip().startswith('@print'))
+            # Fill slots so prints make up lib/'s share of the lines (the blank line included)
+            chance = min(1.0, rate * (len(body) - slots + 1) / ((1 - rate) * max(1, slots)))
+            for line in body:
+                stripped = line.strip()
+                if not stripped.startswith('@print'):
+                    lines.append(line)
+                elif rng.random() < chance:
+                    indent = line[:len(line) - len(line.lstrip())]
+                    lines.append(self.render_print(rng, indent, stripped[len('@print'):].strip() or None))
+            lines.append('')
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+
+def generate_corpus(out_dir, scale=1.0, seed=0, model=None):
+    """Write about scale times lib/'s files and lines under out_dir/lib; return what was written.
+
+    File i is the same whatever the scale, so a 10x corpus contains the 1x one.
+    """
+    model = CorpusModel.from_tree() if model is None else model
+    out_dir = Path(out_dir)
+    file_lines = model.stats['file_lines']
+    directories = model.stats['directories'] or ['']
+    count = max(1, round(len(file_lines) * scale))
+
+    stats = {'files': 0, 'lines': 0, 'prints': 0, 'bytes': 0}
+    for index in range(count):
+        rng = random.Random(f'{seed}:{index}')
+        directory = out_dir / 'lib' / rng.choice(directories) / f'part{index // 500}'
+        directory.mkdir(parents=True, exist_ok=True)
+        source = model.render_file(rng, index, rng.choice(file_lines))
+        data = source.encode('utf-8')
+        (directory / f'generated_{index}.dart').write_bytes(data)
+        stats['files'] += 1
+        stats['lines'] += count_lines(source)
+        stats['prints'] += len(re.findall(r'(?<![\w.])print\(', source))
+        stats['bytes'] += len(data)
+    return stats
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Dart corpus modelled on lib/")
+    parser.add_argument("out_dir", help="directory to write (files go under OUT_DIR/lib)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiple of lib/'s size (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--model", default=".", help="project whose lib/ is imitated (default: .)")
+    args = parser.parse_args()
+
+    stats = generate_corpus(args.out_dir, args.scale, args.seed, CorpusModel.from_tree(args.model))
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_cli(main))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Log-Only Code Finder for the Woosh Debug Log Cleanup Scripts
+Finds the locals, Stopwatches and catch blocks that only existed to feed the
+print calls a cleanup removes, so they can go (or be reviewed) with them
+"""
+
+import bisect
+import re
+
+from dart_scanner import mask_source
+
+# Calls that only build a value. An initializer made of nothing else can be
+# dropped together with the prints that read it; anything else is reported
+PURE_CALLS = {
+    'jsonEncode', 'encode', 'convert', 'withIndent', 'toString', 'toStringAsFixed',
+    'toIso8601String', 'toList', 'toSet', 'map', 'where', 'join', 'substring',
+    'split', 'trim', 'replaceAll', 'toLowerCase', 'toUpperCase', 'contains',
+    'now', 'difference', 'Stopwatch', 'padLeft', 'padRight',
+}
+
+# The only things a Stopwatch nobody reads gets used for
+STOPWATCH_CALLS = ('start', 'stop', 'reset')
+
+# Words that can precede "name =" at the start of a statement without declaring anything
+_NOT_TYPES = {'return', 'await', 'throw', 'yield', 'else', 'case', 'if', 'assert', 'new'}
+
+_TYPE = r'[A-Za-z_$][\w$.]*(?:<[^;{}()=]*>)?\??'
+_DECLARATION = re.compile(
+    rf'^[ \t]*(?P<declaration>(?:late\s+)?(?:(?:final|var|const)(?:\s+{_TYPE})?|(?P<type>{_TYPE}))'
+    r'\s+(?P<name>[A-Za-z_$][\w$]*)\s*=(?![=>]))', re.M)
+_CALL = re.compile(r'([A-Za-z_$][\w$]*)\s*(?:<[^<>;()]*>)?\s*\(')
+_INTERPOLATION = re.compile(r'\$\{([^{}]*)\}')
+_ASSIGNMENT = re.compile(r'(?<![=!<>])=(?![=>])|\+\+|--|\bawait\b')
+_STOPWATCH = re.compile(r'\s*Stopwatch\s*\(\s*\)\s*(?:\.\.\s*start\s*\(\s*\)\s*)?$')
+_BRACKETS = re.compile(r'[(){}\[\];,]')
+_BLOCK_HEADER_WORDS = ('async', 'async*', 'sync*', 'else', 'do', 'try', 'finally')
+_CATCH_HEADER = re.compile(r'\bcatch\s*\([^()]*\)$')
+
+
+def _line_number(line_starts, position):
+    """1-based line of an offset"""
+    return bisect.bisect_right(line_starts, position)
+
+
+def _blocks(masked):
+    """Map the offset of every { to the offset of its }, plus a sorted list of the { offsets"""
+    pairs = {}
+    stack = []
+    for m in re.finditer(r'[{}]', masked):
+        if m.group() == '{':
+            stack.append(m.start())
+        elif stack:
+            pairs[stack.pop()] = m.start()
+    return pairs, sorted(pairs)
+
+
+def _enclosing_block(pairs, opens, position):
+    """Offset of the innermost { whose block contains position, or None"""
+    index = bisect.bisect_left(opens, position) - 1
+    while index >= 0:
+        start = opens[index]
+        if pairs[start] > position:
+            return start
+        index -= 1
+    return None
+
+
+def _is_code_block(masked, brace):
+    """Check if the block opened at masked[brace] is a function body or a statement block"""
+    header = masked[max(0, brace - 100):brace].rstrip()
+    return header.endswith(')') or header.endswith(_BLOCK_HEADER_WORDS)
+
+
+def _statement_end(masked, start):
+    """Offset of the ; ending the expression that starts at masked[start], or -1.
+
+    A , at the top level (final a = 1, b = 2;) also gives -1.
+    """
+    depth = 0
+    for m in _BRACKETS.finditer(masked, start):
+        token = m.group()
+        if token in '([{':
+            depth += 1
+        elif token in ';,':
+            if depth == 0:
+                return m.start() if token == ';' else -1
+        else:
+            depth -= 1
+            if depth < 0:
+                return -1
+    return -1
+
+
+def _whole_lines(source, start, end):
+    """The span of the lines from start to end if nothing else (but a comment) shares them, else None"""
+    line_start = source.rfind('\n', 0, start) + 1
+    line_end = source.find('\n', end)
+    line_end = len(source) if line_end == -1 else line_end + 1
+    rest = source[end:line_end].strip()
+    if source[line_start:start].strip() or (rest and not rest.startswith('//')):
+        return None
+    return line_start, line_end
+
+
+def is_pure(initializer):
+    """Check if evaluating an initializer can't have side effects worth keeping"""
+    code = mask_source(initializer)
+    pieces = [code] + _INTERPOLATION.findall(initializer)
+    for piece in pieces:
+        if _ASSIGNMENT.search(piece.replace('=>', '  ')):
+            return False
+        if any(name not in PURE_CALLS for name in _CALL.findall(piece)):
+            return False
+    return True
+
+
+class _Declaration:
+    """A single-variable local declaration and where its scope ends"""
+
+    __slots__ = ('name', 'start', 'end', 'initializer', 'scope_end', 'stopwatch')
+
+    def __init__(self, name, start, end, initializer, scope_end):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.initializer = initializer
+        self.scope_end = scope_end
+        self.stopwatch = _STOPWATCH.match(initializer) is not None
+
+
+def find_declarations(source, masked=None):
+    """Yield every single-variable local declaration (final x = ...;) in a code block"""
+    masked = mask_source(source) if masked is None else masked
+    pairs, opens = _blocks(masked)
+    for m in _DECLARATION.finditer(masked):
+        type_name = m.group('type')
+        if type_name in _NOT_TYPES:
+            continue
+        before = masked[max(0, m.start() - 200):m.start()].rstrip()
+        if before and before[-1] not in ';{}':
+            continue
+        block = _enclosing_block(pairs, opens, m.start())
+        if block is None or not _is_code_block(masked, block):
+            continue
+        end = _statement_end(masked, m.end())
+        if end == -1 or end > pairs[block]:
+            continue
+        yield _Declaration(m.group('name'), m.start('declaration'), end + 1,
+                           source[m.end():end], pairs[block])
+
+
+def _dead(spans, position):
+    """Check if position falls inside one of the sorted, non-overlapping spans"""
+    index = bisect.bisect_right(spans, (position, float('inf'))) - 1
+    return index >= 0 and spans[index][0] <= position < spans[index][1]
+
+
+def _live_text(text, spans, start, end):
+    """text[start:end] without the parts inside the sorted spans"""
+    pieces = []
+    for span_start, span_end in spans:
+        if span_end <= start:
+            continue
+        if span_start >= end:
+            break
+        pieces.append(text[start:max(start, span_start)])
+        start = max(start, span_end)
+    pieces.append(text[start:end])
+    return ''.join(pieces)
+
+
+def find_log_only_code(source, spans):
+    """Find the code that only fed the spans being deleted.
+
+    ``spans`` are the (start, end) ranges the cleanup removes. Returns
+    (extra spans to delete, findings). Findings are dicts with line, kind
+    ('local', 'stopwatch' or 'empty-catch'), name, action ('remove' or
+    'report') and text. A local goes when nothing outside the deleted spans
+    reads it and its initializer is pure; one that is read only by removed
+    code but may have side effects (await, unknown calls) is reported. A
+    Stopwatch goes, start/stop calls and all, only if a removed print read it.
+    Catch blocks left empty are reported, never changed.
+    """
+    masked = mask_source(source)
+    line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+    declarations = list(find_declarations(source, masked))
+    dead = sorted(spans)
+    extra = []
+    findings = []
+    reported = set()
+
+    changed = True
+    while changed:
+        changed = False
+        for declaration in declarations:
+            if declaration in reported or _dead(dead, declaration.start):
+                continue
+            reference = re.compile(rf'(?<![\w.]){re.escape(declaration.name)}(?![\w$])')
+            live = []
+            read_by_dead = False
+            for m in reference.finditer(source, declaration.end, declaration.scope_end):
+                if _dead(dead, m.start()):
+                    read_by_dead = True
+                else:
+                    live.append(m.start())
+
+            # A Stopwatch that is only started and stopped measures nothing
+            statements = []
+            if declaration.stopwatch:
+                timing = re.compile(rf'{re.escape(declaration.name)}\s*\.\s*(?:{"|".join(STOPWATCH_CALLS)})'
+                                    r'\s*\(\s*\)\s*;')
+                for position in live:
+                    call = timing.match(source, position)
+                    span = _whole_lines(source, position, call.end()) if call else None
+                    if span is None:
+                        break
+                    statements.append(span)
+                else:
+                    live = []
+            if live or not read_by_dead:
+                continue
+
+            kind = 'stopwatch' if declaration.stopwatch else 'local'
+            span = _whole_lines(source, declaration.start, declaration.end)
+            finding = {
+                'line': _line_number(line_starts, declaration.start),
+                'kind': kind,
+                'name': declaration.name,
+                'text': source[declaration.start:declaration.end],
+            }
+            if span is None or not (declaration.stopwatch or is_pure(declaration.initializer)):
+                finding['action'] = 'report'
+                reported.add(declaration)
+            else:
+                finding['action'] = 'remove'
+                extra.extend([span] + statements)
+                dead = sorted(dead + [span] + statements)
+                changed = True
+            findings.append(finding)
+
+    # Catch blocks whose whole body was deleted now swallow errors silently
+    pairs, opens = _blocks(masked)
+    catches = {}
+    for start, _ in spans:
+        block = _enclosing_block(pairs, opens, start)
+        if block is None or block in catches:
+            continue
+        header = masked[max(0, block - 200):block].rstrip()
+        catch = _CATCH_HEADER.search(header)
+        if catch is None:
+            continue
+        if not _live_text(masked, dead, block + 1, pairs[block]).strip():
+            catches[block] = {
+                'line': _line_number(line_starts, block),
+                'kind': 'empty-catch',
+                'name': None,
+                'action': 'report',
+                'text': catch.group(),
+            }
+    findings.extend(catches.values())
+    findings.sort(key=lambda finding: finding['line'])
+    return sorted(extra), findings
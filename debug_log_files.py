@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Target File Discovery for the Woosh Debug Log Cleanup Scripts
+Walks the project once with os.scandir, honouring include/exclude globs and .gitignore,
+and rewrites files atomically so an interrupted run never leaves a truncated source;
+also home to run_cli, which every script's entry point goes through
+"""
+
+import os
+import re
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+# Glob used when the caller asks for discovery without naming any pattern
+DEFAULT_INCLUDE = ('lib/**/*.dart',)
+
+# Never worth descending into, wherever they appear
+PRUNED_DIRS = {'.git', '.dart_tool', 'build', '.idea', '.vs', '.vscode', '.fvm',
+               '.pub-cache', 'node_modules', '__pycache__'}
+
+# Platform runners generated by Flutter, pruned at the project root
+PLATFORM_DIRS = {'android', 'ios', 'linux', 'macos', 'windows', 'web'}
+
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+
+def glob_to_regex(pattern):
+    """Translate a glob (with ** for any number of directories) into a regex"""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**/', i):
+                out.append('(?:.*/)?')
+                i += 3
+            elif pattern.startswith('**', i):
+                out.append('.*')
+                i += 2
+            else:
+                out.append('[^/]*')
+                i += 1
+        elif c == '?':
+            out.append('[^/]')
+            i += 1
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            j = pattern.find(']', j)
+            if j == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:j].replace('\\', '\\\\')
+                if body[:1] == '!':
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = j + 1
+        elif c == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return ''.join(out)
+
+
+def compile_globs(patterns):
+    """One regex matching any of the globs, or None for an empty list"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{glob_to_regex(p)})' for p in patterns) + r'\Z')
+
+
+def static_prefix(pattern):
+    """Leading directories of a glob that contain no wildcards"""
+    parts = []
+    for part in pattern.split('/')[:-1]:
+        if _GLOB_CHARS.search(part):
+            break
+        parts.append(part)
+    return '/'.join(parts)
+
+
+class GitIgnore:
+    """The rules of one .gitignore file, relative to the directory holding it"""
+
+    def __init__(self, lines, base=''):
+        self.rules = []
+        prefix = f'{re.escape(base)}/' if base else ''
+        for line in lines:
+            line = line.rstrip('\n').rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negate = line.startswith('!')
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            # A slash anywhere but the end anchors the pattern to this directory
+            if '/' in line:
+                regex = prefix + glob_to_regex(line.lstrip('/'))
+            else:
+                regex = prefix + '(?:.*/)?' + glob_to_regex(line)
+            self.rules.append((re.compile(regex + r'\Z'), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory, base=''):
+        """Rules from directory/.gitignore, or None if it has none"""
+        try:
+            with open(os.path.join(directory, '.gitignore'), 'r', encoding='utf-8') as f:
+                return cls(f, base)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def match(self, path, is_dir):
+        """True/False if a rule decides the path (last match wins), else None"""
+        decision = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(path):
+                decision = not negate
+        return decision
+
+
+def _is_ignored(ignores, path, is_dir):
+    """Apply the .gitignore files from the root down; the deepest decision wins"""
+    ignored = False
+    for ignore in ignores:
+        decision = ignore.match(path, is_dir)
+        if decision is not None:
+            ignored = decision
+    return ignored
+
+
+def walk_files(root='.', include=DEFAULT_INCLUDE, exclude=(), use_gitignore=True):
+    """Yield matching files under root as Paths, in sorted order, in one pass.
+
+    Globs are matched against '/'-separated paths relative to root. Build
+    output, tool caches and platform runners are pruned before they are
+    read, and so are directories that no include glob can reach.
+    """
+    root = str(root)
+    include_re = compile_globs(include)
+    exclude_re = compile_globs(exclude)
+    prefixes = {static_prefix(pattern) for pattern in include}
+
+    def reachable(rel_dir):
+        for prefix in prefixes:
+            if (not prefix or rel_dir == prefix or rel_dir.startswith(prefix + '/')
+                    or prefix.startswith(rel_dir + '/')):
+                return True
+        return False
+
+    root_ignore = GitIgnore.load(root) if use_gitignore else None
+    stack = [('', (root_ignore,) if root_ignore else ())]
+    while stack:
+        rel_dir, ignores = stack.pop()
+        directory = os.path.join(root, rel_dir) if rel_dir else root
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in PRUNED_DIRS or (not rel_dir and entry.name in PLATFORM_DIRS):
+                    continue
+                if not reachable(rel_path):
+                    continue
+                if exclude_re and exclude_re.match(rel_path + '/'):
+                    continue
+                if ignores and _is_ignored(ignores, rel_path, True):
+                    continue
+                subdirs.append(rel_path)
+            elif entry.is_file():
+                if not include_re.match(rel_path):
+                    continue
+                if exclude_re and exclude_re.match(rel_path):
+                    continue
+                if ignores and _is_ignored(ignores, rel_path, False):
+                    continue
+                yield Path(root, rel_path) if root != '.' else Path(rel_path)
+
+        # Depth-first in name order; nested .gitignore files extend the rules
+        for rel_path in reversed(subdirs):
+            nested = GitIgnore.load(os.path.join(root, rel_path), rel_path) if use_gitignore else None
+            stack.append((rel_path, ignores + (nested,) if nested else ignores))
+
+
+def count_lines(data):
+    """Number of lines as readlines() would report them, for bytes or str"""
+    newline = b'\n' if isinstance(data, bytes) else '\n'
+    return data.count(newline) + (1 if data and not data.endswith(newline) else 0)
+
+
+def _fsync_directory(directory):
+    """Flush a directory entry so a rename inside it survives a power loss"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data):
+    """Replace path with data so readers only ever see the old or the new file.
+
+    The bytes go to a temporary file in the same directory, are fsynced, and
+    are moved into place with os.replace; the file's permissions are kept.
+    If anything fails (including Ctrl-C) the original is left untouched and
+    the temporary file is removed.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or '.'
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            # New file: the permissions open() would have given it
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def run_cli(main):
+    """Run a command-line main() and return its exit status, stopping quietly if stdout's reader goes away.
+
+    Output piped into head or less loses its reader early; the rest of it
+    then goes to /dev/null so the flush at exit can't fail a second time.
+    """
+    try:
+        return main()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Findings for the Woosh Debug Log Cleanup Scripts
+One record per debug statement the rules match, small enough to stream over
+the whole tree and ready for JSON Lines
+"""
+
+import json
+
+
+class FindingError(RuntimeError):
+    """Raised for a file iter_findings can't read or decode"""
+
+
+class Finding:
+    """A debug statement matched by a rule.
+
+    ``line``/``column`` are 1-based and point at the start of the call;
+    ``start``/``end`` are its character offsets in the file, ``;`` included.
+    """
+
+    __slots__ = ('file', 'line', 'column', 'end_line', 'start', 'end',
+                 'rule', 'category', 'severity', 'action', 'text')
+
+    def __init__(self, file, line, column, end_line, start, end, rule, category, severity, action, text):
+        self.file = file
+        self.line = line
+        self.column = column
+        self.end_line = end_line
+        self.start = start
+        self.end = end
+        self.rule = rule
+        self.category = category
+        self.severity = severity
+        self.action = action
+        self.text = text
+
+    @property
+    def span(self):
+        """(start, end) character offsets of the statement"""
+        return self.start, self.end
+
+    def to_dict(self):
+        """JSON-ready form, one line of --format jsonl"""
+        return {
+            'file': self.file,
+            'line': self.line,
+            'column': self.column,
+            'end_line': self.end_line,
+            'span': [self.start, self.end],
+            'rule': self.rule,
+            'category': self.category,
+            'severity': self.severity,
+            'action': self.action,
+            'text': self.text,
+        }
+
+    def to_json(self):
+        """The finding as one line of JSON, without the newline"""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def __str__(self):
+        """file:line:column: [rule] text, the way compilers report"""
+        return f"{self.file}:{self.line}:{self.column}: [{self.rule}] {' '.join(self.text.split())}"
+
+    def __repr__(self):
+        return f"Finding({self.file!r}, line={self.line}, column={self.column}, rule={self.rule!r})"
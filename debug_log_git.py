@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Git Access for the Woosh Debug Log Cleanup Scripts
+Reads the added line ranges of every changed file from a single git diff, so a
+check only looks at what a branch or a commit introduces, and streams objects
+from history through one long-lived git cat-file process
+"""
+
+import re
+import subprocess
+
+_HUNK = re.compile(rb'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+_ESCAPES = {b'a': 7, b'b': 8, b't': 9, b'n': 10, b'v': 11, b'f': 12, b'r': 13, b'"': 34, b'\\': 92}
+
+
+class GitError(RuntimeError):
+    """Raised when git can't produce the diff (not a repository, unknown ref, ...)"""
+
+
+def _git(args, data=None):
+    """Run git and return its stdout as bytes"""
+    try:
+        result = subprocess.run(['git'] + args, input=data, capture_output=True, check=False)
+    except FileNotFoundError:
+        raise GitError("git is not installed") from None
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip()
+        raise GitError(message or "git failed")
+    return result.stdout
+
+
+def _unquote(path):
+    """Undo git's C-style quoting of unusual file names"""
+    if not path.startswith(b'"'):
+        return path.decode('utf-8', 'surrogateescape')
+    out = bytearray()
+    i = 1
+    while i < len(path) - 1:
+        c = path[i:i + 1]
+        if c != b'\\':
+            out += c
+            i += 1
+        elif path[i + 1:i + 2].isdigit():
+            out.append(int(path[i + 1:i + 4], 8))
+            i += 4
+        else:
+            out.append(_ESCAPES.get(path[i + 1:i + 2], path[i + 1]))
+            i += 2
+    return out.decode('utf-8', 'surrogateescape')
+
+
+def added_lines(since=None, staged=False, pathspecs=('*.dart',)):
+    """Map each changed file (relative to the current directory) to its added line ranges.
+
+    since compares the working tree with the merge base of that ref and
+    HEAD, so commits that landed on the base branch afterwards don't count;
+    staged compares the index with HEAD. Ranges are inclusive (first, last)
+    line numbers in the new version. Everything comes from one git diff.
+    """
+    args = ['-c', 'core.quotePath=false', 'diff', '--unified=0', '--no-color', '--no-ext-diff',
+            '--no-prefix', '--relative', '--diff-filter=ACMR']
+    if staged:
+        args.append('--cached')
+    elif since:
+        args += ['--merge-base', since]
+    args += ['--'] + list(pathspecs)
+
+    files = {}
+    ranges = None
+    for line in _git(args).splitlines():
+        if line.startswith(b'+++ '):
+            # git ends the name with a tab when it contains a space
+            path = line[4:]
+            if path.endswith(b'\t'):
+                path = path[:-1]
+            ranges = files.setdefault(_unquote(path), [])
+        elif line.startswith(b'@@') and ranges is not None:
+            m = _HUNK.match(line)
+            if m is None:
+                continue
+            start = int(m.group(1))
+            count = 1 if m.group(2) is None else int(m.group(2))
+            if count:
+                ranges.append((start, start + count - 1))
+    return {path: ranges for path, ranges in files.items() if ranges}
+
+
+def read_index(paths):
+    """Map each path to its staged content, read with one git cat-file call"""
+    request = ''.join(f':./{path}\n' for path in paths).encode('utf-8', 'surrogateescape')
+    output = _git(['cat-file', '--batch'], request)
+    contents = {}
+    position = 0
+    for path in paths:
+        newline = output.index(b'\n', position)
+        header = output[position:newline].split()
+        position = newline + 1
+        if header[-1] == b'missing':
+            continue
+        size = int(header[2])
+        contents[path] = output[position:position + size]
+        position += size + 1
+    return contents
+
+
+class CatFile:
+    """One long-lived git cat-file --batch process serving object reads on demand.
+
+    Each read is a request line and a response on the same pipes, so
+    reading thousands of blobs costs one process instead of one each.
+    """
+
+    def __init__(self, cwd=None):
+        try:
+            self.process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=cwd, stdin=subprocess.PIPE,
+                                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            raise GitError("git is not installed") from None
+
+    def read(self, name):
+        """(type, contents) of an object (a hash or any rev like HEAD:lib), or None if it doesn't exist"""
+        self.process.stdin.write(name.encode('utf-8', 'surrogateescape') + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline()
+        if not header:
+            raise GitError("git cat-file exited (not a git repository?)")
+        fields = header.split()
+        if fields[-1] == b'missing' or len(fields) != 3:
+            return None
+        size = int(fields[2])
+        data = self.process.stdout.read(size)
+        self.process.stdout.read(1)
+        return fields[1].decode(), data
+
+    def close(self):
+        """Stop the git process"""
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def rev_list(rev='HEAD', max_count=None, since=None, first_parent=True):
+    """Commit hashes reachable from rev, newest first"""
+    args = ['rev-list']
+    if first_parent:
+        args.append('--first-parent')
+    if max_count:
+        args.append(f'--max-count={max_count}')
+    if since:
+        args.append(f'--since={since}')
+    return _git(args + [rev, '--']).decode().split()
+
+
+def first_parent_depth(rev):
+    """Number of commits on rev's first-parent line, rev included"""
+    return int(_git(['rev-list', '--first-parent', '--count', rev, '--']))
+
+
+def tags():
+    """Map commit hash -> tag names pointing at it (annotated tags peeled)"""
+    output = _git(['for-each-ref', '--format=%(objectname) %(*objectname) %(refname:short)', 'refs/tags'])
+    commits = {}
+    for line in output.decode('utf-8', 'replace').splitlines():
+        fields = line.split(' ')
+        if len(fields) == 3:
+            target, peeled, name = fields
+            commits.setdefault(peeled or target, []).append(name)
+    return commits
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Print Density History for the Woosh Debug Log Cleanup Scripts
+Indexes how many debug prints every Dart file under lib/ had at each commit,
+in a local SQLite database, so trends over hundreds of commits are one query
+"""
+
+import argparse
+import csv
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from cleanup_debug_logs_advanced import AdvancedDebugLogCleaner
+from dart_scanner import iter_calls, may_contain_calls
+from debug_log_files import count_lines, run_cli
+from debug_log_git import CatFile, GitError, first_parent_depth, rev_list, tags
+
+DEFAULT_DB = Path(".debug_log_history.sqlite")
+
+# Commits written to the database per transaction
+COMMIT_BATCH = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS commits (
+    sha TEXT PRIMARY KEY, time INTEGER, depth INTEGER, subject TEXT, tree TEXT,
+    files INTEGER, lines INTEGER, prints INTEGER, debug INTEGER);
+CREATE TABLE IF NOT EXISTS blobs (
+    blob TEXT, path TEXT, lines INTEGER, prints INTEGER, debug INTEGER,
+    PRIMARY KEY (blob, path));
+CREATE TABLE IF NOT EXISTS files (
+    sha TEXT, path TEXT, blob TEXT, PRIMARY KEY (sha, path));
+CREATE INDEX IF NOT EXISTS files_by_path ON files (path);
+CREATE VIEW IF NOT EXISTS file_counts AS
+    SELECT c.sha, c.time, c.depth, f.path, b.lines, b.prints, b.debug
+    FROM files f JOIN commits c ON c.sha = f.sha JOIN blobs b ON b.blob = f.blob AND b.path = f.path;
+"""
+
+
+def _tree_entries(data):
+    """Yield (mode, name, hash) for the entries of a raw git tree object"""
+    position = 0
+    while position < len(data):
+        space = data.index(b' ', position)
+        nul = data.index(b'\0', space)
+        yield data[position:space], data[space + 1:nul].decode('utf-8', 'surrogateescape'), \
+            data[nul + 1:nul + 21].hex()
+        position = nul + 21
+
+
+def _commit_fields(data):
+    """(tree, committer time, subject) of a raw git commit object"""
+    headers, _, message = data.partition(b'\n\n')
+    tree = None
+    committed = 0
+    for line in headers.split(b'\n'):
+        if line.startswith(b'tree '):
+            tree = line[5:].decode()
+        elif line.startswith(b'committer '):
+            committed = int(line.rsplit(b' ', 2)[1])
+    return tree, committed, message.split(b'\n', 1)[0].decode('utf-8', 'replace')
+
+
+class HistoryIndex:
+    """Per-commit, per-file print counts in SQLite, filled from git history.
+
+    A file's counts are stored once per (blob, path): a commit that leaves
+    most files alone costs a tree walk and a few new blobs, and a subtree
+    whose hash was seen before isn't walked again. The counts come from the
+    advanced cleaner's rules; changing them empties the blob table so the
+    next run recounts everything.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB, root='lib', rules_file=None):
+        self.db_path = Path(db_path)
+        self.root = root.strip('/')
+        self.cleaner = AdvancedDebugLogCleaner(rules_file=rules_file)
+        self.db = sqlite3.connect(self.db_path)
+        self.db.executescript(SCHEMA)
+        self.fingerprint = f"{self.cleaner.rules_fingerprint()}:{self.root}"
+        stored = self.db.execute("SELECT value FROM meta WHERE key = 'rules'").fetchone()
+        # Counted with other rules or another root: the next update starts over
+        self.stale = stored is not None and stored[0] != self.fingerprint
+        self.trees = {}
+
+    def close(self):
+        """Close the database"""
+        self.db.close()
+
+    def count(self, data, path):
+        """(lines, print calls, debug prints the rules would remove) for one file's contents"""
+        if not may_contain_calls(data):
+            return count_lines(data), 0, 0
+        content = data.decode('utf-8', 'replace')
+        prints = sum(1 for _ in iter_calls(content))
+        debug = sum(1 for _ in self.cleaner.find_debug_calls(content, Path(path)))
+        return count_lines(data), prints, debug
+
+    def dart_files(self, cat, tree, prefix):
+        """[(path, blob)] for the .dart files below a tree, each subtree walked once per run"""
+        files = self.trees.get(tree)
+        if files is None:
+            files = []
+            found = cat.read(tree)
+            for mode, name, sha in _tree_entries(found[1]) if found else ():
+                if mode == b'40000':
+                    files.extend((f"{name}/{path}", blob) for path, blob in self.dart_files(cat, sha, ''))
+                elif name.endswith('.dart') and mode.startswith(b'100'):
+                    files.append((name, sha))
+            self.trees[tree] = files
+        return [(prefix + path, blob) for path, blob in files]
+
+    def update(self, rev='HEAD', max_count=None, since=None, on_commit=None):
+        """Index the commits on rev's first-parent line not indexed yet; return counts of the work done"""
+        if self.stale:
+            self.db.executescript("DELETE FROM blobs; DELETE FROM files; DELETE FROM commits;")
+            self.stale = False
+        self.db.execute("INSERT OR REPLACE INTO meta VALUES ('rules', ?)", (self.fingerprint,))
+        commits = rev_list(rev, max_count, since)
+        known = {sha for (sha,) in self.db.execute("SELECT sha FROM commits")}
+        pending = [sha for sha in reversed(commits) if sha not in known]
+        blobs = {(blob, path): (lines, prints, debug)
+                 for blob, path, lines, prints, debug in self.db.execute("SELECT * FROM blobs")} if pending else {}
+        stats = {'commits': len(pending), 'scanned': 0, 'reused': 0}
+        # rev-list lists one unbroken first-parent line, so one count dates them all
+        depth = first_parent_depth(commits[-1]) - 1 if pending else 0
+        depths = {sha: depth + position for position, sha in enumerate(reversed(commits), 1)}
+
+        with CatFile() as cat:
+            for number, sha in enumerate(pending, 1):
+                tree, committed, subject = _commit_fields(cat.read(sha)[1])
+                root_tree = self._subtree_sha(cat, tree)
+                files = self.dart_files(cat, root_tree, f"{self.root}/" if self.root else '') if root_tree else []
+                totals = [0, 0, 0]
+                for path, blob in files:
+                    counts = blobs.get((blob, path))
+                    if counts is None:
+                        counts = self.count(cat.read(blob)[1], path)
+                        blobs[(blob, path)] = counts
+                        self.db.execute("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)", (blob, path) + counts)
+                        stats['scanned'] += 1
+                    else:
+                        stats['reused'] += 1
+                    for i in range(3):
+                        totals[i] += counts[i]
+                self.db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                                    [(sha, path, blob) for path, blob in files])
+                self.db.execute("INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (sha, committed, depths[sha], subject, tree, len(files), *totals))
+                if number % COMMIT_BATCH == 0:
+                    self.db.commit()
+                if on_commit:
+                    on_commit(number, len(pending))
+        self.db.commit()
+        return stats
+
+    def _subtree_sha(self, cat, tree):
+        """Hash of the tree at self.root inside a commit's tree, or None if the commit has no such directory"""
+        sha = tree
+        for name in self.root.split('/') if self.root else ():
+            found = cat.read(sha)
+            entries = {entry_name: (mode, entry_sha) for mode, entry_name, entry_sha in _tree_entries(found[1])}
+            if entries.get(name, (None,))[0] != b'40000':
+                return None
+            sha = entries[name][1]
+        return sha
+
+    def trend(self, limit=None, tagged=None):
+        """Rows (sha, time, subject, files, lines, prints, debug), oldest first"""
+        rows = self.db.execute("SELECT sha, time, subject, files, lines, prints, debug FROM commits "
+                               "ORDER BY time, depth").fetchall()
+        if tagged is not None:
+            rows = [row for row in rows if row[0] in tagged]
+        return rows[-limit:] if limit else rows
+
+    def regressions(self, prefix='lib/services/', top=15):
+        """Files under prefix ranked by how many commits raised their debug print count.
+
+        Rows are (path, times raised, prints added, prints removed, debug prints now).
+        A file missing from the next indexed commit was deleted: its prints
+        count as removed there, and it has none now unless it came back.
+        """
+        return self.db.execute("""
+            WITH ordered AS (SELECT sha, ROW_NUMBER() OVER (ORDER BY time, depth) AS seq FROM commits),
+            counts AS (SELECT f.path, f.debug, o.seq,
+                              LAG(o.seq) OVER w AS prev_seq, LAG(f.debug) OVER w AS prev_debug,
+                              LEAD(o.seq) OVER w AS next_seq
+                       FROM file_counts f JOIN ordered o ON o.sha = f.sha
+                       WHERE f.path LIKE ? || '%'
+                       WINDOW w AS (PARTITION BY f.path ORDER BY o.seq)),
+            deltas AS (SELECT path, debug, seq = (SELECT MAX(seq) FROM ordered) AS last,
+                              CASE WHEN prev_seq IS NULL THEN NULL
+                                   WHEN prev_seq = seq - 1 THEN debug - prev_debug
+                                   ELSE debug END AS delta,
+                              CASE WHEN seq = (SELECT MAX(seq) FROM ordered) THEN 0
+                                   WHEN next_seq IS NULL OR next_seq > seq + 1 THEN debug
+                                   ELSE 0 END AS gone
+                       FROM counts)
+            SELECT path, SUM(delta > 0), SUM(MAX(delta, 0)), -SUM(MIN(delta, 0)) + SUM(gone),
+                   COALESCE(MAX(CASE WHEN last THEN debug END), 0)
+            FROM deltas
+            GROUP BY path
+            HAVING SUM(delta > 0) > 0
+            ORDER BY 2 DESC, 3 DESC, path
+            LIMIT ?""", (prefix, top)).fetchall()
+
+
+def _bar(value, peak, width=30):
+    return '█' * round(width * value / peak) if peak else ''
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Track debug print counts in lib/ across git history")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"index database (default: {DEFAULT_DB})")
+    parser.add_argument("--root", default="lib", help="directory whose Dart files are counted (default: lib)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index = subparsers.add_parser("index", help="count the prints in commits not indexed yet")
+    index.add_argument("--rev", default="HEAD", help="branch or commit whose first-parent history to walk")
+    index.add_argument("--max-count", type=int, help="only the newest N commits")
+    index.add_argument("--since", help="only commits after this date (e.g. '6 months ago')")
+    index.add_argument("--tags", action="store_true", help="also index every tagged commit")
+
+    trend = subparsers.add_parser("trend", help="debug prints per indexed commit, oldest first")
+    trend.add_argument("--limit", type=int, help="only the newest N commits")
+    trend.add_argument("--tags", action="store_true", help="only tagged commits (release over release)")
+    trend.add_argument("--csv", action="store_true", help="print CSV for charting instead of a table")
+
+    regressions = subparsers.add_parser("regressions", help="files whose debug print count keeps going up")
+    regressions.add_argument("--prefix", default="lib/services/", help="files to rank (default: lib/services/)")
+    regressions.add_argument("--top", type=int, default=15, help="files to show (default: 15)")
+
+    args = parser.parse_args()
+    history = HistoryIndex(args.db, args.root)
+    if history.stale and args.command != "index":
+        print("⚠️  The index was built with other rules or another --root; run index again to rebuild it",
+              file=sys.stderr)
+    try:
+        if args.command == "index":
+            started = time.perf_counter()
+            revs = [args.rev] + (sorted({name for names in tags().values() for name in names}) if args.tags else [])
+            totals = {'commits': 0, 'scanned': 0, 'reused': 0}
+            for rev in revs:
+                stats = history.update(rev, args.max_count, args.since, on_commit=lambda n, total: print(
+                    f"\r   📖 {rev}: {n}/{total} commits", end='', file=sys.stderr, flush=True))
+                for key in totals:
+                    totals[key] += stats[key]
+            print(file=sys.stderr)
+            indexed = history.db.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+            print(f"📚 Indexed {totals['commits']} new commits ({indexed} in the index): "
+                  f"{totals['scanned']:,} files scanned, {totals['reused']:,} reused "
+                  f"in {time.perf_counter() - started:.1f}s")
+            print(f"💾 Index: {args.db}")
+
+        elif args.command == "trend":
+            labels = tags() if args.tags else {}
+            rows = history.trend(args.limit, labels if args.tags else None)
+            if args.csv:
+                writer = csv.writer(sys.stdout)
+                writer.writerow(['commit', 'date', 'tag', 'files', 'lines', 'prints', 'debug', 'debug_per_kloc'])
+                for sha, committed, _, files, lines, prints, debug in rows:
+                    writer.writerow([sha, time.strftime('%Y-%m-%d', time.gmtime(committed)),
+                                     ' '.join(labels.get(sha, ())), files, lines, prints, debug,
+                                     round(1000 * debug / lines, 2) if lines else 0])
+                return 0
+            if not rows:
+                print("⚠️  Nothing indexed yet; run: python3 debug_log_history.py index")
+                return 1
+            peak = max(row[6] for row in rows)
+            print(f"{'DATE':<10} {'COMMIT':<9} {'DEBUG':>6} {'/KLOC':>6}  {'':30}  SUBJECT")
+            for sha, committed, subject, files, lines, prints, debug in rows:
+                label = ' '.join(labels.get(sha, ())) or subject
+                per_kloc = 1000 * debug / lines if lines else 0
+                print(f"{time.strftime('%Y-%m-%d', time.gmtime(committed))} {sha[:8]:<9} {debug:>6} "
+                      f"{per_kloc:>6.2f}  {_bar(debug, peak):<30}  {label[:50]}")
+            first, last = rows[0][6], rows[-1][6]
+            arrow = "📈" if last > first else "📉" if last < first else "➡️ "
+            print(f"\n{arrow} {first} → {last} debug prints over {len(rows)} commits")
+
+        elif args.command == "regressions":
+            rows = history.regressions(args.prefix, args.top)
+            if not rows:
+                print(f"✅ No file under {args.prefix} ever gained debug prints in the indexed history")
+                return 0
+            print(f"{'RAISED':>6} {'+ADDED':>7} {'-REMOVED':>8} {'NOW':>5}  FILE")
+            for path, raised, added, removed, now in rows:
+                print(f"{raised:>6} {added:>7} {removed:>8} {now if now is not None else '-':>5}  {path}")
+    except GitError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_cli(main))
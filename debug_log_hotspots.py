@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Print Profiler for the Woosh Debug Log Cleanup Scripts
+Ranks print() calls by where they run (build methods, item builders, loops,
+timers, stream listeners) and what their message costs to build
+"""
+
+import bisect
+import re
+
+from dart_scanner import iter_calls, mask_source
+
+# How much more often code in each context runs than straight-line code.
+# Contexts multiply, so a print in a loop inside build() scores 5 x 10;
+# a callback (itemBuilder, listener, timer) starts over with its own weight.
+CONTEXT_WEIGHTS = {
+    'item_builder': 25,
+    'build': 10,
+    'sync_loop': 10,
+    'timer': 8,
+    'loop': 5,
+    'listener': 4,
+}
+
+# Work done just to build the message, added to the base cost of 1
+EXPENSIVE_PATTERNS = [
+    ('jsonEncode', re.compile(r'\b(?:jsonEncode|json\.encode|JsonEncoder\b[^;]*\.convert)\s*\('), 5),
+    ('response.body', re.compile(r'\b\w*[Rr]esponse\w*\??\.body\b'), 4),
+    ('collection.toString', re.compile(
+        r'(?:\]|\}|\b\w*(?:[Ll]ist|[Mm]ap|[Ss]et|[Ii]tems|[Dd]ata|[Rr]esults|s))\??\.toString\s*\(\s*\)'), 3),
+    ('toString', re.compile(r'\.toString\s*\(\s*\)'), 1),
+    ('map/where/join', re.compile(r'\.(?:map|where|join|toList|expand|fold|reduce)\s*\('), 2),
+    ('interpolation', re.compile(r'\$\{|\$[A-Za-z_]'), 0.5),
+]
+
+# Calls whose closure argument runs once per element
+LOOP_CALLS = {'forEach', 'map', 'where', 'any', 'every', 'fold', 'reduce', 'expand',
+              'sort', 'firstWhere', 'lastWhere', 'removeWhere', 'retainWhere', 'generate'}
+
+# Calls and named arguments whose closures run on every event or tick
+TIMER_CALLS = {'Timer.periodic', 'Stream.periodic'}
+LISTENER_CALLS = {'listen', 'addListener', 'addPostFrameCallback', 'onData'}
+ITEM_BUILDER_ARGS = {'itemBuilder', 'separatorBuilder'}
+BUILDER_ARGS = {'builder'}
+LOOP_KEYWORDS = {'for', 'while', 'do'}
+LOOP_CONTEXTS = {'loop', 'sync_loop'}
+KEYWORDS = LOOP_KEYWORDS | {'if', 'else', 'switch', 'catch', 'try', 'finally', 'on'}
+
+_BRACKET_EVENTS = re.compile(r'=>|[(){}\[\];,]')
+# A dotted name with optional type arguments, matched against reversed text
+# so the search is anchored where the name ends instead of tried everywhere
+_REVERSED_NAME = re.compile(r'\s*(?:>[^<>()]*<\s*)?((?:[\w$]*[A-Za-z_$]\s*\.\s*)*[\w$]*[A-Za-z_$])(?![\w$])')
+_MODIFIERS = ('async*', 'async', 'sync*')
+_BLOCK_KEYWORDS = ('else', 'do', 'try', 'finally')
+_CLOSERS = {')': '(', ']': '[', '}': '{'}
+
+
+def _trailing_name(text):
+    """Dotted name (type arguments dropped) that text ends with, or None"""
+    m = _REVERSED_NAME.match(text[::-1])
+    if m is None:
+        return None
+    return re.sub(r'\s+', '', m.group(1)[::-1])
+
+
+def _callee(masked, open_paren):
+    """Dotted name called by the ( at masked[open_paren], without a leading receiver dot"""
+    return _trailing_name(masked[max(0, open_paren - 200):open_paren])
+
+
+def _owner(masked, position, opens, stack):
+    """What a block or arrow body starting at masked[position] belongs to.
+
+    ``opens`` maps each ) seen so far to its (, ``stack`` holds the brackets
+    still open. Returns (kind, name): ('keyword', 'for'), ('decl', 'build'),
+    ('named', 'itemBuilder'), ('arg', 'Timer.periodic'), or ('other', None).
+    """
+    offset = max(0, position - 200)
+    header = masked[offset:position].rstrip()
+    for modifier in _MODIFIERS:
+        if header.endswith(modifier) and _trailing_name(header.rstrip('*')) in ('async', 'sync'):
+            header = header[:-len(modifier)].rstrip()
+            break
+
+    word = _trailing_name(header)
+    if word in _BLOCK_KEYWORDS:
+        return 'keyword', word
+    if not header.endswith(')'):
+        return 'other', None
+
+    open_paren = opens.get(offset + len(header) - 1)
+    if open_paren is None:
+        return 'other', None
+    before = masked[max(0, open_paren - 200):open_paren].rstrip()
+    name = _callee(masked, open_paren)
+    if name in KEYWORDS:
+        return 'keyword', name
+    if name and before.endswith(name.split('.')[-1]):
+        return 'decl', name.split('.')[-1]
+    if before.endswith(':'):
+        return 'named', _trailing_name(before[:-1])
+    if before.endswith(('(', ',')) and stack and stack[-1][0] == '(':
+        return 'arg', _callee(masked, stack[-1][2])
+    return 'other', None
+
+
+def _context(owner, in_sync_file):
+    """Hot-path context for a frame owner, or None"""
+    kind, name = owner
+    if name is None:
+        return None
+    last = name.split('.')[-1]
+    if kind == 'keyword':
+        if name in LOOP_KEYWORDS:
+            return 'sync_loop' if in_sync_file else 'loop'
+        return None
+    if kind == 'decl':
+        return 'build' if last == 'build' else None
+    if kind == 'named':
+        if name in ITEM_BUILDER_ARGS:
+            return 'item_builder'
+        if name in BUILDER_ARGS:
+            return 'build'
+        if name in LISTENER_CALLS:
+            return 'listener'
+        return None
+    if kind == 'arg':
+        if name in TIMER_CALLS:
+            return 'timer'
+        if last in LISTENER_CALLS:
+            return 'listener'
+        if last in LOOP_CALLS:
+            return 'sync_loop' if in_sync_file else 'loop'
+    return None
+
+
+def _frames_at(masked, positions):
+    """Yield (position, open frames) for sorted positions, in one pass over the source.
+
+    A frame is (bracket, owner, start) where bracket is '(', '[', '{' or '=>'
+    for an arrow body, which ends at the next , or ; at its own depth. Only
+    blocks and arrow bodies get an owner; it's worked out when they open.
+    """
+    stack = []
+    opens = {}
+    events = _BRACKET_EVENTS.finditer(masked)
+    event = next(events, None)
+    for position in positions:
+        while event is not None and event.start() < position:
+            token = event.group()
+            start = event.start()
+            if token == '=>':
+                stack.append(('=>', _owner(masked, start, opens, stack), start))
+            elif token in ',;':
+                while stack and stack[-1][0] == '=>':
+                    stack.pop()
+            elif token in '([{':
+                owner = _owner(masked, start, opens, stack) if token == '{' else None
+                stack.append((token, owner, start))
+            else:
+                while stack and stack[-1][0] == '=>':
+                    stack.pop()
+                if stack and stack[-1][0] == _CLOSERS[token]:
+                    opened = stack.pop()
+                    if token == ')':
+                        opens[start] = opened[2]
+            event = next(events, None)
+        yield position, list(stack)
+
+
+
+def enclosing_calls(source, positions, masked=None):
+    """Yield (position, function, callees) for sorted positions.
+
+    function is the innermost declaration around the position (None at the
+    top level); callees are the dotted names of the calls whose argument
+    lists contain it, innermost first.
+    """
+    masked = mask_source(source) if masked is None else masked
+    for position, frames in _frames_at(masked, positions):
+        function = None
+        callees = []
+        for bracket, owner, start in frames:
+            if owner is not None and owner[0] == 'decl':
+                function = owner[1]
+            elif bracket == '(':
+                callees.append(_callee(masked, start))
+        yield position, function, callees[::-1]
+
+
+def message_cost(text):
+    """Base cost of 1 plus the work done building the message, and what drove it"""
+    counts = {name: len(pattern.findall(text)) for name, pattern, _ in EXPENSIVE_PATTERNS}
+    # Every collection toString is a toString too; count it once
+    counts['toString'] -= counts['collection.toString']
+
+    cost = 1.0
+    drivers = []
+    for name, _, weight in EXPENSIVE_PATTERNS:
+        if counts[name] > 0:
+            cost += weight * counts[name]
+            drivers.append(name)
+    return cost, drivers
+
+
+def find_hotspots(source, path='', rules=None):
+    """Return one record per print call: where it runs, what it costs, and a score.
+
+    ``rules`` optionally maps a call's start offset to the id of the rule
+    that would remove it; it is reported as the record's ``rule``.
+    """
+    calls = [call for call in iter_calls(source) if call.name == 'print']
+    if not calls:
+        return []
+    masked = mask_source(source)
+    line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+    in_sync_file = 'sync' in path.replace('\\', '/').rsplit('/', 1)[-1]
+
+    records = []
+    for call, (position, frames) in zip(calls, _frames_at(masked, [call.start for call in calls])):
+        contexts = []
+        function = None
+        for bracket, owner, _ in frames:
+            if owner is None:
+                continue
+            if owner[0] == 'decl':
+                function = owner[1]
+            context = _context(owner, in_sync_file)
+            if not context:
+                continue
+            # Callbacks run on their own schedule, not once per pass of the code around them
+            if owner[0] != 'keyword' and context not in LOOP_CONTEXTS:
+                contexts = [context]
+            else:
+                contexts.append(context)
+
+        multiplier = 1
+        for context in contexts:
+            multiplier *= CONTEXT_WEIGHTS[context]
+        argument = source[source.index('(', call.start) + 1:call.end]
+        cost, drivers = message_cost(argument)
+
+        line = bisect.bisect_right(line_starts, position)
+        records.append({
+            'file': path,
+            'line': line,
+            'column': position - line_starts[line - 1] + 1,
+            'function': function,
+            'contexts': contexts,
+            'expensive': drivers,
+            'score': round(multiplier * cost, 1),
+            'statement': call.statement,
+            'rule': rules.get(call.start) if rules else None,
+            'text': call.canonical if len(call.canonical) <= 120 else call.canonical[:117] + '...',
+        })
+    return records
+
+
+def rank_hotspots(records):
+    """Records sorted by score, highest first (ties by location)"""
+    return sorted(records, key=lambda r: (-r['score'], r['file'], r['line']))
+
+
+def format_hotspots(records, top=25):
+    """Text table of the highest scoring prints, plus totals per file"""
+    ranked = rank_hotspots(records)
+    lines = [f"🔥 Debug print hotspots (top {min(top, len(ranked))} of {len(ranked)})", "=" * 50]
+    if not ranked:
+        lines.append("   No print() calls found")
+        return '\n'.join(lines)
+
+    lines.append(f"{'Score':>8}  {'Location':<52} {'Context':<24} Cost drivers")
+    for record in ranked[:top]:
+        location = f"{record['file']}:{record['line']}"
+        if len(location) > 52:
+            location = '...' + location[-49:]
+        context = ' > '.join(record['contexts']) or '-'
+        rule = f"  [{record['rule']}]" if record.get('rule') else ''
+        lines.append(f"{record['score']:>8}  {location:<52} {context:<24} "
+                     f"{', '.join(record['expensive']) or '-'}{rule}")
+
+    totals = {}
+    for record in ranked:
+        total = totals.setdefault(record['file'], [0, 0.0])
+        total[0] += 1
+        total[1] += record['score']
+    lines.append("\n📁 By file:")
+    for file, (count, score) in sorted(totals.items(), key=lambda item: -item[1][1])[:top]:
+        lines.append(f"{score:>8.1f}  {file} ({count} prints)")
+    return '\n'.join(lines)
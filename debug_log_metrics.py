@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Run Metrics for the Woosh Debug Log Cleanup Scripts
+Counts how often each rule fires and how long its regex takes, times every
+file's read, match and write, and writes it all as JSON or in the Prometheus
+textfile format
+"""
+
+import contextlib
+import json
+import re
+import time
+
+from debug_log_files import atomic_write
+
+# Prefix of every Prometheus metric name
+PROMETHEUS_PREFIX = "debug_cleanup"
+
+# Per-file timings recorded for each processed file
+FILE_TIMINGS = ("read", "match", "write")
+
+
+def _label_value(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    """{name="value",...} for a Prometheus sample"""
+    return '{' + ','.join(f'{name}="{_label_value(value)}"' for name, value in labels.items()) + '}'
+
+
+class CleanupMetrics:
+    """Per-rule counters and per-file timings for one cleanup run.
+
+    A rule's hits are the calls it decided (the first matching keep rule,
+    else the first matching debug rule), or for a flag rule that only
+    reports, the calls it flagged; its matches are all the calls its
+    regex matched, decided or not; its seconds are the time its own regex
+    took over every candidate call. The combined pattern engine can't say
+    which rule its time went to, so each rule is run on its own over the
+    file's candidates once the file is done (time_rules), outside its match
+    timing, and only while metrics are being collected.
+
+    Worker processes hand back what they saw per file (drain); the main
+    process adds it up (merge).
+    """
+
+    def __init__(self, profile, rules, flags=re.IGNORECASE):
+        self.profile = profile
+        self.rules = [(rule, re.compile(rule.pattern, flags)) for rule in rules]
+        self.totals = self._empty()
+        self.pending = self._empty()
+        self.lines = []
+        self.files = []
+        self.phases = {}
+        self.started = time.time()
+
+    def _empty(self):
+        """Zeroed counters: candidate calls, and [hits, matches, seconds] per rule"""
+        return {'candidates': 0, 'rules': {rule.id: [0, 0, 0.0] for rule, _ in self.rules}}
+
+    def candidate(self, call, rule=None):
+        """Record a call checked against the rules, and the rule that decided it if any"""
+        self.lines.append((call.canonical, call.message))
+        if rule is not None:
+            self.pending['rules'][rule.id][0] += 1
+
+    def flagged(self, rule):
+        """Record a candidate call a flag rule reported, whatever rule decided it"""
+        self.pending['rules'][rule.id][0] += 1
+
+    def time_rules(self, file_path=None):
+        """Run every rule that applies to the file over its recorded candidates, timing each"""
+        lines = self.lines
+        if not lines:
+            return
+        self.lines = []
+        self.pending['candidates'] += len(lines)
+        counters = self.pending['rules']
+        clock = time.perf_counter
+        for rule, regex in self.rules:
+            if not rule.applies_to(file_path):
+                continue
+            # Flag rules see the interpolated values, the others the message text
+            text = 0 if rule.action == 'flag' else 1
+            match = regex.match
+            start = clock()
+            matched = sum(1 for line in lines if match(line[text]))
+            counter = counters[rule.id]
+            counter[2] += clock() - start
+            counter[1] += matched
+
+    def drain(self):
+        """The counters gathered since the last drain, resetting them"""
+        pending = self.pending
+        self.pending = self._empty()
+        return pending
+
+    def merge(self, drained):
+        """Add counters returned by drain() (possibly in another process)"""
+        self.totals['candidates'] += drained['candidates']
+        for rule_id, (hits, matches, seconds) in drained['rules'].items():
+            counter = self.totals['rules'][rule_id]
+            counter[0] += hits
+            counter[1] += matches
+            counter[2] += seconds
+
+    def add_file(self, path, timings, removed):
+        """Record one processed file's read/match/write seconds and how many statements it lost"""
+        self.files.append({'file': str(path), 'removed': removed,
+                           **{name: round(timings.get(name, 0.0), 6) for name in FILE_TIMINGS}})
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time a phase of the run (backup, clean, ...)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def rule_records(self):
+        """One dict per rule, in rule order"""
+        records = []
+        for rule, _ in self.rules:
+            hits, matches, seconds = self.totals['rules'][rule.id]
+            records.append({'id': rule.id, 'category': rule.category, 'action': rule.action,
+                            'hits': hits, 'matches': matches, 'seconds': round(seconds, 6)})
+        return records
+
+    def to_dict(self):
+        """Everything recorded, JSON-ready"""
+        records = self.rule_records()
+        return {
+            'profile': self.profile,
+            'started': self.started,
+            'candidates': self.totals['candidates'],
+            'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            'rules': records,
+            'never_fired': [record['id'] for record in records if not record['hits']],
+            'files': self.files,
+        }
+
+    def to_prometheus(self):
+        """Everything recorded, in the Prometheus text exposition format"""
+        p = PROMETHEUS_PREFIX
+        profile = self.profile
+        lines = []
+
+        def family(name, kind, description, samples):
+            lines.append(f"# HELP {p}_{name} {description}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            lines.extend(f"{p}_{name}{labels} {value}" for labels, value in samples)
+
+        records = self.rule_records()
+        rule_labels = [_labels(profile=profile, rule=r['id'], category=r['category'], action=r['action'])
+                       for r in records]
+        family("rule_hits_total", "counter", "Calls a rule decided (removed, rewrote or kept) or flagged.",
+               zip(rule_labels, (r['hits'] for r in records)))
+        family("rule_matches_total", "counter", "Calls a rule's regex matched, whether or not it decided them.",
+               zip(rule_labels, (r['matches'] for r in records)))
+        family("rule_match_seconds_total", "counter", "Time spent running a rule's regex on candidate calls.",
+               zip(rule_labels, (f"{r['seconds']:.6f}" for r in records)))
+        family("candidate_calls_total", "counter", "Whole-statement print calls checked against the rules.",
+               [(_labels(profile=profile), self.totals['candidates'])])
+        family("phase_seconds", "gauge", "Time spent in each phase of the run.",
+               [(_labels(profile=profile, phase=name), f"{seconds:.6f}") for name, seconds in self.phases.items()])
+        for timing in FILE_TIMINGS:
+            family(f"file_{timing}_seconds", "gauge", f"Time spent in the {timing} step for each file.",
+                   [(_labels(profile=profile, file=f['file']), f"{f[timing]:.6f}") for f in self.files])
+        family("file_removed_statements", "gauge", "Debug statements removed or guarded in each file.",
+               [(_labels(profile=profile, file=f['file']), f['removed']) for f in self.files])
+        family("last_run_timestamp_seconds", "gauge", "When the run started, as a Unix timestamp.",
+               [(_labels(profile=profile), f"{self.started:.0f}")])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, json_path=None, prometheus_path=None):
+        """Write the JSON and/or Prometheus files (atomically, so a collector never reads half a file)"""
+        if json_path:
+            atomic_write(json_path, json.dumps(self.to_dict(), indent=1, ensure_ascii=False).encode('utf-8'))
+        if prometheus_path:
+            atomic_write(prometheus_path, self.to_prometheus().encode('utf-8'))
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Compiled Pattern Engine for the Woosh Debug Log Cleanup Scripts
+Folds a list of line patterns into one regex so each line is scanned once
+"""
+
+import re
+
+# Quantifier that can follow an atom: *, +, ?, {m}, {m,n}, {,n} (plus lazy/possessive suffix)
+_QUANTIFIER = re.compile(r'(?:[*+?]|\{\d+(?:,\d*)?\}|\{,\d+\})[?+]?')
+
+# Characters that are literal when they appear unescaped at the top level
+_SPECIAL_CHARS = set('.^$*+?{}[]\\|()')
+
+
+def _skip_class(source, i):
+    """Return the index just past the character class starting at source[i]"""
+    j = i + 1
+    if j < len(source) and source[j] == '^':
+        j += 1
+    if j < len(source) and source[j] == ']':
+        j += 1
+    while j < len(source) and source[j] != ']':
+        j += 2 if source[j] == '\\' else 1
+    return j + 1
+
+
+def _skip_group(source, i):
+    """Return the index just past the group starting at source[i]"""
+    depth = 0
+    j = i
+    while j < len(source):
+        c = source[j]
+        if c == '\\':
+            j += 2
+            continue
+        if c == '[':
+            j = _skip_class(source, j)
+            continue
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    return j
+
+
+def _atom_end(source, i):
+    """Return the index just past the single atom starting at source[i]"""
+    c = source[i]
+    if c == '\\':
+        return i + 2
+    if c == '[':
+        return _skip_class(source, i)
+    if c == '(':
+        return _skip_group(source, i)
+    return i + 1
+
+
+def _is_repeated(token):
+    """Check if a token carries a quantifier"""
+    return _atom_end(token, 0) < len(token)
+
+
+def split_tokens(source):
+    """Split a regex into top-level atoms with their quantifiers attached.
+
+    Returns None when the pattern can't be safely spliced into a bigger
+    regex (top-level alternation, inline flags, named groups, backrefs).
+    """
+    if re.search(r'\(\?[aiLmsux-]+\)|\(\?P[<=]|\\\d', source):
+        return None
+
+    tokens = []
+    i = 0
+    while i < len(source):
+        if source[i] == '|':
+            return None
+        j = _atom_end(source, i)
+        quantifier = _QUANTIFIER.match(source, j)
+        if quantifier:
+            j = quantifier.end()
+        tokens.append(source[i:j])
+        i = j
+    return tokens
+
+
+def _literal_char(token):
+    """Return the literal character a token stands for, or None"""
+    if len(token) == 1 and token not in _SPECIAL_CHARS:
+        return token
+    if len(token) == 2 and token[0] == '\\' and not token[1].isalnum():
+        return token[1]
+    return None
+
+
+def literal_text(tokens):
+    """Return the plain string the tokens stand for, or None if any isn't a literal"""
+    chars = [_literal_char(token) for token in tokens]
+    return None if None in chars else ''.join(chars)
+
+
+def required_literal(tokens, min_length=3):
+    """Return the first literal of min_length chars every match must contain.
+
+    For the cleaner patterns this is the call name (``print``,
+    ``console.log``), which makes a cheap prefilter for whole lines.
+    """
+    run = ''
+    for token in tokens:
+        char = _literal_char(token)
+        if char is None:
+            if len(run) >= min_length:
+                return run
+            run = ''
+        else:
+            run += char
+    return run if len(run) >= min_length else ''
+
+
+def _common_prefix_length(token_lists):
+    """Number of leading tokens shared by every token list"""
+    shortest = min(len(tokens) for tokens in token_lists)
+    for i in range(shortest):
+        token = token_lists[0][i]
+        if any(tokens[i] != token for tokens in token_lists):
+            return i
+    return shortest
+
+
+class DebugPatternEngine:
+    """Pre-compiled matcher for an ordered list of line patterns.
+
+    The shared prefix and suffix of the patterns are factored out and the
+    remaining middles become one alternation of named groups, so a line is
+    scanned once instead of once per pattern. Lines that don't contain a
+    literal required by every pattern (``print``, ``console.log``) are
+    rejected before the regex runs at all.
+    """
+
+    def __init__(self, patterns, flags=re.IGNORECASE):
+        self.patterns = list(patterns)
+        self.flags = flags
+        self._combined = None
+        self._compiled = None
+        self._prefilter = None
+        self.prefilter_literals = []
+        self._direct_index = False
+
+        token_lists = [split_tokens(pattern) for pattern in self.patterns]
+        if not self.patterns or any(tokens is None for tokens in token_lists):
+            # Fall back to the plain per-pattern loop
+            self._compiled = [re.compile(pattern, flags) for pattern in self.patterns]
+            return
+
+        prefix_length = _common_prefix_length(token_lists)
+        # A repeated atom at the end of the prefix would make the regex try
+        # every alternative at each backtracking step, reporting the rightmost
+        # rule instead of the first one, so leave it in the middles
+        while prefix_length and _is_repeated(token_lists[0][prefix_length - 1]):
+            prefix_length -= 1
+        reversed_lists = [tokens[prefix_length:][::-1] for tokens in token_lists]
+        suffix_length = _common_prefix_length(reversed_lists)
+
+        prefix = ''.join(token_lists[0][:prefix_length])
+        suffix = ''.join(token_lists[0][len(token_lists[0]) - suffix_length:])
+        middles = [
+            ''.join(tokens[prefix_length:len(tokens) - suffix_length])
+            for tokens in token_lists
+        ]
+        alternation = '|'.join(f'(?P<r{i}>{middle})' for i, middle in enumerate(middles))
+        self._combined = re.compile(f'{prefix}(?:{alternation}){suffix}', flags)
+
+        # When our named groups are the only groups, lastindex is the rule number
+        self._direct_index = self._combined.groups == len(self.patterns)
+
+        literals = [required_literal(tokens) for tokens in token_lists]
+        if all(literals):
+            self.prefilter_literals = sorted(set(literals), key=len, reverse=True)
+            alternatives = '|'.join(re.escape(literal) for literal in self.prefilter_literals)
+            self._prefilter = re.compile(alternatives, flags).search
+
+    def plan(self):
+        """JSON-ready description of the analysed patterns, for from_plan()"""
+        return {
+            'patterns': self.patterns,
+            'flags': int(self.flags),
+            'combined': self._combined.pattern if self._combined is not None else None,
+            'direct_index': self._direct_index,
+            'prefilter': self.prefilter_literals,
+        }
+
+    @classmethod
+    def from_plan(cls, plan):
+        """Rebuild an engine from plan() output, skipping the pattern analysis"""
+        engine = cls.__new__(cls)
+        engine.patterns = list(plan['patterns'])
+        engine.flags = re.RegexFlag(plan['flags'])
+        engine._direct_index = plan['direct_index']
+        engine.prefilter_literals = list(plan['prefilter'])
+        engine._prefilter = None
+        if plan['combined'] is None:
+            engine._combined = None
+            engine._compiled = [re.compile(pattern, engine.flags) for pattern in engine.patterns]
+            return engine
+        engine._combined = re.compile(plan['combined'], engine.flags)
+        engine._compiled = None
+        if engine.prefilter_literals:
+            alternatives = '|'.join(re.escape(literal) for literal in engine.prefilter_literals)
+            engine._prefilter = re.compile(alternatives, engine.flags).search
+        return engine
+
+    def match(self, line):
+        """Return the index of the first pattern matching the line, or None"""
+        if self._compiled is not None:
+            for index, pattern in enumerate(self._compiled):
+                if pattern.match(line):
+                    return index
+            return None
+
+        if self._prefilter is not None and not self._prefilter(line):
+            return None
+
+        m = self._combined.match(line)
+        if m is None:
+            return None
+        if self._direct_index:
+            return m.lastindex - 1
+        for index in range(len(self.patterns)):
+            if m.group(f'r{index}') is not None:
+                return index
+        return None
+
+    def matches(self, line):
+        """Check if any pattern matches the line"""
+        return self.match(line) is not None
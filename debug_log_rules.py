@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Declarative Rules for the Woosh Debug Log Cleanup Scripts
+Loads debug_log_rules.toml, drops duplicate and subsumed rules, and caches the
+analysed pattern engines keyed by the rule file's hash
+"""
+
+import argparse
+import hashlib
+import json
+import tomllib
+from pathlib import Path
+
+from debug_log_files import atomic_write, compile_globs, run_cli
+from debug_log_patterns import DebugPatternEngine, literal_text, split_tokens
+
+RULES_FILE = Path(__file__).with_name("debug_log_rules.toml")
+
+# Bumped whenever the cache layout or the subsumption logic changes
+CACHE_VERSION = 2
+
+ACTIONS = ("keep", "remove", "rewrite", "flag")
+PROFILES = ("basic", "advanced")
+DEFAULT_CATEGORY = "debug"
+
+def cache_path(rules_path):
+    """Where a rule file's analysis is cached: beside the rule file, never in the working directory"""
+    rules_path = Path(rules_path)
+    return rules_path.with_name(f".{rules_path.stem}_cache.json")
+
+
+# A whole-statement print(...) whose first string literal contains the message
+MESSAGE_TEMPLATE = r'''^\s*print\s*\(\s*['"][^'"]*{}[^'"]*['"]\s*\)\s*;?\s*$'''
+
+
+class RuleError(ValueError):
+    """Raised for a rule file that can't be used"""
+
+
+class Category:
+    """How serious a category's messages are, and the keywords that tag generic ones"""
+
+    __slots__ = ('name', 'severity', 'keywords')
+
+    def __init__(self, name, severity="info", keywords=()):
+        self.name = name
+        self.severity = severity
+        self.keywords = list(keywords)
+
+    def to_dict(self):
+        """JSON-ready form, as written in the rule file"""
+        return {'severity': self.severity, 'keywords': self.keywords}
+
+
+class Rule:
+    """One entry of the rule file"""
+
+    __slots__ = ('id', 'category', 'action', 'pattern', 'message', 'paths', 'profiles',
+                 '_paths_re', '_literal')
+
+    def __init__(self, id, category, pattern, action="remove", message=None, paths=(), profiles=PROFILES):
+        self.id = id
+        self.category = category
+        self.action = action
+        self.pattern = pattern
+        self.message = message
+        self.paths = list(paths)
+        self.profiles = list(profiles)
+        self._paths_re = compile_globs(self.paths)
+        self._literal = False
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a rule from its rule-file table, checking the fields"""
+        rule_id = data.get('id')
+        if not rule_id:
+            raise RuleError(f"Rule without an id: {data}")
+        unknown = set(data) - {'id', 'category', 'action', 'pattern', 'message', 'paths', 'profiles'}
+        if unknown:
+            raise RuleError(f"Rule {rule_id}: unknown field(s) {', '.join(sorted(unknown))}")
+        action = data.get('action', 'remove')
+        if action not in ACTIONS:
+            raise RuleError(f"Rule {rule_id}: action must be one of {', '.join(ACTIONS)}")
+        profiles = data.get('profiles', PROFILES)
+        if not set(profiles) <= set(PROFILES):
+            raise RuleError(f"Rule {rule_id}: profiles must be among {', '.join(PROFILES)}")
+        if ('message' in data) == ('pattern' in data):
+            raise RuleError(f"Rule {rule_id}: give exactly one of message or pattern")
+
+        message = data.get('message')
+        pattern = MESSAGE_TEMPLATE.format(message) if message is not None else data['pattern']
+        if split_tokens(pattern) is None and message is not None:
+            raise RuleError(f"Rule {rule_id}: message can't contain a top-level '|'")
+        return cls(rule_id, data.get('category', DEFAULT_CATEGORY), pattern, action,
+                   message, data.get('paths', ()), profiles)
+
+    def cache_entry(self):
+        """Every constructor argument, so a cached rule needs no re-validation"""
+        return [self.id, self.category, self.pattern, self.action, self.message, self.paths, self.profiles]
+
+    def to_dict(self):
+        """JSON-ready form, as written in the rule file"""
+        data = {'id': self.id, 'category': self.category, 'action': self.action}
+        if self.message is not None:
+            data['message'] = self.message
+        else:
+            data['pattern'] = self.pattern
+        if self.paths:
+            data['paths'] = self.paths
+        if list(self.profiles) != list(PROFILES):
+            data['profiles'] = self.profiles
+        return data
+
+    def applies_to(self, path):
+        """Check the rule's path scope; unscoped rules apply everywhere"""
+        if self._paths_re is None or path is None:
+            return True
+        return self._paths_re.match(Path(path).as_posix()) is not None
+
+    def literal(self):
+        """The message folded to lower case if it is plain text, else None"""
+        if self._literal is False:
+            tokens = split_tokens(self.message) if self.message is not None else None
+            literal = literal_text(tokens) if tokens is not None else None
+            self._literal = literal.casefold() if literal else None
+        return self._literal
+
+    def covers(self, other):
+        """Check if every call the other rule matches is matched by this one too.
+
+        Only decided for rules that behave the same way: equal action and path
+        scope. Identical patterns cover each other; a plain-text message covers
+        a plain-text message containing it, case-insensitively.
+        """
+        if self.action != other.action or self.paths != other.paths:
+            return False
+        if self.pattern == other.pattern:
+            return True
+        mine, theirs = self.literal(), other.literal()
+        return mine is not None and theirs is not None and mine in theirs
+
+
+def find_subsumed(rules):
+    """Return [(rule, covering rule)] for rules that can be dropped without changing any result.
+
+    A rule is dead when an earlier rule covers it. A later rule may stand
+    in for it too, as long as every rule in between has the same action, so
+    dropping it can't hand a call to a rule that treats it differently.
+    """
+    subsumed = []
+    dropped = set()
+    for index, rule in enumerate(rules):
+        # Earlier rules first, so the rule that already wins is the one kept
+        candidates = list(range(index)) + list(range(index + 1, len(rules)))
+        for other_index in candidates:
+            other = rules[other_index]
+            if other_index in dropped or not other.covers(rule):
+                continue
+            if other_index > index:
+                # Of two equivalent rules keep the earlier; it'll drop the other
+                if rule.covers(other):
+                    continue
+                if any(r.action != rule.action for r in rules[index + 1:other_index]):
+                    continue
+            subsumed.append((rule, other))
+            dropped.add(index)
+            break
+    return subsumed
+
+
+class RuleSet:
+    """All rules and categories of a rule file, split into profiles on demand"""
+
+    def __init__(self, rules, categories, digest=None, plans=None):
+        self.rules = rules
+        self.categories = categories
+        self.digest = digest
+        self.plans = {} if plans is None else plans
+        self._profiles = {}
+
+    @classmethod
+    def parse(cls, data, digest=None):
+        """Build a rule set from the parsed rule file"""
+        categories = {
+            name: Category(name, table.get('severity', 'info'), table.get('keywords', ()))
+            for name, table in data.get('categories', {}).items()
+        }
+        categories.setdefault(DEFAULT_CATEGORY, Category(DEFAULT_CATEGORY))
+
+        rules = [Rule.from_dict(table) for table in data.get('rule', [])]
+        seen = set()
+        for rule in rules:
+            if rule.id in seen:
+                raise RuleError(f"Duplicate rule id: {rule.id}")
+            if rule.category not in categories:
+                raise RuleError(f"Rule {rule.id}: unknown category {rule.category}")
+            seen.add(rule.id)
+        return cls(rules, categories, digest)
+
+    @classmethod
+    def load(cls, path=RULES_FILE, cache_file=None, write_cache=True):
+        """Load a rule file, reusing the cached analysis while the file's hash is unchanged.
+
+        Without a cache_file nothing is read or written; with write_cache off
+        an existing cache is used but never created or refreshed.
+        """
+        data = Path(path).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+
+        if cache_file is not None:
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get('version') == CACHE_VERSION and cached.get('digest') == digest:
+                    return cls.from_cache(cached)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        try:
+            rule_set = cls.parse(tomllib.loads(data.decode('utf-8')), digest)
+        except tomllib.TOMLDecodeError as e:
+            raise RuleError(f"{path}: {e}") from e
+
+        if cache_file is not None and write_cache:
+            try:
+                atomic_write(cache_file, json.dumps(rule_set.to_cache(), indent=1).encode('utf-8'))
+            except OSError:
+                pass
+        return rule_set
+
+    def to_cache(self):
+        """JSON-ready snapshot: rules, categories, and the analysed engines of every profile"""
+        profiles = {}
+        for name in PROFILES:
+            rules, subsumed = self.profile(name)
+            keep = [rule.pattern for rule in rules if rule.action == 'keep']
+            debug = [rule.pattern for rule in rules if rule.action in ('remove', 'rewrite')]
+            flag = [rule.pattern for rule in rules if rule.action == 'flag']
+            # The engines the cleaner builds, with leaks reported or removed
+            engines = [keep, debug, flag, flag + debug]
+            profiles[name] = {
+                'rules': [rule.id for rule in rules],
+                'subsumed': [[rule.id, by.id] for rule, by in subsumed],
+                'engines': [self.engine(patterns).plan() for patterns in engines],
+            }
+        return {
+            'version': CACHE_VERSION,
+            'digest': self.digest,
+            'categories': {name: category.to_dict() for name, category in self.categories.items()},
+            'rules': [rule.cache_entry() for rule in self.rules],
+            'profiles': profiles,
+        }
+
+    @classmethod
+    def from_cache(cls, cached):
+        """Rebuild a rule set from to_cache() output"""
+        categories = {name: Category(name, **table) for name, table in cached['categories'].items()}
+        rules = [Rule(*entry) for entry in cached['rules']]
+        by_id = {rule.id: rule for rule in rules}
+        plans = {}
+        rule_set = cls(rules, categories, cached['digest'], plans)
+        for name, profile in cached['profiles'].items():
+            rule_set._profiles[name] = (
+                [by_id[rule_id] for rule_id in profile['rules']],
+                [(by_id[rule_id], by_id[by]) for rule_id, by in profile['subsumed']],
+            )
+            for plan in profile['engines']:
+                plans[tuple(plan['patterns'])] = plan
+        return rule_set
+
+    def profile(self, name):
+        """Return (rules in effect, [(dropped rule, covering rule)]) for a profile"""
+        if name not in self._profiles:
+            rules = [rule for rule in self.rules if name in rule.profiles]
+            subsumed = find_subsumed(rules)
+            dropped = {id(rule) for rule, _ in subsumed}
+            self._profiles[name] = ([rule for rule in rules if id(rule) not in dropped], subsumed)
+        return self._profiles[name]
+
+    def engine(self, patterns):
+        """Pattern engine for a list of patterns, rebuilt from the cache when possible"""
+        plan = self.plans.get(tuple(patterns))
+        if plan is not None:
+            return DebugPatternEngine.from_plan(plan)
+        engine = DebugPatternEngine(patterns)
+        self.plans[tuple(patterns)] = engine.plan()
+        return engine
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Check the debug log cleanup rule file")
+    parser.add_argument("--rules", default=RULES_FILE, help=f"rule file (default: {RULES_FILE.name})")
+    args = parser.parse_args()
+
+    try:
+        rule_set = RuleSet.load(args.rules, cache_file=None)
+    except (OSError, RuleError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    print(f"📜 {args.rules}: {len(rule_set.rules)} rules in {len(rule_set.categories)} categories")
+    for name in PROFILES:
+        rules, subsumed = rule_set.profile(name)
+        actions = {action: sum(1 for rule in rules if rule.action == action) for action in ACTIONS}
+        print(f"\n🔧 Profile {name}: {len(rules)} rules in effect "
+              f"({', '.join(f'{count} {action}' for action, count in actions.items())})")
+        for rule, by in subsumed:
+            print(f"   ♻️  {rule.id} is covered by {by.id}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_cli(main))
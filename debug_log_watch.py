@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+File Watcher for the Woosh Debug Log Cleanup Scripts
+Reports saved files through inotify on Linux, falling back to polling elsewhere,
+and groups bursts of events so each save is handled once
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+from debug_log_files import PRUNED_DIRS
+
+# inotify event bits (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_Q_OVERFLOW = 0x00004000
+
+# Saved files arrive as close-after-write (editors writing in place) or as a
+# rename onto the target (editors and atomic_write); new directories get watched
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF
+
+_EVENT = struct.Struct('iIII')
+
+# Quiet time that ends a burst of events; well under the time a save takes to notice
+DEBOUNCE = 0.02
+
+
+def _watched_dirs(root, recursive):
+    """root plus (when recursive) every directory below it worth watching"""
+    directories = [root]
+    if recursive:
+        for directory, subdirs, _ in os.walk(root):
+            subdirs[:] = sorted(d for d in subdirs if d not in PRUNED_DIRS)
+            directories.extend(os.path.join(directory, d) for d in subdirs)
+    return directories
+
+
+class InotifyWatcher:
+    """Blocks in the kernel until a watched directory changes; costs nothing while idle"""
+
+    kind = "inotify"
+
+    def __init__(self, roots, recursive=True):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.recursive = recursive
+        self.directories = {}
+        try:
+            for root in roots:
+                for directory in _watched_dirs(root, recursive):
+                    self.add(directory)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def add(self, directory):
+        """Start watching a directory"""
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            # Directories can vanish between listing and watching
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(error, f"Can't watch {directory}: {os.strerror(error)}")
+        self.directories[wd] = directory
+
+    def wait(self, timeout=None):
+        """Return the files written since the last call, waiting up to timeout seconds (None = forever)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changed = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                print("⚠️  Too many file events at once; some saves may have been missed", file=sys.stderr)
+                continue
+            directory = self.directories.get(wd)
+            if directory is None:
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                self.directories.pop(wd, None)
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if self.recursive and mask & (IN_CREATE | IN_MOVED_TO) and os.fsdecode(name) not in PRUNED_DIRS:
+                    for new_directory in _watched_dirs(path, True):
+                        self.add(new_directory)
+                continue
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                changed.append(path)
+        return changed
+
+    def close(self):
+        """Stop watching"""
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Compares file modification times every interval, for systems without inotify"""
+
+    kind = "polling"
+
+    def __init__(self, roots, recursive=True, interval=0.25):
+        self.roots = list(roots)
+        self.recursive = recursive
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        """Map every watched file to its (mtime, size)"""
+        snapshot = {}
+        for root in self.roots:
+            for directory in _watched_dirs(root, self.recursive):
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if entry.is_file():
+                                stat = entry.stat()
+                                snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout=None):
+        """Return the files changed since the last call, waiting up to timeout seconds (None = forever)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if delay > 0:
+                time.sleep(delay)
+            snapshot = self.scan()
+            changed = [path for path, state in snapshot.items() if self.snapshot.get(path) != state]
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return sorted(changed)
+
+    def close(self):
+        """Stop watching"""
+
+
+def open_watcher(roots, recursive=True, polling=False):
+    """An inotify watcher where the platform has one, else a polling watcher"""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots, recursive)
+        except (OSError, AttributeError):
+            # No inotify in libc, or out of watches (fs.inotify.max_user_watches)
+            pass
+    return PollingWatcher(roots, recursive)
+
+
+def debounced(watcher, debounce=DEBOUNCE):
+    """Yield sets of changed files, each once the events have been quiet for debounce seconds"""
+    while True:
+        changed = set(watcher.wait())
+        if not changed:
+            continue
+        while True:
+            more = watcher.wait(debounce)
+            if not more:
+                break
+            changed.update(more)
+        yield changed
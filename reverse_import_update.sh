@@ -1,3 +1,19 @@
-      PID    PPID    PGID     WINPID   TTY         UID    STIME COMMAND
-      451     236     451      18324  cons0     197609 19:03:55 /usr/bin/PS
-      236       1     236      32772  cons0     197609 19:03:12 /usr/bin/bash
+#!/bin/bash
+
+# Script to point import statements back from 'woosh' to 'glamour_queen'
+# (undoes update_imports.sh)
+
+echo "Updating import statements from 'woosh' to 'glamour_queen'..."
+
+if [[ -f pubspec.yaml ]]; then
+    sed -i 's/^name: woosh$/name: glamour_queen/' pubspec.yaml
+fi
+
+# Dart files under lib/ and test/ go through the cleanup pipeline: one
+# read/rewrite/write pass per file, backed up in backup_debug_logs/, with
+# print removal switched off
+python3 cleanup_debug_logs.py --include 'lib/**/*.dart' --include 'test/**/*.dart' \
+    --rename-package woosh:glamour_queen --keep-prints || exit 1
+
+echo ""
+echo "Update completed! Run 'flutter clean' and 'flutter pub get' next."
@@ -13,7 +13,7 @@ if ! command -v python3 &> /dev/null; then
 fi
 
 # Check if we're in the right directory
-if [ ! -f "lib/pages/journeyplan/createJourneyplan.dart" ]; then
+if [ ! -f "lib/pages/journeyplan/create_journey_plan.dart" ]; then
     echo "❌ Please run this script from the woosh directory"
     exit 1
 fi
@@ -24,7 +24,7 @@ mkdir -p backup_debug_logs
 
 # Run the advanced cleanup script
 echo "🧹 Running debug log cleanup..."
-python3 cleanup_debug_logs_advanced.py
+python3 cleanup_debug_logs_advanced.py "$@"
 
 # Check if cleanup was successful
 if [ $? -eq 0 ]; then
@@ -35,7 +35,7 @@ if [ $? -eq 0 ]; then
     echo "1. Test the application thoroughly"
     echo "2. Check that all features still work"
     echo "3. Verify no critical errors were removed"
-    echo "4. If issues occur, restore from backup_debug_logs_advanced/"
+    echo "4. If issues occur, restore with: python3 debug_log_backup.py list / restore --run <id>"
     echo ""
     echo "💡 Performance improvements expected:"
     echo "   - Reduced I/O operations"
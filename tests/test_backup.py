@@ -0,0 +1,82 @@
+"""Tests for the backup store and the runs the cleaners create in it"""
+
+import sys
+
+import pytest
+
+from cleanup_debug_logs import DebugLogCleaner
+from debug_log_backup import BackupStore, main
+
+SOURCE = "void f() {\n  print('Loaded data');\n  g();\n}\n"
+
+
+def test_backup_without_files_creates_no_run(tmp_path):
+    store = BackupStore(tmp_path / "store")
+    assert store.backup([]) == (None, 0)
+    assert store.runs() == []
+
+
+def test_discard_drops_the_run_and_its_own_blobs(tmp_path):
+    kept, dropped = tmp_path / "kept.dart", tmp_path / "dropped.dart"
+    kept.write_text("a", encoding='utf-8')
+    dropped.write_text("b", encoding='utf-8')
+    store = BackupStore(tmp_path / "store")
+    first, _ = store.backup([kept])
+    second, _ = store.backup([kept, dropped])
+    assert store.discard(second) == 1
+    assert [run['id'] for run in store.runs()] == [first]
+    assert store.restore(first) == [str(kept)]
+
+
+def cleanup(tmp_path):
+    cleaner = DebugLogCleaner(base_path=tmp_path / "lib", incremental=True)
+    cleaner.target_files = ["page.dart"]
+    cleaner.service_files = []
+    cleaner.create_backup()
+    cleaner.clean_all_files()
+    cleaner.discard_unused_backup()
+    return cleaner
+
+
+def test_incremental_run_with_only_cache_hits_creates_no_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "page.dart").write_text(SOURCE, encoding='utf-8')
+    store = BackupStore(tmp_path / "backup_debug_logs")
+
+    assert cleanup(tmp_path).backup_run is not None
+    assert len(store.runs()) == 1
+    assert cleanup(tmp_path).backup_run is None
+    assert len(store.runs()) == 1
+
+
+def test_run_that_rewrites_nothing_is_dropped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "page.dart").write_text("void f() {}\n", encoding='utf-8')
+    assert cleanup(tmp_path).backup_run is None
+    assert BackupStore(tmp_path / "backup_debug_logs").runs() == []
+
+
+def test_blobs_and_manifests_leave_no_temporary_files(tmp_path):
+    path = tmp_path / "page.dart"
+    path.write_text(SOURCE, encoding='utf-8')
+    store = BackupStore(tmp_path / "store")
+    run_id, created = store.backup([path])
+    assert created == 1
+    stored = sorted(p.relative_to(store.root).as_posix() for p in store.root.rglob('*') if p.is_file())
+    assert len(stored) == 2
+    assert stored[-1] == f"runs/{run_id}.json"
+    assert store.get(store.load_run(run_id)['files'][str(path)]['sha256']) == SOURCE.encode('utf-8')
+
+
+def run_main(argv, monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['debug_log_backup.py', *argv])
+    return main()
+
+
+def test_prune_keeps_at_least_one_run(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        BackupStore(tmp_path).prune(0)
+    with pytest.raises(SystemExit):
+        run_main(['--backup-dir', str(tmp_path), 'prune', '--keep', '0'], monkeypatch)
@@ -0,0 +1,118 @@
+"""Tests for dart_scanner.py: finding print calls and folding them onto one line"""
+
+import pytest
+
+from cleanup_debug_logs import DebugLogCleaner
+from dart_scanner import is_part_file, is_string_literal, iter_calls, mask_source
+
+
+def calls(source):
+    return list(iter_calls(source))
+
+
+@pytest.mark.parametrize('source, canonical', [
+    ("print('Loaded');", "print('Loaded');"),
+    ("print(\n  'Multi '\n  'line',\n);", "print('Multi line' ,);"),
+    ("print('a' + value.toString());", "print('a' + value.toString());"),
+    ("print(\"It's ${user.name}\");", "print('Its ${user.name}');"),
+    ("print(r'raw \\n ${x}');", "print('raw \\n ${x}');"),
+    ("print('''triple\n'quoted' text''');", "print('triple quoted text');"),
+    ("console.log('web');", "console.log('web');"),
+])
+def test_canonical_folds_the_call_onto_one_line(source, canonical):
+    [call] = calls(source)
+    assert call.canonical == canonical
+
+
+@pytest.mark.parametrize('source, message', [
+    ("print('Count: ${items?.length ?? 0}');", "print('Count: ${}');"),
+    ("print('Mode: ${online ? 'ON' : 'OFF'} now');", "print('Mode: ${} now');"),
+    ("print('Map ${ {'k': 1}['k'] } end');", "print('Map ${} end');"),
+    ("print('Name: $name?');", "print('Name: $name?');"),
+    ("print(r'raw ${a ?? b}');", "print('raw ${a ?? b}');"),
+    ("print('Total ' '${a ?? b}' ' items');", "print('Total ${} items');"),
+])
+def test_message_empties_interpolations(source, message):
+    [call] = calls(source)
+    assert call.message == message
+
+
+def test_calls_in_strings_and_comments_are_ignored():
+    source = """
+// print('commented');
+/* print('block /* nested */ still comment'); */
+final s = 'print("in a string")';
+debugPrint('not print');
+reprint('not print either');
+print('real');
+"""
+    assert [call.canonical for call in calls(source)] == ["print('real');"]
+
+
+def test_statement_and_expression_calls():
+    source = "void f() {\n  print('a');\n  if (x) print('b');\n  g(() => print('c'));\n}\n"
+    assert [(call.canonical, call.statement) for call in calls(source)] == [
+        ("print('a');", True),
+        ("print('b');", False),
+        ("print('c');", False),
+    ]
+
+
+def test_statement_span_covers_the_semicolon():
+    source = "  print('a') ;  // note\nnext();\n"
+    [call] = calls(source)
+    assert source[call.start:call.end] == "print('a') ;"
+    assert call.line_span(source) == (0, source.index('next'))
+
+
+def test_call_sharing_a_line_only_loses_itself():
+    source = "a(); print('x'); b();\n"
+    [call] = calls(source)
+    start, end = call.line_span(source)
+    assert source[:start] + source[end:] == "a();  b();\n"
+
+
+def test_mask_source_keeps_offsets():
+    source = "f('a;b'); // c;\ng();"
+    masked = mask_source(source)
+    assert len(masked) == len(source)
+    assert masked == "f(" + " " * 5 + ");" + " " * 6 + "\ng();"
+
+
+def test_string_literal_detection():
+    assert is_string_literal("'a' \"b\"")
+    assert is_string_literal("r'raw'")
+    assert not is_string_literal("'a' + b")
+    assert not is_string_literal("name")
+
+
+def test_part_file_detection():
+    assert is_part_file("part of 'main.dart';\n")
+    assert not is_part_file("part 'other.dart';\n")
+
+
+@pytest.fixture(scope='module')
+def cleaner():
+    return DebugLogCleaner(dry_run=True)
+
+
+@pytest.mark.parametrize('line', [
+    "print('Token exists: ${token?.isNotEmpty ?? false}');",
+    "print('Status: ${_isOnline ? \"ONLINE\" : \"OFFLINE\"}');",
+])
+def test_message_rules_ignore_code_inside_interpolations(cleaner, line):
+    source = f"void f() {{\n  {line}\n}}\n"
+    assert list(cleaner.find_debug_calls(source, 'lib/services/sync.dart')) == []
+
+
+def test_message_rules_still_match_the_literal_text(cleaner):
+    source = "void f() {\n  print('Ready? ${a ?? b}');\n}\n"
+    [(call, rule)] = cleaner.find_debug_calls(source, 'lib/services/sync.dart')
+    assert cleaner.debug_rules[rule].id == 'question'
+
+
+def test_leak_rules_still_see_interpolated_values(cleaner):
+    source = "void f() {\n  print('Token exists: ${token?.isNotEmpty ?? token}');\n}\n"
+    leaks = []
+    list(cleaner.find_debug_calls(source, 'lib/services/api.dart', leaks))
+    assert [cleaner.leak_rules[index].id for _, index in leaks] == ['leak-token']
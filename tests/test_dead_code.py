@@ -0,0 +1,126 @@
+"""Tests for debug_log_dead_code.py: locals, Stopwatches and catch blocks left by removed prints"""
+
+import re
+
+from debug_log_dead_code import find_log_only_code
+
+
+def remove_prints(source):
+    """Delete every print line and whatever only fed it; return (result, findings)"""
+    spans = [(m.start(), m.end()) for m in re.finditer(r'^[ \t]*print\(.*\);\n', source, re.M)]
+    extra, findings = find_log_only_code(source, spans)
+    pieces = []
+    position = 0
+    for start, end in sorted(spans + extra):
+        pieces.append(source[position:start])
+        position = end
+    pieces.append(source[position:])
+    return ''.join(pieces), findings
+
+
+def kinds(findings):
+    return [(f['kind'], f['name'], f['action']) for f in findings]
+
+
+def test_local_only_read_by_a_print_goes():
+    cleaned, findings = remove_prints("""void send(Map payload) {
+  final body = jsonEncode(payload);
+  print('Sending $body');
+  post(payload);
+}
+""")
+    assert cleaned == """void send(Map payload) {
+  post(payload);
+}
+"""
+    assert kinds(findings) == [('local', 'body', 'remove')]
+
+
+def test_local_read_elsewhere_stays():
+    source = """void send(Map payload) {
+  final body = jsonEncode(payload);
+  print('Sending $body');
+  post(body);
+}
+"""
+    cleaned, findings = remove_prints(source)
+    assert cleaned == source.replace("  print('Sending $body');\n", '')
+    assert findings == []
+
+
+def test_local_with_side_effects_is_reported():
+    source = """Future<void> upload(File file) async {
+  final size = await file.length();
+  print('Uploading $size bytes');
+  await send(file);
+}
+"""
+    cleaned, findings = remove_prints(source)
+    assert 'final size = await file.length();' in cleaned
+    assert kinds(findings) == [('local', 'size', 'report')]
+
+
+def test_chain_of_locals_goes():
+    cleaned, findings = remove_prints("""void f(List items) {
+  final names = items.map((i) => i.name).toList();
+  final joined = names.join(', ');
+  print('Items: $joined');
+}
+""")
+    assert cleaned == "void f(List items) {\n}\n"
+    assert sorted(kinds(findings)) == [('local', 'joined', 'remove'), ('local', 'names', 'remove')]
+
+
+def test_stopwatch_read_by_a_print_goes_with_its_calls():
+    cleaned, findings = remove_prints("""Future<void> load() async {
+  final stopwatch = Stopwatch()..start();
+  await fetch();
+  stopwatch.stop();
+  print('Loaded in ${stopwatch.elapsedMilliseconds}ms');
+}
+""")
+    assert cleaned == """Future<void> load() async {
+  await fetch();
+}
+"""
+    assert kinds(findings) == [('stopwatch', 'stopwatch', 'remove')]
+
+
+def test_stopwatch_no_removed_print_read_stays():
+    source = """Future<void> load() async {
+  final stopwatch = Stopwatch()..start();
+  await fetch();
+  stopwatch.stop();
+  print('Loaded');
+}
+"""
+    cleaned, findings = remove_prints(source)
+    assert cleaned == source.replace("  print('Loaded');\n", '')
+    assert findings == []
+
+
+def test_stopwatch_read_by_live_code_stays():
+    source = """Future<int> load() async {
+  final stopwatch = Stopwatch()..start();
+  await fetch();
+  print('Took ${stopwatch.elapsedMilliseconds}ms');
+  return stopwatch.elapsedMilliseconds;
+}
+"""
+    cleaned, findings = remove_prints(source)
+    assert 'final stopwatch = Stopwatch()..start();' in cleaned
+    assert findings == []
+
+
+def test_catch_left_empty_is_reported_not_changed():
+    source = """Future<void> sync() async {
+  try {
+    await push();
+  } catch (e) {
+    print('Sync failed: $e');
+  }
+}
+"""
+    cleaned, findings = remove_prints(source)
+    assert cleaned == source.replace("    print('Sync failed: $e');\n", '')
+    assert kinds(findings) == [('empty-catch', None, 'report')]
@@ -0,0 +1,42 @@
+"""Tests for debug_log_git.py and the --staged check built on it"""
+
+import subprocess
+import sys
+
+import pytest
+
+from cleanup_debug_logs import main
+from debug_log_git import added_lines, read_index
+
+CLEAN = "void f() {\n  g();\n}\n"
+ADDED = "void f() {\n  print('Loaded data');\n  g();\n}\n"
+
+
+def git(*args):
+    subprocess.run(['git', '-c', 'user.email=dev@example.com', '-c', 'user.name=dev', *args],
+                   check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    git('init', '-q')
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "my page.dart").write_text(CLEAN, encoding='utf-8')
+    git('add', '.')
+    git('commit', '-qm', 'init')
+    (tmp_path / "lib" / "my page.dart").write_text(ADDED, encoding='utf-8')
+    git('add', '.')
+    return tmp_path
+
+
+def test_path_with_a_space_keeps_its_name(repo):
+    changes = added_lines(staged=True)
+    assert changes == {'lib/my page.dart': [(2, 2)]}
+    assert read_index(sorted(changes)) == {'lib/my page.dart': ADDED.encode('utf-8')}
+
+
+def test_staged_check_reports_a_print_in_a_path_with_a_space(repo, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['cleanup_debug_logs.py', '--staged', '--include', 'lib/**/*.dart'])
+    assert main() == 1
+    assert "lib/my page.dart:2:3: [loaded] print('Loaded data');" in capsys.readouterr().out
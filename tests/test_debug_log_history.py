@@ -0,0 +1,43 @@
+"""Tests for ranking print regressions in the history index"""
+
+import pytest
+
+from debug_log_history import HistoryIndex
+
+
+def _index(history, *commits):
+    """Store commits given as {path: debug prints}, oldest first"""
+    for depth, files in enumerate(commits, 1):
+        sha = f"c{depth}"
+        history.db.execute("INSERT INTO commits VALUES (?, ?, ?, '', '', ?, 0, 0, 0)",
+                           (sha, depth, depth, len(files)))
+        for path, debug in files.items():
+            blob = f"{path}@{debug}"
+            history.db.execute("INSERT OR IGNORE INTO blobs VALUES (?, ?, 0, ?, ?)", (blob, path, debug, debug))
+            history.db.execute("INSERT INTO files VALUES (?, ?, ?)", (sha, path, blob))
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = HistoryIndex(tmp_path / "history.sqlite")
+    yield history
+    history.close()
+
+
+def test_deleted_file_has_no_prints_now(history):
+    _index(history,
+           {'lib/services/a.dart': 1, 'lib/services/b.dart': 0},
+           {'lib/services/a.dart': 4, 'lib/services/b.dart': 2},
+           {'lib/services/b.dart': 2})
+    assert history.regressions() == [
+        ('lib/services/a.dart', 1, 3, 4, 0),
+        ('lib/services/b.dart', 1, 2, 0, 2),
+    ]
+
+
+def test_file_restored_after_deletion_counts_from_zero(history):
+    _index(history,
+           {'lib/services/a.dart': 3},
+           {},
+           {'lib/services/a.dart': 3})
+    assert history.regressions() == [('lib/services/a.dart', 1, 3, 3, 3)]
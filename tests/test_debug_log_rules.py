@@ -0,0 +1,153 @@
+"""Tests for debug_log_rules.py: rule subsumption and the rules cache"""
+
+import pytest
+
+from debug_log_rules import RuleError, RuleSet, cache_path, find_subsumed
+
+RULES = '''
+[categories.sync]
+keywords = ["sync"]
+
+[[rule]]
+id = "debug"
+message = 'debug'
+
+[[rule]]
+id = "debug-making-call"
+message = 'Debug - Making API call'
+
+[[rule]]
+id = "exception"
+action = "keep"
+message = 'Exception'
+
+[[rule]]
+id = "syncing"
+category = "sync"
+message = 'Syncing'
+
+[[rule]]
+id = "syncing-pending"
+category = "sync"
+message = 'Syncing pending sessions'
+paths = ["lib/services/**"]
+'''
+
+
+def write_rules(tmp_path, text=RULES):
+    path = tmp_path / "rules.toml"
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def by_id(rule_set):
+    return {rule.id: rule for rule in rule_set.rules}
+
+
+def test_message_containing_an_earlier_message_is_subsumed(tmp_path):
+    rule_set = RuleSet.load(write_rules(tmp_path))
+    pairs = [(rule.id, by.id) for rule, by in find_subsumed(rule_set.rules)]
+    assert ('debug-making-call', 'debug') in pairs
+
+
+def test_rules_with_other_paths_or_actions_are_kept(tmp_path):
+    rule_set = RuleSet.load(write_rules(tmp_path))
+    dropped = {rule.id for rule, _ in find_subsumed(rule_set.rules)}
+    # Scoped to other files than 'syncing', so it isn't covered by it
+    assert 'syncing-pending' not in dropped
+    assert 'exception' not in dropped
+
+
+def test_later_rule_only_stands_in_across_rules_with_the_same_action(tmp_path):
+    rule_set = RuleSet.load(write_rules(tmp_path, '''
+[[rule]]
+id = "making-call"
+message = 'Making API call'
+
+[[rule]]
+id = "keep-api"
+action = "keep"
+message = 'API'
+
+[[rule]]
+id = "making"
+message = 'Making'
+'''))
+    # 'making' covers 'making-call', but a keep rule sits between them
+    assert find_subsumed(rule_set.rules) == []
+
+
+def test_identical_patterns_keep_the_earlier_rule(tmp_path):
+    rule_set = RuleSet.load(write_rules(tmp_path, '''
+[[rule]]
+id = "first"
+message = 'Loaded'
+
+[[rule]]
+id = "second"
+message = 'Loaded'
+'''))
+    rules = by_id(rule_set)
+    assert find_subsumed(rule_set.rules) == [(rules['second'], rules['first'])]
+
+
+def test_profile_drops_subsumed_rules(tmp_path):
+    rules, subsumed = RuleSet.load(write_rules(tmp_path)).profile('basic')
+    assert 'debug-making-call' not in {rule.id for rule in rules}
+    assert [rule.id for rule, _ in subsumed] == ['debug-making-call']
+
+
+def test_duplicate_ids_are_rejected(tmp_path):
+    with pytest.raises(RuleError, match="Duplicate rule id"):
+        RuleSet.load(write_rules(tmp_path, RULES + '''
+[[rule]]
+id = "debug"
+message = 'again'
+'''))
+
+
+def test_load_without_a_cache_file_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = write_rules(tmp_path)
+    RuleSet.load(path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['rules.toml']
+
+
+def test_cache_lives_beside_the_rule_file_and_is_reused(tmp_path, monkeypatch):
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    path = write_rules(tmp_path)
+    cache = cache_path(path)
+    assert cache == tmp_path / ".rules_cache.json"
+
+    first = RuleSet.load(path, cache)
+    assert cache.exists()
+    assert list(workdir.iterdir()) == []
+    second = RuleSet.load(path, cache)
+    assert [rule.id for rule in second.profile('basic')[0]] == [rule.id for rule in first.profile('basic')[0]]
+
+
+def test_read_only_load_never_writes_the_cache(tmp_path):
+    path = write_rules(tmp_path)
+    cache = cache_path(path)
+    RuleSet.load(path, cache, write_cache=False)
+    assert not cache.exists()
+
+
+def test_cache_holds_every_engine_the_cleaner_builds(tmp_path):
+    path = write_rules(tmp_path, RULES + '''
+[[rule]]
+id = "leak-token"
+action = "flag"
+pattern = 'token'
+''')
+    cache = cache_path(path)
+    RuleSet.load(path, cache)
+    rule_set = RuleSet.load(path, cache)
+    rules, _ = rule_set.profile('basic')
+    keep = [rule.pattern for rule in rules if rule.action == 'keep']
+    debug = [rule.pattern for rule in rules if rule.action in ('remove', 'rewrite')]
+    flag = [rule.pattern for rule in rules if rule.action == 'flag']
+    for patterns in (keep, debug, flag, flag + debug):
+        assert tuple(patterns) in rule_set.plans
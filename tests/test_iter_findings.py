@@ -0,0 +1,45 @@
+"""Tests for iter_findings: streaming findings over many files, in order"""
+
+import pytest
+
+from cleanup_debug_logs import FILES_PER_TASK, iter_findings
+from debug_log_findings import FindingError
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for number in range(60):
+        (tmp_path / f"page_{number:02}.dart").write_text(
+            f"void f() {{\n  print('Loaded page {number}');\n  g();\n}}\n", encoding='utf-8')
+    return tmp_path
+
+
+def test_findings_come_in_file_order_whatever_the_jobs(tree):
+    serial = [(f.file, f.line, f.rule) for f in iter_findings([tree])]
+    parallel = [(f.file, f.line, f.rule) for f in iter_findings([tree], jobs=2)]
+    assert len(serial) == 60
+    assert parallel == serial
+
+
+def test_workers_only_take_a_window_of_files(tree):
+    taken = []
+
+    def paths():
+        for path in sorted(tree.iterdir()):
+            taken.append(path)
+            yield path
+
+    findings = iter_findings(paths(), jobs=2)
+    next(findings)
+    # Two workers get two tasks each, plus the file islice stopped on
+    assert len(taken) <= 2 * 2 * FILES_PER_TASK + 1
+    assert len(list(findings)) == 59
+
+
+def test_unreadable_files_raise_or_are_collected(tree):
+    missing = tree / "missing.dart"
+    with pytest.raises(FindingError):
+        list(iter_findings([missing]))
+    errors = []
+    assert len(list(iter_findings([missing, tree / "page_00.dart"], errors=errors))) == 1
+    assert [error['file'] for error in errors] == [str(missing)]
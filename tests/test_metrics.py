@@ -0,0 +1,39 @@
+"""Tests for the run metrics: every active rule is counted, flag rules under their own action"""
+
+import pytest
+
+from cleanup_debug_logs import DebugLogCleaner
+
+SOURCE = """void f() {
+  print('Loaded ${user.name}');
+  print('Auth token: $token');
+  print('Exception: $e');
+}
+"""
+
+
+def rule_records(leaks, tmp_path):
+    cleaner = DebugLogCleaner(dry_run=True, leaks=leaks, metrics_json=tmp_path / "metrics.json")
+    cleaner.clean_source(SOURCE, file_path='lib/services/auth.dart')
+    cleaner.metrics.time_rules('lib/services/auth.dart')
+    cleaner.metrics.merge(cleaner.metrics.drain())
+    return {record['id']: record for record in cleaner.metrics.rule_records()}
+
+
+@pytest.mark.parametrize('leaks', ['report', 'remove'])
+def test_flag_rules_are_counted(leaks, tmp_path):
+    records = rule_records(leaks, tmp_path)
+    token = records['leak-token']
+    assert (token['action'], token['hits'], token['matches']) == ('flag', 1, 1)
+    assert records['loaded']['hits'] == 1
+    assert records['exception']['hits'] == 1
+
+
+@pytest.mark.parametrize('leaks, loaded, flagged', [('report', 1, 1), ('remove', 0, 1)])
+def test_flagged_call_counts_for_the_rule_that_decided_it(leaks, loaded, flagged, tmp_path):
+    cleaner = DebugLogCleaner(dry_run=True, leaks=leaks, metrics_json=tmp_path / "metrics.json")
+    cleaner.clean_source("void f() {\n  print('Loaded session $token');\n}\n", file_path='lib/auth.dart')
+    cleaner.metrics.merge(cleaner.metrics.drain())
+    hits = {record['id']: record['hits'] for record in cleaner.metrics.rule_records()}
+    # Reported, the leak is removed by 'loaded' and flagged on top; removed, the leak rule decides it
+    assert (hits['loaded'], hits['leak-token']) == (loaded, flagged)
@@ -0,0 +1,103 @@
+"""Tests for --rewrite: kDebugMode-guarded debugPrint calls and the foundation import"""
+
+import pytest
+
+from cleanup_debug_logs import DebugLogCleaner
+from dart_scanner import add_import
+
+FOUNDATION = 'package:flutter/foundation.dart'
+NAMES = ('kDebugMode', 'debugPrint')
+EXPORTERS = ('package:flutter/material.dart',)
+
+BODY = """
+void save() {
+  print('💾 Cached session data');
+}
+"""
+
+REWRITTEN = """
+void save() {
+  if (kDebugMode) debugPrint('[cache] ' '💾 Cached session data');
+}
+"""
+
+
+@pytest.fixture(scope='module')
+def cleaner():
+    return DebugLogCleaner(rewrite=True, dry_run=True)
+
+
+def rewrite(cleaner, source):
+    cleaned, _ = cleaner.clean_source(source, file_path='lib/services/session.dart')
+    return cleaned
+
+
+def test_print_becomes_guarded_debug_print_with_import(cleaner):
+    source = "import 'package:http/http.dart' as http;\n" + BODY
+    assert rewrite(cleaner, source) == (
+        "import 'package:http/http.dart' as http;\n"
+        "import 'package:flutter/foundation.dart';\n" + REWRITTEN
+    )
+
+
+def test_rewrite_is_idempotent(cleaner):
+    once = rewrite(cleaner, "import 'package:http/http.dart';\n" + BODY)
+    assert rewrite(cleaner, once) == once
+
+
+@pytest.mark.parametrize('source', [
+    "import 'package:flutter/material.dart';\n",
+    "import 'package:flutter/widgets.dart';\n",
+    "import 'package:flutter/cupertino.dart';\n",
+    "import 'package:flutter/foundation.dart';\n",
+    "import \"package:flutter/foundation.dart\" show debugPrint, kDebugMode;\n",
+])
+def test_no_import_added_when_names_are_in_scope(cleaner, source):
+    assert rewrite(cleaner, source + BODY) == source + REWRITTEN
+
+
+def test_show_list_is_extended(cleaner):
+    source = "import 'package:flutter/foundation.dart' show kIsWeb;\n" + BODY
+    assert rewrite(cleaner, source) == (
+        "import 'package:flutter/foundation.dart' show kIsWeb, kDebugMode, debugPrint;\n" + REWRITTEN
+    )
+
+
+def test_show_list_only_gets_the_missing_names():
+    source = "import 'package:flutter/foundation.dart' show kDebugMode;\n"
+    assert add_import(source, FOUNDATION, NAMES, EXPORTERS) == (
+        "import 'package:flutter/foundation.dart' show kDebugMode, debugPrint;\n"
+    )
+
+
+def test_hidden_names_get_an_unrestricted_import():
+    source = "import 'package:flutter/foundation.dart' hide debugPrint;\n\nvoid f() {}\n"
+    assert add_import(source, FOUNDATION, NAMES, EXPORTERS) == (
+        "import 'package:flutter/foundation.dart' hide debugPrint;\n"
+        "import 'package:flutter/foundation.dart';\n\nvoid f() {}\n"
+    )
+
+
+def test_exporter_with_a_show_list_does_not_count():
+    source = "import 'package:flutter/material.dart' show Colors;\n"
+    assert add_import(source, FOUNDATION, NAMES, EXPORTERS) == (
+        source + "import 'package:flutter/foundation.dart';\n"
+    )
+
+
+def test_prefixed_import_does_not_count():
+    source = "import 'package:flutter/foundation.dart' as foundation;\n"
+    assert add_import(source, FOUNDATION, NAMES, EXPORTERS) == (
+        source + "import 'package:flutter/foundation.dart';\n"
+    )
+
+
+def test_import_goes_first_without_directives():
+    assert add_import("void f() {}\n", FOUNDATION, NAMES) == (
+        "import 'package:flutter/foundation.dart';\nvoid f() {}\n"
+    )
+
+
+def test_part_files_are_left_alone(cleaner):
+    source = "part of 'session.dart';\n" + BODY
+    assert rewrite(cleaner, source) == source
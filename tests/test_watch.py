@@ -0,0 +1,40 @@
+"""Tests for --watch: one transform pass per saved file"""
+
+from cleanup_debug_logs import DebugLogCleaner
+
+SOURCE = "void f() {\n  print('Loaded data');\n  g();\n}\n"
+
+
+def watched(tmp_path, monkeypatch, source):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "page.dart"
+    path.write_text(source, encoding='utf-8')
+    cleaner = DebugLogCleaner(base_path=tmp_path)
+    passes = []
+    apply = cleaner.pipeline.apply
+
+    def counted(*args, **kwargs):
+        passes.append(args[1])
+        return apply(*args, **kwargs)
+
+    monkeypatch.setattr(cleaner.pipeline, 'apply', counted)
+    cleaner.watch_file(path)
+    return cleaner, path, passes
+
+
+def test_saved_file_is_cleaned_in_one_pass(tmp_path, monkeypatch):
+    cleaner, path, passes = watched(tmp_path, monkeypatch, SOURCE)
+    assert passes == [path]
+    assert path.read_text(encoding='utf-8') == "void f() {\n  g();\n}\n"
+    assert cleaner.backup_run is not None
+    assert (tmp_path / "backup_debug_logs").is_dir()
+    # The rewrite's own change event is recognised and skipped
+    assert cleaner.written[str(path)] == path.stat().st_mtime_ns
+
+
+def test_clean_file_is_not_backed_up_or_rewritten(tmp_path, monkeypatch):
+    cleaner, path, passes = watched(tmp_path, monkeypatch, "void f() {\n  g();\n}\n")
+    assert passes == [path]
+    assert cleaner.backup_run is None
+    assert not (tmp_path / "backup_debug_logs").exists()
+    assert cleaner.written == {}
@@ -4,35 +4,6 @@
 
 echo "Updating import statements from 'glamour_queen' to 'woosh'..."
 
-# Function to update imports in a single file
-update_imports_in_file() {
-    local file_path="$1"
-    
-    if [[ ! -f "$file_path" ]]; then
-        return 1
-    fi
-    
-    # Create backup
-    cp "$file_path" "$file_path.backup"
-    
-    # Update package imports
-    sed -i 's|import '\''package:glamour_queen/|import '\''package:woosh/|g' "$file_path"
-    
-    # Update relative imports
-    sed -i 's|import '\''../../glamour_queen/|import '\''../../woosh/|g' "$file_path"
-    sed -i 's|import '\''../glamour_queen/|import '\''../woosh/|g' "$file_path"
-    sed -i 's|import '\''glamour_queen/|import '\''woosh/|g' "$file_path"
-    
-    if ! cmp -s "$file_path" "$file_path.backup"; then
-        echo "Updated: $file_path"
-        rm "$file_path.backup"
-        return 0
-    else
-        rm "$file_path.backup"
-        return 1
-    fi
-}
-
 # Function to update pubspec.yaml
 update_pubspec_yaml() {
     local pubspec_path="pubspec.yaml"
@@ -56,28 +27,6 @@ update_pubspec_yaml() {
     fi
 }
 
-# Function to update test file
-update_test_files() {
-    local test_path="test/widget_test.dart"
-    
-    if [[ ! -f "$test_path" ]]; then
-        return 1
-    fi
-    
-    cp "$test_path" "$test_path.backup"
-    
-    sed -i "s|import 'package:glamour_queen/main.dart';|import 'package:woosh/main.dart';|g" "$test_path"
-    
-    if ! cmp -s "$test_path.backup" "$test_path"; then
-        echo "Updated: $test_path"
-        rm "$test_path.backup"
-        return 0
-    else
-        rm "$test_path.backup"
-        return 1
-    fi
-}
-
 # Function to update Android package name
 update_android_files() {
     local android_files=(
@@ -104,40 +53,25 @@ update_android_files() {
 
 # Main logic
 updated_files=0
-total_files=0
 
 if update_pubspec_yaml; then
     ((updated_files++))
 fi
-((total_files++))
-
-if update_test_files; then
-    ((updated_files++))
-fi
-((total_files++))
 
 update_android_files
 
+# Dart files under lib/ and test/ go through the cleanup pipeline: one
+# read/rewrite/write pass per file, backed up in backup_debug_logs/, with
+# print removal switched off
 echo "Scanning Dart files to update..."
-while IFS= read -r -d '' file; do
-    ((total_files++))
-    if update_imports_in_file "$file"; then
-        ((updated_files++))
-    fi
-done < <(find lib test -name "*.dart" -type f -print0 2>/dev/null)
+python3 cleanup_debug_logs.py --include 'lib/**/*.dart' --include 'test/**/*.dart' \
+    --rename-package glamour_queen:woosh --keep-prints || exit 1
 
 echo ""
 echo "Update completed!"
-echo "Files processed: $total_files"
-echo "Files updated: $updated_files"
-
-if [[ $updated_files -gt 0 ]]; then
-    echo ""
-    echo "Next steps:"
-    echo "1. Run 'flutter clean'"
-    echo "2. Run 'flutter pub get'"
-    echo "3. Test your application thoroughly"
-else
-    echo ""
-    echo "No files were updated. All may already be correct."
-fi
+echo "Project files updated: $updated_files (Dart files are listed in the report above)"
+echo ""
+echo "Next steps:"
+echo "1. Run 'flutter clean'"
+echo "2. Run 'flutter pub get'"
+echo "3. Test your application thoroughly"
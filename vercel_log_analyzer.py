@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+Vercel Request Log Analyzer for Woosh
+Streams a Vercel log export (a JSON array or JSON Lines of request records)
+in constant memory, reports latency percentiles, error and cache-miss rates
+per endpoint, and maps each endpoint back to the Dart service methods that
+call it and the screens that use those methods
+"""
+
+import argparse
+import bisect
+import codecs
+import json
+import math
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from dart_scanner import mask_source
+from debug_log_files import atomic_write, run_cli, walk_files
+from debug_log_hotspots import enclosing_calls
+
+# Bytes read from the export at a time
+CHUNK_SIZE = 1 << 20
+
+# A single record larger than this means the file isn't a log export
+MAX_RECORD = 64 << 20
+
+# Relative error of the latency percentiles; sets the histogram bucket width
+RELATIVE_ACCURACY = 0.01
+
+# Endpoints tracked one by one; the rest are pooled so memory stays bounded
+MAX_ENDPOINTS = 1000
+OTHER_ENDPOINT = ('*', '(other endpoints)')
+
+# Where the Dart code that calls the API lives, and where the screens live
+SERVICE_GLOBS = ('lib/services/**/*.dart',)
+SCREEN_GLOBS = ('lib/**/*.dart',)
+
+HTTP_VERBS = ('get', 'post', 'put', 'patch', 'delete', 'head')
+
+_ID_SEGMENT = re.compile(r'^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|[0-9a-fA-F]{16,}|[A-Za-z0-9_-]*\d[A-Za-z0-9_-]{19,})$')
+_STRING_LITERAL = re.compile(r"""'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*\"""")
+_INTERPOLATION = re.compile(r'\$\{([^{}]*)\}|\$([A-Za-z_][\w]*)')
+_BASE_NAME = re.compile(r'^(?:[A-Za-z_]\w*\.)?_?\w*[bB]ase[uU]rl$')
+_BASE_DEFINITION = re.compile(r'\bString\s+(?:get\s+)?(_?\w*[bB]ase[uU]rl)\s*(?:=>|=)\s*([^;]+);')
+_CLASS = re.compile(r'^(?:abstract\s+)?class\s+(\w+)', re.M)
+_VERB_CALL = re.compile(r'\.(get|post|put|patch|delete|head)\s*\(|Request\s*\(\s*[\'"](GET|POST|PUT|PATCH|DELETE|HEAD)[\'"]')
+
+
+def iter_records(path, chunk_size=CHUNK_SIZE):
+    """Yield the objects of a JSON array (or JSON Lines) file one at a time.
+
+    Only one chunk and the record being parsed are held in memory. A file
+    cut off mid-record (an interrupted export) ends the stream with a
+    warning instead of an error.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')('replace')
+    buffer = ''
+    position = 0
+    started = False
+    eof = False
+    with open(path, 'rb') as f:
+        while True:
+            # Separators between records: the array brackets, commas and whitespace
+            while position < len(buffer) and buffer[position] in ' \t\r\n,[]\ufeff':
+                if buffer[position] == '[':
+                    started = True
+                position += 1
+            if position < len(buffer):
+                try:
+                    record, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        print(f"⚠️  {path} ends mid-record; ignored its last "
+                              f"{len(buffer) - position:,} characters", file=sys.stderr)
+                        return
+                    if len(buffer) - position > MAX_RECORD:
+                        raise ValueError(f"{path}: no complete JSON record in {MAX_RECORD:,} characters")
+                else:
+                    position = end
+                    started = True
+                    if isinstance(record, dict):
+                        yield record
+                    continue
+            elif eof:
+                return
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + utf8.decode(chunk, final=eof)
+            position = 0
+            if eof and not started and not buffer.strip():
+                return
+
+
+class LatencySketch:
+    """Histogram of durations in buckets a fixed ratio apart.
+
+    Any percentile comes back within RELATIVE_ACCURACY of the true value, and
+    the bucket count grows with log(max / min) rather than with the number of
+    requests: about 700 buckets cover 1 ms to 20 minutes at 1%.
+    """
+
+    __slots__ = ('gamma', 'log_gamma', 'buckets', 'zeros', 'count', 'total', 'maximum')
+
+    def __init__(self, accuracy=RELATIVE_ACCURACY):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, value):
+        """Record one duration"""
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+        if value <= 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def quantile(self, q):
+        """Estimated q-quantile (0..1) of the recorded durations, or None if there are none"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return min(2 * self.gamma ** index / (self.gamma + 1), self.maximum)
+        return self.maximum
+
+
+class EndpointStats:
+    """Counters for one (method, path) endpoint"""
+
+    __slots__ = ('latency', 'server_errors', 'client_errors', 'cache_known', 'cache_misses',
+                 'memory_max', 'memory_total', 'memory_count')
+
+    def __init__(self):
+        self.latency = LatencySketch()
+        self.server_errors = 0
+        self.client_errors = 0
+        self.cache_known = 0
+        self.cache_misses = 0
+        self.memory_max = 0
+        self.memory_total = 0
+        self.memory_count = 0
+
+    def add(self, record):
+        """Count one request record"""
+        self.latency.add(max(record.get('durationMs') or 0, 0))
+        status = record.get('responseStatusCode') or 0
+        if status >= 500:
+            self.server_errors += 1
+        elif status >= 400:
+            self.client_errors += 1
+        cache = record.get('vercelCache')
+        if cache:
+            self.cache_known += 1
+            self.cache_misses += cache == 'MISS'
+        memory = record.get('maxMemoryUsed')
+        if isinstance(memory, (int, float)) and memory >= 0:
+            self.memory_count += 1
+            self.memory_total += memory
+            self.memory_max = max(self.memory_max, memory)
+
+    def summary(self):
+        """JSON-ready figures for the report"""
+        count = self.latency.count
+        return {
+            'requests': count,
+            'p50_ms': _round(self.latency.quantile(0.50)),
+            'p95_ms': _round(self.latency.quantile(0.95)),
+            'p99_ms': _round(self.latency.quantile(0.99)),
+            'max_ms': _round(self.latency.maximum),
+            'mean_ms': _round(self.latency.total / count) if count else None,
+            'error_rate': round(self.server_errors / count, 4) if count else 0.0,
+            'client_error_rate': round(self.client_errors / count, 4) if count else 0.0,
+            'cache_miss_rate': round(self.cache_misses / self.cache_known, 4) if self.cache_known else None,
+            'memory_max_mb': self.memory_max if self.memory_count else None,
+            'memory_mean_mb': _round(self.memory_total / self.memory_count) if self.memory_count else None,
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 1)
+
+
+@lru_cache(maxsize=4096)
+def normalize_path(request_path):
+    """'host/api/journey-plans/123?x=1' -> '/api/journey-plans/:id'"""
+    path = request_path.split('?', 1)[0]
+    if '://' in path:
+        path = urlsplit(path).path
+    elif not path.startswith('/'):
+        # Vercel puts the host in front of the path
+        path = '/' + path.split('/', 1)[1] if '/' in path else '/'
+    segments = [':id' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/')]
+    return '/'.join(segments).rstrip('/') or '/'
+
+
+def is_request(record):
+    """True for the request record itself, False for the console lines Vercel logs alongside it"""
+    return (record.get('responseStatusCode', -1) or 0) >= 0 and (record.get('durationMs', -1) or 0) >= 0
+
+
+def analyze(records, max_endpoints=MAX_ENDPOINTS):
+    """Aggregate request records per (method, normalized path); return (endpoints, totals)"""
+    endpoints = {}
+    totals = {'records': 0, 'requests': 0, 'log_lines': 0, 'pooled': 0, 'first': None, 'last': None}
+    for record in records:
+        totals['records'] += 1
+        if not is_request(record):
+            totals['log_lines'] += 1
+            continue
+        totals['requests'] += 1
+        key = ((record.get('requestMethod') or '?').upper(), normalize_path(record.get('requestPath') or '/'))
+        stats = endpoints.get(key)
+        if stats is None:
+            if len(endpoints) >= max_endpoints:
+                key = OTHER_ENDPOINT
+                totals['pooled'] += 1
+            stats = endpoints.setdefault(key, EndpointStats())
+        stats.add(record)
+        timestamp = record.get('timestampInMs')
+        if isinstance(timestamp, (int, float)):
+            totals['first'] = timestamp if totals['first'] is None else min(totals['first'], timestamp)
+            totals['last'] = timestamp if totals['last'] is None else max(totals['last'], timestamp)
+    return endpoints, totals
+
+
+class CallSite:
+    """A Dart URL literal built on a base URL, and the service method it is in"""
+
+    __slots__ = ('verb', 'template', 'regex', 'owner', 'function', 'file', 'line')
+
+    def __init__(self, verb, template, owner, function, file, line):
+        self.verb = verb
+        self.template = template
+        self.owner = owner
+        self.function = function
+        self.file = file
+        self.line = line
+        pattern = ''.join('[^/]+' if piece == '{}' else re.escape(piece)
+                          for piece in re.split(r'(\{\})', template))
+        self.regex = re.compile(pattern + '/?')
+
+    @property
+    def method(self):
+        """ClassName.method, as a screen would call it"""
+        return f"{self.owner}.{self.function}" if self.owner else self.function or '?'
+
+    def matches(self, verb, path):
+        """True if a request (verb, normalized path) could come from this call site.
+
+        HEAD and OPTIONS (CORS preflight) requests go with any method's call.
+        """
+        return ((self.verb is None or self.verb == verb or verb in ('HEAD', 'OPTIONS'))
+                and self.regex.fullmatch(path) is not None)
+
+
+class CallSiteIndex:
+    """Every API URL the Dart services build, with the screens that call each service method"""
+
+    def __init__(self, sites, screens):
+        self.sites = sites
+        self.screens = screens
+
+    @classmethod
+    def from_tree(cls, root='.', services=SERVICE_GLOBS, screens=SCREEN_GLOBS):
+        """Scan the service files for URL literals and the screens for calls to their methods"""
+        sources = {}
+        for path in walk_files(root, screens):
+            sources[path] = path.read_text(encoding='utf-8', errors='replace')
+        service_paths = list(walk_files(root, services))
+        for path in service_paths:
+            if path not in sources:
+                sources[path] = path.read_text(encoding='utf-8', errors='replace')
+
+        bases = _base_urls(sources)
+        sites = []
+        seen = set()
+        for path in service_paths:
+            for site in _call_sites(sources[path], os.path.relpath(path, root), bases):
+                # The same URL built twice in one method (a log line, a retry) is one call site
+                if (site.verb, site.template, site.method) not in seen:
+                    seen.add((site.verb, site.template, site.method))
+                    sites.append(site)
+
+        # A screen uses a method if it calls .method( and names the method's class
+        by_function = {}
+        for site in sites:
+            if site.function:
+                by_function.setdefault(site.function, set()).add(site.owner)
+        users = {}
+        if by_function:
+            call = re.compile(r'\.(' + '|'.join(map(re.escape, sorted(by_function))) + r')\s*\(')
+            service_set = set(service_paths)
+            for path, source in sources.items():
+                if path in service_set:
+                    continue
+                relative = os.path.relpath(path, root)
+                for function in set(call.findall(source)):
+                    for owner in by_function[function]:
+                        if owner and re.search(rf'\b{re.escape(owner)}\b', source):
+                            users.setdefault(f"{owner}.{function}", set()).add(relative)
+        return cls(sites, {method: sorted(files) for method, files in users.items()})
+
+    def lookup(self, verb, path):
+        """Call sites whose URL matches the endpoint"""
+        return [site for site in self.sites if site.matches(verb, path)]
+
+
+class _ClassIndex:
+    """Which top-level class a position in a Dart file falls in"""
+
+    def __init__(self, masked):
+        matches = list(_CLASS.finditer(masked))
+        self.starts = [m.start() for m in matches]
+        self.names = [m.group(1) for m in matches]
+
+    def at(self, position):
+        """Name of the last class declared before position, or None"""
+        index = bisect.bisect_right(self.starts, position) - 1
+        return self.names[index] if index >= 0 else None
+
+
+def _literal_text(literal):
+    """The contents of a Dart string literal token"""
+    return literal[1:-1]
+
+
+def _resolve(text, names, bases, depth=0):
+    """A base URL expression's path ('/api'), or None if it can't be worked out"""
+    text = text.strip()
+    if depth > 5:
+        return None
+    if text[:1] in '\'"':
+        value = _literal_text(text)
+        for m in _INTERPOLATION.finditer(value):
+            resolved = _resolve(m.group(1) or m.group(2), names, bases, depth + 1)
+            if resolved is None:
+                return None
+            value = value.replace(m.group(0), resolved, 1)
+        return urlsplit(value).path.rstrip('/') if '://' in value else value.rstrip('/')
+    if text in names:
+        return _resolve(names[text], names, bases, depth + 1)
+    if text in bases:
+        return _resolve(bases[text][0], bases[text][1], bases, depth + 1)
+    return None
+
+
+def _base_urls(sources):
+    """Map Class.baseUrl to (expression, the file's own base names) for every definition"""
+    bases = {}
+    for source in sources.values():
+        if 'aseUrl' not in source and 'aseURL' not in source:
+            continue
+        masked = mask_source(source, strings=False)
+        owners = _ClassIndex(masked)
+        names = {}
+        for m in _BASE_DEFINITION.finditer(masked):
+            names[m.group(1)] = m.group(2)
+            owner = owners.at(m.start())
+            if owner:
+                bases[f"{owner}.{m.group(1)}"] = (m.group(2), names)
+    return bases
+
+
+def _call_sites(source, relative, bases):
+    """CallSites for the URL literals in one service file"""
+    masked = mask_source(source, strings=False)
+    definitions = list(_BASE_DEFINITION.finditer(masked))
+    names = {m.group(1): m.group(2) for m in definitions}
+    owners = _ClassIndex(masked)
+    literals = []
+    for m in _STRING_LITERAL.finditer(masked):
+        first = _INTERPOLATION.match(m.group(), 1)
+        if first is None or not _BASE_NAME.match(first.group(1) or first.group(2)):
+            continue
+        # A base URL built on another one isn't a request
+        if any(d.start(2) <= m.start() < d.end(2) for d in definitions):
+            continue
+        literals.append(m)
+    if not literals:
+        return []
+
+    sites = []
+    line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+    frames = enclosing_calls(source, [m.start() for m in literals], mask_source(source))
+    limits = [m.start() for m in literals[1:]] + [len(masked)]
+    for m, limit, (position, function, callees) in zip(literals, limits, frames):
+        first = _INTERPOLATION.match(m.group(), 1)
+        base = _resolve(f"'{first.group(0)}'", names, bases) or ''
+        rest = _literal_text(m.group())[first.end() - 1:].split('?', 1)[0]
+        # '$baseUrl/$endpoint' could be any URL
+        if not _INTERPOLATION.sub('', rest).strip('/'):
+            continue
+        template = (base + _INTERPOLATION.sub('{}', rest)).rstrip('/')
+        verb = _verb(masked, m.end(), min(limit, m.end() + 4000), callees)
+        sites.append(CallSite(verb, template,
+                              owners.at(position), function,
+                              relative, bisect.bisect_right(line_starts, position)))
+    return sites
+
+
+def _verb(masked, end, limit, callees):
+    """HTTP method a URL literal is used with: the call around it, else the next request made before limit"""
+    for callee in callees:
+        if callee and callee.rsplit('.', 1)[-1] in HTTP_VERBS:
+            return callee.rsplit('.', 1)[-1].upper()
+    m = _VERB_CALL.search(masked, end, limit)
+    if m is None:
+        return None
+    return (m.group(1) or m.group(2)).upper()
+
+
+def build_report(endpoints, totals, index=None):
+    """JSON-ready report: totals, then one entry per endpoint with its call sites"""
+    rows = []
+    for (verb, path), stats in endpoints.items():
+        row = {'method': verb, 'endpoint': path, **stats.summary()}
+        if index is not None:
+            sites = index.lookup(verb, path)
+            row['call_sites'] = [{'method': site.method, 'file': site.file, 'line': site.line}
+                                 for site in sites]
+            row['screens'] = sorted({screen for site in sites for screen in index.screens.get(site.method, ())})
+        rows.append(row)
+    return {'totals': totals, 'endpoints': rows}
+
+
+SORT_KEYS = {
+    'p95': lambda row: row['p95_ms'] or 0,
+    'p99': lambda row: row['p99_ms'] or 0,
+    'requests': lambda row: row['requests'],
+    'errors': lambda row: row['error_rate'],
+    'misses': lambda row: row['cache_miss_rate'] or 0,
+    'time': lambda row: (row['mean_ms'] or 0) * row['requests'],
+}
+
+
+def _percent(rate):
+    return '    -' if rate is None else f"{rate * 100:4.0f}%"
+
+
+def _ms(value):
+    return '     -' if value is None else f"{value:6.0f}"
+
+
+def format_report(report, sort='p95', top=25):
+    """The endpoint table, slowest (by the sort key) first, then where the top endpoints are called from"""
+    totals = report['totals']
+    rows = sorted(report['endpoints'], key=SORT_KEYS[sort], reverse=True)[:top]
+    lines = [f"📊 {totals['requests']:,} requests ({totals['log_lines']:,} console lines skipped), "
+             f"{len(report['endpoints'])} endpoints"]
+    if totals['pooled']:
+        lines.append(f"⚠️  {totals['pooled']:,} requests to endpoints past --max-endpoints "
+                     f"pooled as {OTHER_ENDPOINT[1]}")
+    lines.append("")
+    lines.append(f"{'METHOD':<7} {'ENDPOINT':<44} {'REQS':>7} {'P50':>6} {'P95':>6} {'P99':>6} "
+                 f"{'5XX':>5} {'4XX':>5} {'MISS':>5} {'MEM':>5}")
+    for row in rows:
+        endpoint = row['endpoint'] if len(row['endpoint']) <= 44 else row['endpoint'][:41] + '...'
+        memory = '    -' if row['memory_max_mb'] is None else f"{row['memory_max_mb']:5.0f}"
+        lines.append(f"{row['method']:<7} {endpoint:<44} {row['requests']:>7,} {_ms(row['p50_ms'])} "
+                     f"{_ms(row['p95_ms'])} {_ms(row['p99_ms'])} {_percent(row['error_rate'])} "
+                     f"{_percent(row['client_error_rate'])} {_percent(row['cache_miss_rate'])} {memory}")
+    lines.append("")
+    lines.append("Times in ms, within 1%; MEM is the highest maxMemoryUsed in MB.")
+
+    if rows and 'call_sites' in rows[0]:
+        lines.append("")
+        lines.append("📍 Called from:")
+        for row in rows:
+            lines.append(f"   {row['method']} {row['endpoint']}")
+            if not row['call_sites']:
+                lines.append("      (no matching URL in the Dart services)")
+            for site in row['call_sites']:
+                lines.append(f"      {site['method']}  {site['file']}:{site['line']}")
+            for screen in row['screens']:
+                lines.append(f"         ↳ {screen}")
+    return '\n'.join(lines)
+
+
+def command_report(args):
+    """Aggregate an export and print (and optionally save) the endpoint report"""
+    started = time.perf_counter()
+    try:
+        endpoints, totals = analyze(iter_records(args.log), args.max_endpoints)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    index = None if args.no_call_sites else CallSiteIndex.from_tree(args.project)
+    report = build_report(endpoints, totals, index)
+    print(format_report(report, args.sort, args.top))
+    if args.json:
+        atomic_write(args.json, json.dumps(report, indent=1, ensure_ascii=False).encode('utf-8'))
+        print(f"\n💾 Full report written to {args.json}")
+    print(f"⏱️  {totals['records']:,} records in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+def command_call_sites(args):
+    """List the API URLs the Dart services build, by service method"""
+    index = CallSiteIndex.from_tree(args.project)
+    for site in sorted(index.sites, key=lambda site: (site.template, site.verb or '')):
+        print(f"{site.verb or '*':<7} {site.template:<44} {site.method}  {site.file}:{site.line}")
+        for screen in index.screens.get(site.method, ()):
+            print(f"{'':52} ↳ {screen}")
+    print(f"\n📍 {len(index.sites)} URLs in the services, "
+          f"{sum(len(files) for files in index.screens.values())} screen call sites", file=sys.stderr)
+    return 0
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Analyze Vercel request log exports per API endpoint")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    report = subcommands.add_parser("report", help="latency, error and cache-miss figures per endpoint")
+    report.add_argument("log", help="Vercel log export (JSON array or JSON Lines), e.g. 'logs_result (3).json'")
+    report.add_argument("--sort", choices=sorted(SORT_KEYS), default="p95",
+                        help="rank endpoints by this (time = total time spent; default: p95)")
+    report.add_argument("--top", type=int, default=25, help="endpoints to show (default: 25)")
+    report.add_argument("--json", metavar="FILE", help="also write every endpoint's figures as JSON")
+    report.add_argument("--max-endpoints", type=int, default=MAX_ENDPOINTS,
+                        help=f"endpoints tracked separately before pooling the rest (default: {MAX_ENDPOINTS})")
+    report.add_argument("--project", default=".", help="Flutter project to map call sites in (default: .)")
+    report.add_argument("--no-call-sites", action="store_true", help="skip mapping endpoints to Dart code")
+    report.set_defaults(handler=command_report)
+
+    call_sites = subcommands.add_parser("call-sites", help="list the API URLs the Dart services build")
+    call_sites.add_argument("--project", default=".", help="Flutter project to scan (default: .)")
+    call_sites.set_defaults(handler=command_call_sites)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(run_cli(main))